@@ -13,29 +13,87 @@ def get_module_version():
     return __version__
 
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
-from xml.etree import ElementTree
+import copyreg
+import functools
+import itertools
+import operator
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from xml.etree.ElementTree import Element
 
 from typing_extensions import Literal  # for python3.7 compatibility
 
+from alto.backends import Backend, parse_xml_file, parse_xml_string
+
+if TYPE_CHECKING:
+    from alto.cache import CacheKey
+    from alto.columns import ConfidenceStats, StringColumns
+    from alto.interning import InternTable
+    from alto.spatial import GridIndex
+    from alto.stats import ParseStats
+    from alto.writer import PathOrFile
+
 _MAX_PRINT_CHILDREN = 50
 _Namespace = "{http://www.loc.gov/standards/alto/ns-v3#}"
+# Elements and attributes read by this package are the same in all these versions of alto.
+_NAMESPACES: Tuple[str, ...] = (
+    "{http://www.loc.gov/standards/alto/ns-v2#}",
+    _Namespace,
+    "{http://www.loc.gov/standards/alto/ns-v4#}",
+)
+
+
+class _TagSet:
+    def __init__(self, namespace: str) -> None:
+        self.DESCRIPTION = f"{namespace}Description"
+        self.LAYOUT = f"{namespace}Layout"
+        self.PAGE = f"{namespace}Page"
+        self.TEXT_BLOCK = f"{namespace}TextBlock"
+        self.TEXT_LINE = f"{namespace}TextLine"
+        self.String = f"{namespace}String"
+        self.SP = f"{namespace}SP"
+        self.SOURCE_IMAGE_INFORMATION = f"{namespace}sourceImageInformation"
+        self.COMPOSED_BLOCK = f"{namespace}ComposedBlock"
+        self.PRINTSPACE = f"{namespace}PrintSpace"
+        self.FILENAME = f"{namespace}fileName"
+
+
+_TAG_SETS: Dict[str, _TagSet] = {namespace: _TagSet(namespace) for namespace in _NAMESPACES}
+_Tags = _TAG_SETS[_Namespace]
+
+
+def _namespace_of(tag: str) -> str:
+    return tag[: tag.find("}") + 1]
+
 
+def _in_namespace(tag: str, namespace: str) -> str:
+    return namespace + tag[tag.find("}") + 1 :]
 
-class _Tags:
-    DESCRIPTION = f"{_Namespace}Description"
-    LAYOUT = f"{_Namespace}Layout"
-    PAGE = f"{_Namespace}Page"
-    TEXT_BLOCK = f"{_Namespace}TextBlock"
-    TEXT_LINE = f"{_Namespace}TextLine"
-    String = f"{_Namespace}String"
-    SP = f"{_Namespace}SP"
-    SOURCE_IMAGE_INFORMATION = f"{_Namespace}sourceImageInformation"
-    COMPOSED_BLOCK = f"{_Namespace}ComposedBlock"
-    PRINTSPACE = f"{_Namespace}PrintSpace"
-    FILENAME = f"{_Namespace}fileName"
+
+def _tags_of(tag: str) -> _TagSet:
+    # Tags in the namespace of an element, alto v3 ones if the namespace is not supported, so that
+    # elements of unknown namespaces fail with the usual error messages.
+    return _TAG_SETS.get(_namespace_of(tag), _Tags)
 
 
 class _Attrs:
@@ -55,6 +113,17 @@ class _Attrs:
 
 T2 = TypeVar("T2")
 GroupLevel = Union[Literal['TextLine'], Literal['TextBlock'], Literal['ComposedBlock']]
+SpatialLevel = Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]
+WordOrder = Union[Literal['document'], Literal['geometric']]
+ConfidenceLevel = Union[Literal['Page'], Literal['ComposedBlock'], Literal['TextBlock'], Literal['TextLine']]
+Level = Union[
+    Literal['Page'],
+    Literal['PrintSpace'],
+    Literal['ComposedBlock'],
+    Literal['TextBlock'],
+    Literal['TextLine'],
+    Literal['String'],
+]
 
 
 def _check_type(candidate: Any, type_: Type[T2]) -> T2:
@@ -106,6 +175,52 @@ def _get_attr(element: Element, attr_name: str, type_: Type[T]) -> T:
         )
 
 
+def _get_cache(node: Any) -> Dict[Any, Any]:
+    # nodes declaring a _cache slot get their cache dict on first use, so that building nodes costs nothing more
+    try:
+        return node._cache
+    except AttributeError:
+        cache: Dict[Any, Any] = {}
+        node._cache = cache
+        return cache
+
+
+def _clear_cache(node: Any) -> None:
+    try:
+        del node._cache
+    except AttributeError:
+        pass
+
+
+M = TypeVar("M", bound=Callable[[Any], Any])
+
+
+def _memoized(method: M) -> M:
+    # Memoizes methods of nodes declaring a _cache slot, see `invalidate_cache`, by their arguments. Lists are
+    # kept as tuples and each call returns a new list, so that callers cannot modify the cache. Memoized methods
+    # build their result from walks of the descendants of the node, rather than from memoized methods of the
+    # descendants, so that only the node that was asked keeps a result.
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        cache = _get_cache(self)
+        key = (name, *args, *sorted(kwargs.items())) if args or kwargs else name
+        try:
+            res = cache[key]
+        except KeyError:
+            res = method(self, *args, **kwargs)
+            cache[key] = tuple(res) if isinstance(res, list) else res
+            return res
+        return list(res) if isinstance(res, tuple) else res
+
+    return cast(M, wrapper)
+
+
+def _line_words(line: "TextLine") -> List[str]:
+    return [string.content for string in line.strings if isinstance(string, String)]
+
+
 def _assert_name_is(name: str, expected: str) -> None:
     if name != expected:
         raise ValueError(f"Error when parsing XML: Expecting tag name {expected}, got tag name {name}")
@@ -113,18 +228,23 @@ def _assert_name_is(name: str, expected: str) -> None:
 
 @dataclass
 class Description:
+    __slots__ = ("file_name",)
+
     file_name: Optional[str]
 
     @classmethod
     def from_xml(cls, element: Element) -> "Description":
+        tags = _tags_of(element.tag)
         children = _extract_unique_child_name_to_child(element)
-        source = _get_tag(element.tag, children, _Tags.SOURCE_IMAGE_INFORMATION)
-        file_name = _get_tag(source.tag, _extract_unique_child_name_to_child(source), _Tags.FILENAME)
+        source = _get_tag(element.tag, children, tags.SOURCE_IMAGE_INFORMATION)
+        file_name = _get_tag(source.tag, _extract_unique_child_name_to_child(source), tags.FILENAME)
         return cls(file_name.text)
 
 
 @dataclass
 class Alternative:
+    __slots__ = ("content",)
+
     content: str
 
     @classmethod
@@ -134,6 +254,8 @@ class Alternative:
 
 @dataclass
 class String:
+    __slots__ = ("id", "height", "width", "hpos", "vpos", "content", "confidence", "alternatives")
+
     id: str
     height: float
     width: float
@@ -145,43 +267,145 @@ class String:
 
     @classmethod
     def from_xml(cls, element: Element) -> "String":
-        return cls(
-            id=_get_attr(element, _Attrs.ID, str),
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-            content=_get_attr(element, _Attrs.CONTENT, str),
-            confidence=_get_attr(element, _Attrs.WC, float),
-            alternatives=[Alternative.from_xml(child) for child in element],
-        )
+        return _decoders_of(element.tag)[cls](element)
 
 
 @dataclass
 class SP:
+    __slots__ = ("width", "hpos", "vpos")
+
     width: float
     hpos: float
     vpos: float
 
     @classmethod
     def from_xml(cls, element: Element) -> "SP":
-        return cls(
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-        )
+        return _decoders_of(element.tag)[cls](element)
 
 
 def _load_string_or_sp(element: Element) -> Union[String, SP]:
-    if element.tag == _Tags.String:
+    tags = _tags_of(element.tag)
+    if element.tag == tags.String:
         return String.from_xml(element)
-    if element.tag == _Tags.SP:
+    if element.tag == tags.SP:
         return SP.from_xml(element)
-    raise ValueError(f"Error in when parsing XML: expecting tag {_Tags.String} or {_Tags.SP}, got {element.tag}")
+    raise ValueError(f"Error in when parsing XML: expecting tag {tags.String} or {tags.SP}, got {element.tag}")
+
+
+def _iter_path(node: Any, path: Tuple[Callable[[Any], Any], ...], with_ancestors: bool) -> Iterator[Any]:
+    # Lazily walks down the hierarchy along getters of children, chaining iterators rather than building lists.
+    elements: Iterator[Any]
+    if not with_ancestors:
+        elements = iter(path[0](node))
+        for getter in path[1:]:
+            elements = itertools.chain.from_iterable(map(getter, elements))
+        return elements
+    elements = ((element, ()) for element in path[0](node))
+    for getter in path[1:]:
+        elements = _iter_children_with_ancestors(elements, getter)
+    return elements
+
+
+def _iter_children_with_ancestors(
+    elements: Iterator[Tuple[Any, Tuple[Any, ...]]], getter: Callable[[Any], Any]
+) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+    for element, ancestors in elements:
+        child_ancestors = (*ancestors, element)
+        for child in getter(element):
+            yield child, child_ancestors
+
+
+def _getters(*names: str) -> Tuple[Callable[[Any], Any], ...]:
+    return tuple(operator.attrgetter(name) for name in names)
+
+
+class _LineIteration:
+    # Generators over the descendants of nodes containing text lines, along the attributes of _PATH.
+    __slots__ = ()
+    _PATH: ClassVar[Tuple[Callable[[Any], Any], ...]] = ()
+
+    def iter_lines(self, with_ancestors: bool = False) -> Iterator[Any]:
+        """
+        Iterates over text lines in document order, without building lists.
+
+        Args:
+            with_ancestors (bool): if True, yields (line, ancestors) pairs, ancestors being the tuple of the nodes
+                between this node and the line, from the outermost, such as (page, print_space, composed_block,
+                text_block) for a document
+
+        Returns:
+            Iterator[Union[TextLine, Tuple[TextLine, Tuple[Any, ...]]]]: text lines, with their ancestors if required
+        """
+        return _iter_path(self, self._PATH[:-1], with_ancestors)
+
+    def iter_strings(self, with_ancestors: bool = False) -> Iterator[Any]:
+        """
+        Iterates over strings in document order, leaving out SP elements, without building lists.
+
+        Args:
+            with_ancestors (bool): if True, yields (string, ancestors) pairs, see `iter_lines`
+
+        Returns:
+            Iterator[Union[String, Tuple[String, Tuple[Any, ...]]]]: strings, with their ancestors if required
+        """
+        if with_ancestors:
+            return (item for item in _iter_path(self, self._PATH, True) if isinstance(item[0], String))
+        return (string for string in _iter_path(self, self._PATH, False) if isinstance(string, String))
+
+    def iter_words(self, with_ancestors: bool = False) -> Iterator[Any]:
+        """
+        Iterates over the contents of strings in document order, as `extract_words` but without building lists.
+
+        Args:
+            with_ancestors (bool): if True, yields (word, ancestors) pairs, the text line of the word being the
+                last ancestor, see `iter_lines`
+
+        Returns:
+            Iterator[Union[str, Tuple[str, Tuple[Any, ...]]]]: words, with their ancestors if required
+        """
+        if with_ancestors:
+            return ((string.content, ancestors) for string, ancestors in self.iter_strings(True))
+        return (string.content for string in self.iter_strings())
+
+
+class _TextBlockIteration(_LineIteration):
+    __slots__ = ()
+
+    def iter_text_blocks(self, with_ancestors: bool = False) -> Iterator[Any]:
+        """
+        Iterates over text blocks in document order, without building lists.
+
+        Args:
+            with_ancestors (bool): if True, yields (block, ancestors) pairs, see `iter_lines`
+
+        Returns:
+            Iterator[Union[TextBlock, Tuple[TextBlock, Tuple[Any, ...]]]]: text blocks, with their ancestors if
+                required
+        """
+        return _iter_path(self, self._PATH[:-2], with_ancestors)
+
+
+class _ComposedBlockIteration(_TextBlockIteration):
+    __slots__ = ()
+
+    def iter_composed_blocks(self, with_ancestors: bool = False) -> Iterator[Any]:
+        """
+        Iterates over composed blocks in document order, without building lists.
+
+        Args:
+            with_ancestors (bool): if True, yields (block, ancestors) pairs, see `iter_lines`
+
+        Returns:
+            Iterator[Union[ComposedBlock, Tuple[ComposedBlock, Tuple[Any, ...]]]]: composed blocks, with their
+                ancestors if required
+        """
+        return _iter_path(self, self._PATH[:-3], with_ancestors)
 
 
 @dataclass
 class TextLine:
+    __slots__ = ("id", "height", "width", "hpos", "vpos", "_cache", "strings")
+
     id: str
     height: float
     width: float
@@ -191,16 +415,10 @@ class TextLine:
 
     @classmethod
     def from_xml(cls, element: Element) -> "TextLine":
-        _assert_name_is(element.tag, _Tags.TEXT_LINE)
-        return cls(
-            id=_get_attr(element, _Attrs.ID, str),
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-            strings=[_load_string_or_sp(child) for child in element],
-        )
+        _assert_name_is(element.tag, _tags_of(element.tag).TEXT_LINE)
+        return _decoders_of(element.tag)[cls](element)
 
+    @_memoized
     def __hash__(self) -> int:
         return hash(
             (
@@ -208,24 +426,38 @@ class TextLine:
                 self.width,
                 self.hpos,
                 self.height,
-                tuple(self.extract_words()),
+                tuple(_line_words(self)),
             )
         )
 
+    @_memoized
     def extract_words(self) -> List[str]:
         """
         Extracts all parsed words regardless of their positions.
 
+        The result is computed once, each call returns a new list.
 
         Returns:
             List[str]: List of words extracted from file
         """
 
-        return [str_.content for str_ in self.strings if isinstance(str_, String)]
+        return _line_words(self)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results and hash, to be called after modifying the line or its strings.
+
+        Caches of the ancestors of the line are not dropped, call `invalidate_cache` on the highest node whose
+        results may have changed, such as the document.
+        """
+        _clear_cache(self)
 
 
 @dataclass
-class TextBlock:
+class TextBlock(_LineIteration):
+    __slots__ = ("id", "height", "width", "hpos", "vpos", "_cache", "text_lines")
+    _PATH = _getters('text_lines', 'strings')
+
     id: Optional[str]
     height: float
     width: float
@@ -235,33 +467,43 @@ class TextBlock:
 
     @classmethod
     def from_xml(cls, element: Element) -> "TextBlock":
-        _assert_name_is(element.tag, _Tags.TEXT_BLOCK)
-        return cls(
-            id=_get_attr(element, _Attrs.ID, str),
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-            text_lines=[TextLine.from_xml(child) for child in element],
-        )
+        _assert_name_is(element.tag, _tags_of(element.tag).TEXT_BLOCK)
+        return _decoders_of(element.tag)[cls](element)
 
+    @_memoized
     def extract_string_lines(self) -> List[str]:
-        return [" ".join(line.extract_words()) for line in self.text_lines]
+        return [" ".join(_line_words(line)) for line in self.text_lines]
 
+    @_memoized
     def extract_words(self) -> List[str]:
         """
         Extracts all parsed words regardless of their positions.
 
+        The result is computed once, each call returns a new list.
 
         Returns:
             List[str]: List of words extracted from file
         """
 
-        return [str_ for line in self.text_lines for str_ in line.extract_words()]
+        return list(self.iter_words())
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results of the block and its descendants, to be called after modifying them.
+
+        Caches of the ancestors of the block are not dropped, call `invalidate_cache` on the highest node whose
+        results may have changed, such as the document.
+        """
+        _clear_cache(self)
+        for line in self.text_lines:
+            line.invalidate_cache()
 
 
 @dataclass
-class ComposedBlock:
+class ComposedBlock(_TextBlockIteration):
+    __slots__ = ("id", "height", "width", "hpos", "vpos", "_cache", "text_blocks")
+    _PATH = _getters('text_blocks', 'text_lines', 'strings')
+
     id: str
     height: float
     width: float
@@ -271,30 +513,39 @@ class ComposedBlock:
 
     @classmethod
     def from_xml(cls, element: Element) -> "ComposedBlock":
-        _assert_name_is(element.tag, _Tags.COMPOSED_BLOCK)
-        return cls(
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-            id=_get_attr(element, _Attrs.ID, str),
-            text_blocks=[TextBlock.from_xml(child) for child in element],
-        )
+        _assert_name_is(element.tag, _tags_of(element.tag).COMPOSED_BLOCK)
+        return _decoders_of(element.tag)[cls](element)
 
+    @_memoized
     def extract_words(self) -> List[str]:
         """
         Extracts all parsed words regardless of their positions.
 
+        The result is computed once, each call returns a new list.
 
         Returns:
             List[str]: List of words extracted from file
         """
 
-        return [str_ for block in self.text_blocks for str_ in block.extract_words()]
+        return list(self.iter_words())
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results of the block and its descendants, to be called after modifying them.
+
+        Caches of the ancestors of the block are not dropped, call `invalidate_cache` on the highest node whose
+        results may have changed, such as the document.
+        """
+        _clear_cache(self)
+        for block in self.text_blocks:
+            block.invalidate_cache()
 
 
 @dataclass
-class PrintSpace:
+class PrintSpace(_ComposedBlockIteration):
+    __slots__ = ("height", "width", "hpos", "vpos", "pc", "composed_blocks", "_cache")
+    _PATH = _getters('composed_blocks', 'text_blocks', 'text_lines', 'strings')
+
     height: float
     width: float
     hpos: float
@@ -304,30 +555,40 @@ class PrintSpace:
 
     @classmethod
     def from_xml(cls, element: Element) -> "PrintSpace":
-        _assert_name_is(element.tag, _Tags.PRINTSPACE)
-        return cls(
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            hpos=_get_attr(element, _Attrs.HPOS, float),
-            vpos=_get_attr(element, _Attrs.VPOS, float),
-            pc=_get_attr(element, _Attrs.PC, float) if _Attrs.PC in element.attrib else None,
-            composed_blocks=[ComposedBlock.from_xml(child) for child in element],
-        )
+        _assert_name_is(element.tag, _tags_of(element.tag).PRINTSPACE)
+        return _decoders_of(element.tag)[cls](element)
 
+    @_memoized
     def extract_words(self) -> List[str]:
         """
         Extracts all parsed words regardless of their positions.
 
+        The result is computed once, each call returns a new list.
 
         Returns:
             List[str]: List of words extracted from file
         """
 
-        return [str_ for block in self.composed_blocks for str_ in block.extract_words()]
+        return list(self.iter_words())
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results of the print space and its descendants, to be called after modifying
+        them.
+
+        Caches of the page and document are not dropped, call `invalidate_cache` on the highest node whose
+        results may have changed, such as the document.
+        """
+        _clear_cache(self)
+        for block in self.composed_blocks:
+            block.invalidate_cache()
 
 
 @dataclass
-class Page:
+class Page(_ComposedBlockIteration):
+    __slots__ = ("id", "height", "width", "physical_img_nr", "printed_img_nr", "print_spaces", "_cache")
+    _PATH = _getters('print_spaces', 'composed_blocks', 'text_blocks', 'text_lines', 'strings')
+
     id: str
     height: float
     width: float
@@ -337,24 +598,18 @@ class Page:
 
     @classmethod
     def from_xml(cls, element: Element) -> "Page":
-        _assert_name_is(element.tag, _Tags.PAGE)
-        return cls(
-            id=_get_attr(element, _Attrs.ID, str),
-            height=_get_attr(element, _Attrs.HEIGHT, float),
-            width=_get_attr(element, _Attrs.WIDTH, float),
-            physical_img_nr=_get_attr(element, _Attrs.PHYSICAL_IMG_NR, int),
-            printed_img_nr=_get_attr(element, _Attrs.PRINTED_IMG_NR, int)
-            if _Attrs.PRINTED_IMG_NR in element.attrib
-            else None,
-            print_spaces=[PrintSpace.from_xml(child) for child in element],
-        )
+        _assert_name_is(element.tag, _tags_of(element.tag).PAGE)
+        return _decoders_of(element.tag)[cls](element)
 
+    @_memoized
     def extract_blocks(self) -> List[ComposedBlock]:
         return [block for ps in self.print_spaces for block in ps.composed_blocks]
 
+    @_memoized
     def extract_text_blocks(self) -> List[TextBlock]:
         return [tb for ps in self.print_spaces for block in ps.composed_blocks for tb in block.text_blocks]
 
+    @_memoized
     def extract_strings(self) -> List[String]:
         return [
             string
@@ -366,6 +621,7 @@ class Page:
             if isinstance(string, String)
         ]
 
+    @_memoized
     def extract_lines(self) -> List[TextLine]:
         return [
             line
@@ -375,29 +631,237 @@ class Page:
             for line in tb.text_lines
         ]
 
-    def extract_words(self) -> List[str]:
+    @_memoized
+    def extract_words(self, order: WordOrder = 'document') -> List[str]:
         """
-        Extracts all parsed words regardless of their positions.
+        Extracts all parsed words, in document order or in reading order.
 
+        The result is computed once, each call returns a new list.
+
+        Args:
+            order (Union[Literal['document'], Literal['geometric']]): 'document' keeps the order of the xml
+                document, 'geometric' the reading order reconstructed from positions, see `reading_order`
 
         Returns:
             List[str]: List of words extracted from file
         """
+        if order == 'geometric':
+            from alto.reading_order import page_reading_order
 
-        return [str_ for ps in self.print_spaces for str_ in ps.extract_words()]
+            return [string.content for string in page_reading_order(self)]
+        if order != 'document':
+            raise NotImplementedError(f'Not implemented for value {order}')
+        return list(self.iter_words())
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results and spatial indexes of the page and its descendants, to be called
+        after modifying them.
+
+        The cache of the document is not dropped, call `Alto.invalidate_cache` if its results may have changed.
+        """
+        _clear_cache(self)
+        for ps in self.print_spaces:
+            ps.invalidate_cache()
+
+    def to_columns(self) -> "StringColumns":
+        """
+        Builds a columnar view of the strings of the page, requires numpy.
+
+        Returns:
+            StringColumns: one array per String attribute, see `alto.columns.StringColumns`
+        """
+        from alto.columns import build_string_columns
+
+        return build_string_columns([self])
+
+    @_memoized
+    def reading_order(self, level: SpatialLevel = 'String') -> List[Any]:
+        """Elements of the page in reading order, reconstructed from their positions, requires numpy.
+
+        Multi-column pages are read column by column, whatever the order of elements in the document, see
+        `alto.reading_order.page_reading_order`. The result is computed once, each call returns a new list.
+
+        Args:
+            level (Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]): element level
+
+        Returns:
+            List[Union[String, TextLine, TextBlock]]: elements of the page, in reading order
+        """
+        from alto.reading_order import page_reading_order
+
+        return page_reading_order(self, level)
+
+    def _spatial_index(self, level: SpatialLevel) -> "GridIndex":
+        cache = _get_cache(self)
+        key = ('spatial_index', level)
+        if key not in cache:
+            from alto.spatial import GridIndex
+
+            elements: Union[List[String], List[TextLine], List[TextBlock]]
+            if level == 'String':
+                elements = list(self.iter_strings())
+            elif level == 'TextLine':
+                elements = list(self.iter_lines())
+            elif level == 'TextBlock':
+                elements = list(self.iter_text_blocks())
+            else:
+                raise NotImplementedError(f'Not implemented for value {level}')
+            boxes = [(elt.hpos, elt.vpos, elt.hpos + elt.width, elt.vpos + elt.height) for elt in elements]
+            cache[key] = GridIndex(elements, boxes)
+        return cache[key]
+
+    def query_region(
+        self, x0: float, y0: float, x1: float, y1: float, level: SpatialLevel = 'String', contained: bool = False
+    ) -> List[Any]:
+        """Extracts elements of the required level whose bounding box intersects a region of the page.
+
+        A spatial index is built for each level on first query and reused afterwards, call
+        `invalidate_cache` after modifying elements of the page.
+
+        Args:
+            x0 (float): left of the region
+            y0 (float): top of the region
+            x1 (float): right of the region
+            y1 (float): bottom of the region
+            level (Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]): element level
+            contained (bool): if True, only elements lying entirely inside the region are returned
+
+        Returns:
+            List[Union[String, TextLine, TextBlock]]: matching elements, in document order
+        """
+        return self._spatial_index(level).query(x0, y0, x1, y1, contained)
+
+    def nearest(self, x: float, y: float, level: SpatialLevel = 'String') -> Optional[Any]:
+        """Finds the element of the required level whose bounding box is the closest to a point.
+
+        Args:
+            x (float): horizontal position of the point
+            y (float): vertical position of the point
+            level (Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]): element level
+
+        Returns:
+            Optional[Union[String, TextLine, TextBlock]]: closest element, None if the page has no such element
+        """
+        return self._spatial_index(level).nearest(x, y)
+
+    def write_xml(self, file_: IO[str], standalone: bool = True) -> None:
+        """
+        Writes the page as an alto v3 Page element, see `alto.writer.write_page`.
+
+        Args:
+            file_ (IO[str]): text file to write to
+            standalone (bool): if True, the alto namespace is declared on the Page element
+        """
+        from alto.writer import write_page
+
+        write_page(self, file_, standalone)
+
+
+class LazyPages(Sequence):
+    """
+    Sequence of pages built from their xml elements on first access.
+
+    Built pages are kept and their xml elements are released. Errors in the xml of a page are
+    raised when the page is first accessed.
+
+    Parameters
+    ----------
+    elements: List[Element]
+        Page elements of the document
+    """
+
+    __slots__ = ("_elements", "_pages")
+
+    def __init__(self, elements: List[Element]) -> None:
+        self._elements: List[Optional[Element]] = list(elements)
+        self._pages: List[Optional[Page]] = [None] * len(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def _load(self, index: int) -> Page:
+        page = self._pages[index]
+        if page is None:
+            page = self._pages[index] = Page.from_xml(cast(Element, self._elements[index]))
+            self._elements[index] = None
+        return page
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(len(self))[index]]
+        return self._load(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Page]:
+        return (self._load(i) for i in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (list, LazyPages)):
+            return NotImplemented
+        return len(self) == len(other) and all(page == other_page for page, other_page in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"LazyPages({self.nb_loaded}/{len(self)} pages loaded)"
+
+    def __reduce__(self) -> Tuple[Type, Tuple]:
+        return list, (list(self),)
+
+    @property
+    def nb_loaded(self) -> int:
+        return sum(page is not None for page in self._pages)
+
+    def loaded_pages(self) -> List[Page]:
+        """Pages already built, in document order."""
+        return [page for page in self._pages if page is not None]
+
+
+def _loaded_pages(pages: Iterable[Page]) -> Iterable[Page]:
+    return pages.loaded_pages() if isinstance(pages, LazyPages) else pages
 
 
 @dataclass
 class Layout:
+    __slots__ = ("pages",)
+
     pages: List[Page]
 
     @classmethod
-    def from_xml(cls, element: Element) -> "Layout":
+    def from_xml(cls, element: Element, lazy: bool = False) -> "Layout":
+        if lazy:
+            return cls(pages=cast(List[Page], LazyPages(list(element))))
         return cls(pages=[Page.from_xml(child) for child in element])
 
 
+def _filter_strings(line: TextLine, min_confidence: float) -> Optional[TextLine]:
+    if all(not isinstance(string, String) or string.confidence >= min_confidence for string in line.strings):
+        return line
+    strings: List[Union[String, SP]] = []
+    for string in line.strings:
+        if isinstance(string, String):
+            if string.confidence >= min_confidence:
+                strings.append(string)
+        elif strings and isinstance(strings[-1], String):
+            strings.append(string)  # SP are kept between remaining strings only
+    if strings and isinstance(strings[-1], SP):
+        strings.pop()
+    if not strings:
+        return None
+    return TextLine(line.id, line.height, line.width, line.hpos, line.vpos, strings)
+
+
+def _filter_children(node: Any, field: str, filter_child: Callable[[Any], Any], drop_empty: bool = True) -> Any:
+    # Returns the node itself if none of its children changed, None if it lost all its children and drop_empty.
+    children = getattr(node, field)
+    kept = [new_child for new_child in map(filter_child, children) if new_child is not None]
+    if len(kept) == len(children) and all(new_child is child for new_child, child in zip(kept, children)):
+        return node
+    if not kept and drop_empty:
+        return None
+    return replace(node, **{field: kept})
+
+
 @dataclass
-class Alto:
+class Alto(_ComposedBlockIteration):
     """
     Alto dataclass for manipulating Tesseract output files.
 
@@ -409,19 +873,33 @@ class Alto:
         The "layout" tag of alto xml documents, containing parsed elements
     """
 
+    __slots__ = ("description", "layout", "_cache")
+    _PATH = _getters('layout.pages', 'print_spaces', 'composed_blocks', 'text_blocks', 'text_lines', 'strings')
+
     description: Description
     layout: Layout
 
     @classmethod
-    def from_xml(cls, element: Element) -> "Alto":
+    def from_xml(cls, element: Element, lazy: bool = False) -> "Alto":
+        tags = _tags_of(element.tag)
         children = _extract_unique_child_name_to_child(element)
         return cls(
-            description=Description.from_xml(_get_tag(element.tag, children, _Tags.DESCRIPTION)),
-            layout=Layout.from_xml(_get_tag(element.tag, children, _Tags.LAYOUT)),
+            description=Description.from_xml(_get_tag(element.tag, children, tags.DESCRIPTION)),
+            layout=Layout.from_xml(_get_tag(element.tag, children, tags.LAYOUT), lazy),
         )
 
     @staticmethod
-    def parse_file(filename: str) -> "Alto":
+    def parse_file(
+        filename: str,
+        cache_dir: Optional[str] = None,
+        cache_key: "CacheKey" = 'stat',
+        lazy: bool = False,
+        backend: Backend = 'etree',
+        stats: Optional["ParseStats"] = None,
+        fields: Optional[Collection[str]] = None,
+        level: Level = 'String',
+        intern_table: Optional["InternTable"] = None,
+    ) -> "Alto":
         """
         Alto constructor from xml file.
 
@@ -429,12 +907,82 @@ class Alto:
         ----------
         filename: str
             filename of the file to load
+        cache_dir: Optional[str]
+            if given, directory of an on-disk cache of parsed files, see `alto.cache.parse_file_cached`
+        cache_key: Literal['stat', 'content']
+            how files are identified in the cache, by path, size and modification time or by content hash
+        lazy: bool
+            if True, `layout.pages` is a `LazyPages` sequence building each page on first access
+        backend: Literal['etree', 'lxml', 'expat', 'auto']
+            xml library to use, 'auto' selects the fastest one, 'expat' builds nodes from parser events
+            without building an element tree, see `alto.backends`
+        stats: Optional[ParseStats]
+            if given, filled with timings and counts of the parse, see `alto.stats.ParseStats`
+        fields: Optional[Collection[str]]
+            if given, names of the String fields to read, such as ['content'], the others being left to None,
+            see `alto.projection.from_xml`
+        level: Literal['Page', 'PrintSpace', 'ComposedBlock', 'TextBlock', 'TextLine', 'String']
+            deepest level of the built nodes
+        intern_table: Optional[InternTable]
+            if given, table through which equal attribute values of the built nodes are shared, to save memory
+            when many documents are kept, see `alto.interning.InternTable`
         """
-        tree = ElementTree.parse(filename)
-        return Alto.from_xml(tree.getroot())
+        if intern_table is not None:
+            if (
+                lazy
+                or cache_dir is not None
+                or stats is not None
+                or backend == 'expat'
+                or fields is not None
+                or level != 'String'
+            ):
+                raise ValueError(
+                    "Interning cannot be combined with lazy parsing, a parse cache, parse statistics, projection "
+                    "or the expat backend"
+                )
+            from alto.interning import from_xml as interning_from_xml
+
+            return interning_from_xml(parse_xml_file(filename, backend), intern_table)
+        if fields is not None or level != 'String':
+            if lazy or cache_dir is not None or stats is not None or backend == 'expat':
+                raise ValueError(
+                    "Projection cannot be combined with lazy parsing, a parse cache, parse statistics "
+                    "or the expat backend"
+                )
+            from alto.projection import from_xml
+
+            return from_xml(parse_xml_file(filename, backend), fields, level)
+        if stats is not None:
+            if lazy or cache_dir is not None:
+                raise ValueError("Parse statistics cannot be combined with lazy parsing or a parse cache")
+            from alto.stats import parse_file_with_stats
+
+            return parse_file_with_stats(filename, stats, backend)
+        if cache_dir is not None:
+            if lazy:
+                raise ValueError("Lazy parsing cannot be combined with a parse cache")
+            from alto.cache import parse_file_cached
+
+            parser = functools.partial(Alto.parse_file, backend=backend)
+            return parse_file_cached(filename, cache_dir, cache_key, parser)
+        if backend == 'expat':
+            if lazy:
+                raise ValueError("Lazy parsing cannot be combined with the expat backend")
+            from alto.expat_builder import build_from_file
+
+            return build_from_file(filename)
+        return Alto.from_xml(parse_xml_file(filename, backend), lazy)
 
     @staticmethod
-    def parse(xml_str: str) -> "Alto":
+    def parse(
+        xml_str: str,
+        lazy: bool = False,
+        backend: Backend = 'etree',
+        stats: Optional["ParseStats"] = None,
+        fields: Optional[Collection[str]] = None,
+        level: Level = 'String',
+        intern_table: Optional["InternTable"] = None,
+    ) -> "Alto":
         """
         Alto constructor from xml string.
 
@@ -442,39 +990,99 @@ class Alto:
         ----------
         xml_str: str
             xml alto string
+        lazy: bool
+            if True, `layout.pages` is a `LazyPages` sequence building each page on first access
+        backend: Literal['etree', 'lxml', 'expat', 'auto']
+            xml library to use, 'auto' selects the fastest one, 'expat' builds nodes from parser events
+            without building an element tree, see `alto.backends`
+        stats: Optional[ParseStats]
+            if given, filled with timings and counts of the parse, see `alto.stats.ParseStats`
+        fields: Optional[Collection[str]]
+            if given, names of the String fields to read, such as ['content'], the others being left to None,
+            see `alto.projection.from_xml`
+        level: Literal['Page', 'PrintSpace', 'ComposedBlock', 'TextBlock', 'TextLine', 'String']
+            deepest level of the built nodes
+        intern_table: Optional[InternTable]
+            if given, table through which equal attribute values of the built nodes are shared, to save memory
+            when many documents are kept, see `alto.interning.InternTable`
+        """
+        if intern_table is not None:
+            if lazy or stats is not None or backend == 'expat' or fields is not None or level != 'String':
+                raise ValueError(
+                    "Interning cannot be combined with lazy parsing, parse statistics, projection or the expat backend"
+                )
+            from alto.interning import from_xml as interning_from_xml
+
+            return interning_from_xml(parse_xml_string(xml_str, backend), intern_table)
+        if fields is not None or level != 'String':
+            if lazy or stats is not None or backend == 'expat':
+                raise ValueError(
+                    "Projection cannot be combined with lazy parsing, parse statistics or the expat backend"
+                )
+            from alto.projection import from_xml
+
+            return from_xml(parse_xml_string(xml_str, backend), fields, level)
+        if stats is not None:
+            if lazy:
+                raise ValueError("Parse statistics cannot be combined with lazy parsing")
+            from alto.stats import parse_with_stats
+
+            return parse_with_stats(xml_str, stats, backend)
+        if backend == 'expat':
+            if lazy:
+                raise ValueError("Lazy parsing cannot be combined with the expat backend")
+            from alto.expat_builder import build_from_string
+
+            return build_from_string(xml_str)
+        return Alto.from_xml(parse_xml_string(xml_str, backend), lazy)
+
+    @staticmethod
+    def iter_parse(filename: str, backend: Backend = 'etree') -> Tuple[Description, Iterator[Page]]:
         """
+        Streaming alto constructor from xml file, see `alto.streaming.iter_parse`.
 
-        tree = ElementTree.fromstring(xml_str)
-        return Alto.from_xml(tree)
+        Parameters
+        ----------
+        filename: str
+            filename of the file to load
+        backend: Literal['etree', 'lxml', 'expat', 'auto']
+            xml library to use, see `alto.backends`
+        """
+        return iter_parse(filename, backend)
 
-    def extract_words(self) -> List[str]:
+    @_memoized
+    def extract_words(self, order: WordOrder = 'document') -> List[str]:
         """
-        Extracts all parsed words regardless of their positions.
+        Extracts all parsed words, in document order or in reading order.
+
+        The result is computed once, each call returns a new list.
 
+        Args:
+            order (Union[Literal['document'], Literal['geometric']]): 'document' keeps the order of the xml
+                document, 'geometric' the reading order of each page, see `Page.reading_order`
 
         Returns:
             List[str]: List of words extracted from file
         """
+        if order == 'geometric':
+            from alto.reading_order import page_reading_order
 
-        return [
-            string.content
-            for page in self.layout.pages
-            for ps in page.print_spaces
-            for block in ps.composed_blocks
-            for tb in block.text_blocks
-            for line in tb.text_lines
-            for string in line.strings
-            if isinstance(string, String)
-        ]
+            return [string.content for page in self.layout.pages for string in page_reading_order(page)]
+        if order != 'document':
+            raise NotImplementedError(f'Not implemented for value {order}')
+        return list(self.iter_words())
 
+    @_memoized
     def extract_composed_blocks(self) -> List[ComposedBlock]:
-        return [block for page in self.layout.pages for ps in page.print_spaces for block in ps.composed_blocks]
+        return list(self.iter_composed_blocks())
 
+    @_memoized
     def extract_text_blocks(self) -> List[TextBlock]:
-        return [tb for block in self.extract_composed_blocks() for tb in block.text_blocks]
+        return list(self.iter_text_blocks())
 
+    @_memoized
     def extract_text_lines(self) -> List[TextLine]:
-        return [line for block in self.extract_text_blocks() for line in block.text_lines]
+        return list(self.iter_lines())
 
     def extract_grouped_words(self, group_by: GroupLevel) -> List[List[str]]:
         """Extracts all parsed words grouped at the required level.
@@ -483,21 +1091,442 @@ class Alto:
             group_by (Union[Literal['TextLine'], Literal['TextBlock'], Literal['ComposedBlock']]) : group level
 
         Returns:
-            List[List[str]]: List of list of words in each entity of target level
-        """
-        groups: Union[List[ComposedBlock], List[TextBlock], List[TextLine]]
-        if group_by == 'ComposedBlock':
-            groups = self.extract_composed_blocks()
-        elif group_by == 'TextBlock':
-            groups = self.extract_text_blocks()
-        elif group_by == 'TextLine':
-            groups = self.extract_text_lines()
-        else:
-            raise NotImplementedError(f'Not implemented for value {group_by}')
-        return [[word for word in group.extract_words()] for group in groups]
+            List[List[str]]: List of list of words in each entity of target level, computed once, each call
+            returning new lists.
+        """
+        cache = _get_cache(self)
+        key = ('extract_grouped_words', group_by)
+        if key not in cache:
+            groups: Iterator[Union[ComposedBlock, TextBlock, TextLine]]
+            if group_by == 'ComposedBlock':
+                groups = self.iter_composed_blocks()
+            elif group_by == 'TextBlock':
+                groups = self.iter_text_blocks()
+            elif group_by == 'TextLine':
+                groups = self.iter_lines()
+            else:
+                raise NotImplementedError(f'Not implemented for value {group_by}')
+            cache[key] = tuple(
+                tuple(_line_words(group)) if isinstance(group, TextLine) else tuple(group.iter_words())
+                for group in groups
+            )
+        return [list(words) for words in cache[key]]
 
+    def to_columns(self) -> "StringColumns":
+        """
+        Builds a columnar view of the strings of all pages, requires numpy.
+
+        Returns:
+            StringColumns: one array per String attribute, see `alto.columns.StringColumns`
+        """
+        from alto.columns import build_string_columns
+
+        return build_string_columns(self.layout.pages)
+
+    def confidence_stats(self, level: ConfidenceLevel = 'Page', bins: int = 10) -> "ConfidenceStats":
+        """
+        Computes the count, mean, minimum, maximum and histogram of String confidences of each element of a level,
+        requires numpy, see `alto.columns.confidence_stats`.
+
+        Args:
+            level (Union[Literal['Page'], Literal['ComposedBlock'], Literal['TextBlock'], Literal['TextLine']]):
+                level of the elements the strings are grouped by
+            bins (int): number of bins of the histograms, which split [0, 1] evenly
+
+        Returns:
+            ConfidenceStats: one array per statistic, with an element per element of the level
+        """
+        from alto.columns import confidence_stats
+
+        return confidence_stats(self, level, bins)
+
+    def filter(self, min_confidence: float) -> "Alto":
+        """
+        Keeps the strings whose confidence is at least `min_confidence`, without copying the document.
 
-def parse_file(filename: str) -> Alto:
+        The result shares the String objects, as well as every node none of whose strings was dropped, with
+        this document, so that modifying one modifies the other. Text lines, text blocks and composed blocks
+        left without strings are dropped, SP elements are only kept between remaining strings, and the
+        geometry of nodes is left unchanged.
+
+        Args:
+            min_confidence (float): minimum confidence of the kept strings
+
+        Returns:
+            Alto: filtered view of the document
+        """
+
+        def filter_line(line: TextLine) -> Optional[TextLine]:
+            return _filter_strings(line, min_confidence)
+
+        def filter_block(block: TextBlock) -> Optional[TextBlock]:
+            return _filter_children(block, "text_lines", filter_line)
+
+        def filter_composed_block(block: ComposedBlock) -> Optional[ComposedBlock]:
+            return _filter_children(block, "text_blocks", filter_block)
+
+        def filter_print_space(ps: PrintSpace) -> PrintSpace:
+            return _filter_children(ps, "composed_blocks", filter_composed_block, drop_empty=False)
+
+        def filter_page(page: Page) -> Page:
+            return _filter_children(page, "print_spaces", filter_print_space, drop_empty=False)
+
+        return Alto(self.description, _filter_children(self.layout, "pages", filter_page, drop_empty=False))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the document to nested dicts and lists, as `dataclasses.asdict` but much faster, see `alto.export`.
+
+        Returns:
+            Dict[str, Any]: json compatible representation of the document
+        """
+        from alto.export import to_dict
+
+        return to_dict(self)
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Serializes the document to json, see `to_dict`.
+
+        Args:
+            indent (Optional[int]): indentation of the output, compact if None
+
+        Returns:
+            str: json representation of the document
+        """
+        from alto.export import to_json
+
+        return to_json(self, indent)
+
+    def iter_ndjson(self, level: SpatialLevel = 'String') -> Iterator[str]:
+        """
+        Iterates over the elements of a level as newline terminated json records, with their geometry, content,
+        confidence and the ids of their ancestors, see `alto.export.iter_records`.
+
+        Args:
+            level (Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]): level of the elements
+
+        Returns:
+            Iterator[str]: one json line per element, in document order
+        """
+        from alto.export import iter_ndjson
+
+        return iter_ndjson(self, level)
+
+    def write(self, path_or_file: "PathOrFile") -> None:
+        """
+        Writes the document as alto v3 xml, streaming elements to the file, see `alto.writer.write_alto`.
+
+        Args:
+            path_or_file (Union[str, os.PathLike, IO[str]]): filename of the file to write, or text file to write to
+        """
+        from alto.writer import write_alto
+
+        write_alto(self, path_or_file)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops memoized extraction results of the document and of all its elements, to be called after
+        modifying any of them.
+        """
+        _clear_cache(self)
+        for page in _loaded_pages(self.layout.pages):
+            page.invalidate_cache()
+
+
+class _Field(NamedTuple):
+    name: str
+    attr: str
+    type_: Type
+    optional: bool = False
+
+
+class _NodeSpec(NamedTuple):
+    """
+    Declarative description of how a node class is read from xml.
+
+    `fields` are the attributes of the node, in dataclass field order. If `load_child` is set, the last
+    dataclass field holds the children of the node: `load_child` builds a child and checks its tag, and
+    `child_tags`, if set, lists the tags of the nodes accepted as children.
+    """
+
+    cls: Type
+    tag: str
+    fields: Tuple[_Field, ...]
+    load_child: Optional[Callable[[Element], Any]] = None
+    child_tags: Optional[Tuple[str, ...]] = None
+
+
+_ID = _Field("id", _Attrs.ID, str)
+_HEIGHT = _Field("height", _Attrs.HEIGHT, float)
+_WIDTH = _Field("width", _Attrs.WIDTH, float)
+_HPOS = _Field("hpos", _Attrs.HPOS, float)
+_VPOS = _Field("vpos", _Attrs.VPOS, float)
+# Children come before their parents, so that decoders of children exist when building those of parents.
+_NODE_SPECS = (
+    _NodeSpec(
+        String,
+        _Tags.String,
+        (
+            _ID,
+            _HEIGHT,
+            _WIDTH,
+            _HPOS,
+            _VPOS,
+            _Field("content", _Attrs.CONTENT, str),
+            _Field("confidence", _Attrs.WC, float),
+        ),
+        Alternative.from_xml,
+    ),
+    _NodeSpec(SP, _Tags.SP, (_WIDTH, _HPOS, _VPOS)),
+    _NodeSpec(
+        TextLine, _Tags.TEXT_LINE, (_ID, _HEIGHT, _WIDTH, _HPOS, _VPOS), _load_string_or_sp, (_Tags.String, _Tags.SP)
+    ),
+    _NodeSpec(TextBlock, _Tags.TEXT_BLOCK, (_ID, _HEIGHT, _WIDTH, _HPOS, _VPOS), TextLine.from_xml, (_Tags.TEXT_LINE,)),
+    _NodeSpec(
+        ComposedBlock,
+        _Tags.COMPOSED_BLOCK,
+        (_ID, _HEIGHT, _WIDTH, _HPOS, _VPOS),
+        TextBlock.from_xml,
+        (_Tags.TEXT_BLOCK,),
+    ),
+    _NodeSpec(
+        PrintSpace,
+        _Tags.PRINTSPACE,
+        (_HEIGHT, _WIDTH, _HPOS, _VPOS, _Field("pc", _Attrs.PC, float, optional=True)),
+        ComposedBlock.from_xml,
+        (_Tags.COMPOSED_BLOCK,),
+    ),
+    _NodeSpec(
+        Page,
+        _Tags.PAGE,
+        (
+            _ID,
+            _HEIGHT,
+            _WIDTH,
+            _Field("physical_img_nr", _Attrs.PHYSICAL_IMG_NR, int),
+            _Field("printed_img_nr", _Attrs.PRINTED_IMG_NR, int, optional=True),
+        ),
+        PrintSpace.from_xml,
+        (_Tags.PRINTSPACE,),
+    ),
+)
+
+Decoder = Callable[[Element], Any]
+
+
+class _Projection(NamedTuple):
+    """
+    Parts of the nodes that are not read from xml.
+
+    `skipped_fields` are, for each node class, the fields left to None, or to an empty list for the field holding
+    children. Elements of `skipped_classes` are not built and are left out of the children of their parent.
+    """
+
+    skipped_fields: Dict[Type, FrozenSet[str]]
+    skipped_classes: FrozenSet[Type]
+
+
+_NO_PROJECTION = _Projection({}, frozenset())
+
+
+def _children_field(spec: _NodeSpec) -> str:
+    return list(spec.cls.__dataclass_fields__)[-1]
+
+
+def _build_checked_decoder(
+    spec: _NodeSpec, skipped: FrozenSet[str] = frozenset(), skipped_tags: FrozenSet[str] = frozenset()
+) -> Decoder:
+    load_child = spec.load_child if spec.load_child is None or _children_field(spec) not in skipped else None
+
+    def decode(element: Element) -> Any:
+        values: List[Any] = [
+            (
+                _get_attr(element, field.attr, field.type_)
+                if field.name not in skipped and (not field.optional or field.attr in element.attrib)
+                else None
+            )
+            for field in spec.fields
+        ]
+        if load_child is not None:
+            values.append([load_child(child) for child in element if child.tag not in skipped_tags])
+        elif spec.load_child is not None:
+            values.append([])
+        return spec.cls(*values)
+
+    return decode
+
+
+def _attr_expression(field: _Field, interned: bool = False) -> str:
+    expression = f"a[{field.attr!r}]"
+    if interned:
+        expression = f"intern_{field.type_.__name__}({expression})"
+    elif field.type_ is not str:
+        expression = f"{field.type_.__name__}({expression})"
+    if field.optional:
+        expression = f"({expression} if {field.attr!r} in a else None)"
+    return expression
+
+
+Interners = Dict[Type, Callable[[str], Any]]
+
+
+def _build_decoder(
+    spec: _NodeSpec,
+    decoders_by_tag: Dict[str, Decoder],
+    alto_namespace: str,
+    projection: _Projection = _NO_PROJECTION,
+    interners: Optional[Interners] = None,
+) -> Decoder:
+    # The generated function reads attributes with plain lookups and dispatches children with a single
+    # lookup on their tag, in the namespace of the decoder. A missing attribute or an unexpected child
+    # raises a KeyError, in which case the element is decoded again by the checked decoder, which raises
+    # the usual error messages. Skipped fields and children are not read at all. If interners are given,
+    # raw attribute values are converted by the interner of their type instead, see `alto.interning`.
+    skipped = projection.skipped_fields.get(spec.cls, frozenset())
+    skipped_tags = frozenset(
+        _in_namespace(child_spec.tag, alto_namespace)
+        for child_spec in _NODE_SPECS
+        if child_spec.cls in projection.skipped_classes and child_spec.tag in (spec.child_tags or ())
+    )
+    interned = interners is not None
+    arguments = ["None" if field.name in skipped else _attr_expression(field, interned) for field in spec.fields]
+    if spec.load_child is not None:
+        if _children_field(spec) in skipped:
+            arguments.append("[]")
+        elif spec.child_tags is None:
+            arguments.append("[load_child(child) for child in element] if len(element) else []")
+        elif skipped_tags:
+            arguments.append("[dispatch[child.tag](child) for child in element if child.tag not in skipped_tags]")
+        else:
+            arguments.append("[dispatch[child.tag](child) for child in element]")
+    expected_fields = [field.name for field in spec.fields]
+    if expected_fields != list(spec.cls.__dataclass_fields__)[: len(expected_fields)]:
+        raise ValueError(f"Expecting fields {expected_fields} to be the first fields of {spec.cls.__name__}")
+    name = f"_decode_{spec.cls.__name__}"
+    source = (
+        f"def {name}(element):\n"
+        "    a = element.attrib\n"
+        "    try:\n"
+        f"        return cls({', '.join(arguments)})\n"
+        "    except KeyError:\n"
+        "        return checked(element)\n"
+    )
+    namespace: Dict[str, Any] = {
+        "cls": spec.cls,
+        "load_child": spec.load_child,
+        "dispatch": {_in_namespace(tag, alto_namespace): decoders_by_tag[tag] for tag in spec.child_tags or ()},
+        "skipped_tags": skipped_tags,
+        "checked": _build_checked_decoder(spec, skipped, skipped_tags),
+    }
+    for type_, interner in (interners or {}).items():
+        namespace[f"intern_{type_.__name__}"] = interner
+    exec(compile(source, f"<alto {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _build_decoders(
+    alto_namespace: str, projection: _Projection = _NO_PROJECTION, interners: Optional[Interners] = None
+) -> Dict[Type, Decoder]:
+    decoders_by_tag: Dict[str, Decoder] = {}
+    for spec in _NODE_SPECS:
+        decoders_by_tag[spec.tag] = _build_decoder(spec, decoders_by_tag, alto_namespace, projection, interners)
+    return {spec.cls: decoders_by_tag[spec.tag] for spec in _NODE_SPECS}
+
+
+# Decoders of each supported namespace, so that children are dispatched on their tag without any namespace
+# handling, whatever the version of the document.
+_DECODERS = {namespace: _build_decoders(namespace) for namespace in _NAMESPACES}
+
+
+def _decoders_of(tag: str) -> Dict[Type, Decoder]:
+    return _DECODERS.get(_namespace_of(tag)) or _DECODERS[_Namespace]
+
+
+def _alto_from_decoders(
+    element: Element,
+    decoders_by_namespace: Dict[str, Dict[Type, Decoder]] = _DECODERS,
+    on_page: Optional[Callable[[Page], None]] = None,
+) -> Alto:
+    # Builds pages with decoders other than the default ones, such as projected or interning decoders, calling
+    # on_page with each page as soon as it is built.
+    tags = _tags_of(element.tag)
+    children = _extract_unique_child_name_to_child(element)
+    description = Description.from_xml(_get_tag(element.tag, children, tags.DESCRIPTION))
+    pages: List[Page] = []
+    for child in _get_tag(element.tag, children, tags.LAYOUT):
+        _assert_name_is(child.tag, _tags_of(child.tag).PAGE)
+        decoders = decoders_by_namespace.get(_namespace_of(child.tag)) or decoders_by_namespace[_Namespace]
+        page = decoders[Page](child)
+        pages.append(page)
+        if on_page is not None:
+            on_page(page)
+    return Alto(description, Layout(pages))
+
+
+Constructor = Callable[[Dict[str, str], List[Any]], Any]
+
+
+def _build_constructor(spec: _NodeSpec) -> Constructor:
+    # Same conversions as the decoders, from an attribute dict and the already built children, for
+    # builders receiving parser events rather than elements. Errors are left to the caller.
+    arguments = [_attr_expression(field) for field in spec.fields]
+    if spec.load_child is not None:
+        arguments.append("children")
+    name = f"_construct_{spec.cls.__name__}"
+    source = f"def {name}(a, children):\n    return cls({', '.join(arguments)})\n"
+    namespace: Dict[str, Any] = {"cls": spec.cls}
+    exec(compile(source, f"<alto {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_CONSTRUCTORS = {
+    _in_namespace(spec.tag, namespace): constructor
+    for spec in _NODE_SPECS
+    for constructor in (_build_constructor(spec),)
+    for namespace in _NAMESPACES
+}
+
+
+def _node_reducer(cls: Type) -> Callable[[Any], Tuple[Type, Tuple]]:
+    fields = tuple(cls.__dataclass_fields__)
+
+    def reduce(node: Any) -> Tuple[Type, Tuple]:
+        return cls, tuple(getattr(node, name) for name in fields)
+
+    return reduce
+
+
+# Nodes are pickled as constructor calls rather than slot states: payloads are smaller and faster to load,
+# which matters for the parse cache and for results sent back by worker processes, and caches are dropped.
+_NODE_CLASSES = (
+    Description,
+    Alternative,
+    String,
+    SP,
+    TextLine,
+    TextBlock,
+    ComposedBlock,
+    PrintSpace,
+    Page,
+    Layout,
+    Alto,
+)
+for _node_class in _NODE_CLASSES:
+    copyreg.pickle(_node_class, _node_reducer(_node_class))
+
+
+def parse_file(
+    filename: str,
+    cache_dir: Optional[str] = None,
+    cache_key: "CacheKey" = 'stat',
+    lazy: bool = False,
+    backend: Backend = 'etree',
+    stats: Optional["ParseStats"] = None,
+    fields: Optional[Collection[str]] = None,
+    level: Level = 'String',
+    intern_table: Optional["InternTable"] = None,
+) -> Alto:
     """
     Alto constructor from xml file.
 
@@ -505,11 +1534,38 @@ def parse_file(filename: str) -> Alto:
     ----------
     filename: str
         filename of the file to load
+    cache_dir: Optional[str]
+        if given, directory of an on-disk cache of parsed files, see `alto.cache.parse_file_cached`
+    cache_key: Literal['stat', 'content']
+        how files are identified in the cache, by path, size and modification time or by content hash
+    lazy: bool
+        if True, `layout.pages` is a `LazyPages` sequence building each page on first access
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, 'auto' selects the fastest one, 'expat' builds nodes from parser events
+        without building an element tree, see `alto.backends`
+    stats: Optional[ParseStats]
+        if given, filled with timings and counts of the parse, see `alto.stats.ParseStats`
+    fields: Optional[Collection[str]]
+        if given, names of the String fields to read, such as ['content'], the others being left to None,
+        see `alto.projection.from_xml`
+    level: Literal['Page', 'PrintSpace', 'ComposedBlock', 'TextBlock', 'TextLine', 'String']
+        deepest level of the built nodes
+    intern_table: Optional[InternTable]
+        if given, table through which equal attribute values of the built nodes are shared, to save memory
+        when many documents are kept, see `alto.interning.InternTable`
     """
-    return Alto.parse_file(filename)
-
-
-def parse(xml_string: str) -> Alto:
+    return Alto.parse_file(filename, cache_dir, cache_key, lazy, backend, stats, fields, level, intern_table)
+
+
+def parse(
+    xml_string: str,
+    lazy: bool = False,
+    backend: Backend = 'etree',
+    stats: Optional["ParseStats"] = None,
+    fields: Optional[Collection[str]] = None,
+    level: Level = 'String',
+    intern_table: Optional["InternTable"] = None,
+) -> Alto:
     """
     Alto constructor from xml string.
 
@@ -517,5 +1573,26 @@ def parse(xml_string: str) -> Alto:
     ----------
     xml_str: str
         xml alto string
+    lazy: bool
+        if True, `layout.pages` is a `LazyPages` sequence building each page on first access
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, 'auto' selects the fastest one, 'expat' builds nodes from parser events
+        without building an element tree, see `alto.backends`
+    stats: Optional[ParseStats]
+        if given, filled with timings and counts of the parse, see `alto.stats.ParseStats`
+    fields: Optional[Collection[str]]
+        if given, names of the String fields to read, such as ['content'], the others being left to None,
+        see `alto.projection.from_xml`
+    level: Literal['Page', 'PrintSpace', 'ComposedBlock', 'TextBlock', 'TextLine', 'String']
+        deepest level of the built nodes
+    intern_table: Optional[InternTable]
+        if given, table through which equal attribute values of the built nodes are shared, to save memory
+        when many documents are kept, see `alto.interning.InternTable`
     """
-    return Alto.parse(xml_string)
+    return Alto.parse(xml_string, lazy, backend, stats, fields, level, intern_table)
+
+
+from alto.batch import parse_files  # noqa: F401
+from alto.page_index import AltoFile  # noqa: F401
+from alto.projection import iter_words  # noqa: F401
+from alto.streaming import iter_pages, iter_parse  # noqa: F401
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Asyncio api, running parsing in an executor so that the event loop is not blocked.
+
+Concurrency is bounded by an `asyncio.Semaphore` shared between calls: at most as many files as the
+semaphore allows are parsed at once, the others wait without holding an executor worker.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from alto import Alto, Page
+from alto.backends import Backend
+from alto.streaming import iter_pages
+
+T = TypeVar("T")
+
+_END = object()
+
+
+async def _run(executor: Optional[Executor], semaphore: Optional[asyncio.Semaphore], function: Callable[[], T]) -> T:
+    loop = asyncio.get_running_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(executor, function)
+    async with semaphore:
+        return await loop.run_in_executor(executor, function)
+
+
+async def parse_file_async(
+    filename: str,
+    executor: Optional[Executor] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    backend: Backend = 'etree',
+) -> Alto:
+    """
+    Alto constructor from xml file, parsing in an executor.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    executor: Optional[Executor]
+        executor running the parse, defaults to the default executor of the event loop, a thread pool.
+        With a ProcessPoolExecutor, parsing does not compete with the event loop for the GIL, but the
+        result is pickled back to the current process.
+    semaphore: Optional[asyncio.Semaphore]
+        if given, held while the file is parsed, to bound the number of concurrent parses
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+    return await _run(executor, semaphore, functools.partial(Alto.parse_file, filename, backend=backend))
+
+
+async def iter_pages_async(
+    filename: str,
+    executor: Optional[Executor] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    backend: Backend = 'etree',
+) -> AsyncIterator[Page]:
+    """
+    Iterates over the pages of an alto xml file, building each page in an executor, see `alto.streaming.iter_pages`.
+
+    The semaphore, if any, is held while a page is built and released while it is consumed, so that a slow
+    consumer does not prevent other files from being parsed.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    executor: Optional[Executor]
+        thread pool building pages, defaults to the default executor of the event loop. Process pools are
+        not supported, as the file is read incrementally by a single iterator.
+    semaphore: Optional[asyncio.Semaphore]
+        if given, held while each page is built, to bound the number of concurrent parses
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("iter_pages_async requires a thread executor, got a ProcessPoolExecutor")
+    pages: Iterator[Page] = await _run(executor, semaphore, functools.partial(iter_pages, filename, backend))
+    # Held while the iterator runs, so that it is not closed while a page is still being built in the executor,
+    # which happens when the task is cancelled: the executor call goes on after the await is cancelled.
+    lock = threading.Lock()
+
+    def next_page() -> Any:
+        with lock:
+            return next(pages, _END)
+
+    def close() -> None:
+        with lock:
+            close_pages = getattr(pages, "close", None)
+            if close_pages is not None:
+                close_pages()
+
+    try:
+        while True:
+            page: Any = await _run(executor, semaphore, next_page)
+            if page is _END:
+                return
+            yield page
+    finally:
+        if lock.acquire(blocking=False):
+            lock.release()
+            close()
+        else:
+            # closed by the executor once the page is built, without waiting for it
+            asyncio.get_running_loop().run_in_executor(executor, close)
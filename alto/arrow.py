@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""Export of the strings of many alto files to a Parquet or Arrow table, written in record batches."""
+
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from typing_extensions import Literal  # for python3.7 compatibility
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("alto.arrow requires pyarrow, install it with `pip install alto-xml[arrow]`") from exc
+
+from alto import Alto, String
+from alto.backends import Backend
+from alto.batch import map_files
+
+TableFormat = Literal['parquet', 'arrow']
+
+SCHEMA = pa.schema(
+    [
+        ("path", pa.string()),
+        ("page_id", pa.string()),
+        ("composed_block_id", pa.string()),
+        ("text_block_id", pa.string()),
+        ("line_id", pa.string()),
+        ("string_id", pa.string()),
+        ("hpos", pa.float64()),
+        ("vpos", pa.float64()),
+        ("width", pa.float64()),
+        ("height", pa.float64()),
+        ("confidence", pa.float64()),
+        ("content", pa.string()),
+    ]
+)
+_COLUMNS = SCHEMA.names
+
+Columns = Dict[str, List[Any]]
+
+
+@dataclass
+class ExportResult:
+    """
+    Summary of a corpus export.
+
+    Parameters
+    ----------
+    nb_documents: int
+        number of documents whose strings were written
+    nb_rows: int
+        number of rows written, one per String
+    errors: List[Tuple[str, Exception]]
+        files that could not be parsed, with the exception raised, when errors are skipped
+    """
+
+    nb_documents: int = 0
+    nb_rows: int = 0
+    errors: List[Tuple[str, Exception]] = field(default_factory=list)
+
+
+def document_columns(filename: str, backend: Backend = 'etree') -> Columns:
+    """
+    Parses an alto file and returns the values of its strings, one list per column of `SCHEMA`.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+    alto = Alto.parse_file(filename, backend=backend)
+    # ancestors are (page, print_space, composed_block, text_block, line), the walk and the String filtering are
+    # the ones of the iteration methods of the document
+    items = list(alto.iter_strings(with_ancestors=True))
+    strings: List[String] = [string for string, _ in items]
+    columns: Columns = {
+        "path": [filename] * len(strings),
+        "page_id": [ancestors[0].id for _, ancestors in items],
+        "composed_block_id": [ancestors[2].id for _, ancestors in items],
+        "text_block_id": [ancestors[3].id for _, ancestors in items],
+        "line_id": [ancestors[4].id for _, ancestors in items],
+        "string_id": [string.id for string in strings],
+        "hpos": [string.hpos for string in strings],
+        "vpos": [string.vpos for string in strings],
+        "width": [string.width for string in strings],
+        "height": [string.height for string in strings],
+        "confidence": [string.confidence for string in strings],
+        "content": [string.content for string in strings],
+    }
+    return columns
+
+
+class _BatchWriter:
+    def __init__(self, out: str, table_format: TableFormat, batch_rows: int) -> None:
+        self._batch_rows = batch_rows
+        self._pending: Columns = {name: [] for name in _COLUMNS}
+        self._nb_pending = 0
+        if table_format == 'parquet':
+            self._writer: Any = pq.ParquetWriter(out, SCHEMA)
+        elif table_format == 'arrow':
+            self._writer = pa.ipc.new_file(out, SCHEMA)
+        else:
+            raise NotImplementedError(f'Not implemented for value {table_format}')
+
+    def add(self, columns: Columns) -> None:
+        for name in _COLUMNS:
+            self._pending[name].extend(columns[name])
+        self._nb_pending += len(columns["path"])
+        if self._nb_pending < self._batch_rows:
+            return
+        # full batches are written from slices of the pending rows, which are then replaced by the rest once,
+        # as deleting each batch from the head of the lists would move the rest every time
+        nb_rows = self._nb_pending - self._nb_pending % self._batch_rows
+        for start in range(0, nb_rows, self._batch_rows):
+            self._write(start, start + self._batch_rows)
+        self._pending = {name: values[nb_rows:] for name, values in self._pending.items()}
+        self._nb_pending -= nb_rows
+
+    def _write(self, start: int, end: int) -> None:
+        arrays = [pa.array(self._pending[name][start:end], type=SCHEMA.field(name).type) for name in _COLUMNS]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=SCHEMA))
+
+    def close(self) -> None:
+        if self._nb_pending:
+            self._write(0, self._nb_pending)
+        self._writer.close()
+
+
+def _format_from_filename(out: str) -> TableFormat:
+    return 'parquet' if out.endswith(".parquet") else 'arrow'
+
+
+def export_corpus(
+    paths: Iterable[str],
+    out: str = "words.parquet",
+    batch_rows: int = 65536,
+    workers: Optional[int] = 1,
+    table_format: Optional[TableFormat] = None,
+    skip_errors: bool = False,
+    backend: Backend = 'etree',
+) -> ExportResult:
+    """
+    Writes one row per String of each alto file to a Parquet or Arrow IPC file, see `SCHEMA` for columns.
+
+    Files are parsed by `alto.batch.map_files`, so at most a few documents are held in memory at once, and rows
+    are written in record batches of `batch_rows` rows as soon as they are available, so memory does not grow
+    with the size of the corpus. Rows follow the order of `paths`, and the document order within a file.
+
+    Parameters
+    ----------
+    paths: Iterable[str]
+        filenames of the files to export, consumed lazily
+    out: str
+        filename of the table to write
+    batch_rows: int
+        number of rows of each record batch, and of each parquet row group
+    workers: Optional[int]
+        number of worker processes parsing files, None for the number of CPUs, 1 to parse in the current process
+    table_format: Optional[Literal['parquet', 'arrow']]
+        format of the table, defaults to parquet for '.parquet' filenames and to the Arrow IPC file format otherwise
+    skip_errors: bool
+        if True, files that cannot be parsed are reported in the result, otherwise a ValueError is raised
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+    if batch_rows < 1:
+        raise ValueError(f"Expecting batch_rows to be positive, got {batch_rows}")
+    writer = _BatchWriter(out, table_format or _format_from_filename(out), batch_rows)
+    res = ExportResult()
+    try:
+        for filename, columns in map_files(partial(document_columns, backend=backend), paths, workers):
+            if isinstance(columns, Exception):
+                if not skip_errors:
+                    raise ValueError(f"Error when exporting file {filename}: {columns}") from columns
+                res.errors.append((filename, columns))
+                continue
+            writer.add(columns)
+            res.nb_documents += 1
+            res.nb_rows += len(columns["path"])
+    finally:
+        writer.close()
+    return res
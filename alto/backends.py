@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+Selection of the library used to parse xml: stdlib ElementTree or lxml.
+
+The 'expat' backend builds alto objects directly from parser events, see `alto.expat_builder`. Functions
+of this module return elements, which it builds with ElementTree, itself based on expat.
+"""
+
+import re
+from typing import Any, Dict, Iterator, Tuple
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+from typing_extensions import Literal  # for python3.7 compatibility
+
+Backend = Literal['etree', 'lxml', 'expat', 'auto']
+
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def lxml_available() -> bool:
+    try:
+        import lxml.etree  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_backend(backend: Backend) -> Literal['etree', 'lxml', 'expat']:
+    """
+    Resolves 'auto' to the fastest backend building element trees, 'etree'.
+
+    lxml parses xml faster than ElementTree, but each element read from its tree goes through a Python proxy
+    created on access, so that building alto objects is about twice slower and the whole parse is slower,
+    see `alto.benchmark`. 'lxml' is only used when requested, for instance for its handling of huge documents.
+
+    Parameters
+    ----------
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        requested backend
+    """
+    if backend == 'auto':
+        return 'etree'
+    if backend == 'lxml':
+        if not lxml_available():
+            raise ImportError("lxml backend requires lxml, install it with `pip install alto-xml[lxml]`")
+        return 'lxml'
+    if backend == 'etree' or backend == 'expat':
+        return backend
+    raise NotImplementedError(f'Not implemented for value {backend}')
+
+
+# Comments and processing instructions are dropped so that elements only have element children, as with
+# ElementTree. Entities are not resolved. The same options are used by the tree and the streaming parsers.
+_LXML_OPTIONS: Dict[str, bool] = {
+    "remove_comments": True,
+    "remove_pis": True,
+    "resolve_entities": False,
+    "huge_tree": True,
+}
+
+
+def _lxml_parser() -> Any:
+    import lxml.etree  # type: ignore
+
+    return lxml.etree.XMLParser(**_LXML_OPTIONS)
+
+
+def parse_xml_file(filename: str, backend: Backend = 'etree') -> Element:
+    """
+    Parses an xml file.
+
+    Elements returned by the lxml backend are lxml elements, which expose the subset of the
+    ElementTree api used by this library.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use
+
+    Returns
+    -------
+    Element
+        root element of the document
+    """
+    if resolve_backend(backend) == 'lxml':
+        import lxml.etree  # type: ignore
+
+        return lxml.etree.parse(filename, _lxml_parser()).getroot()
+    return ElementTree.parse(filename).getroot()
+
+
+def parse_xml_string(xml_str: str, backend: Backend = 'etree') -> Element:
+    """
+    Parses an xml string.
+
+    Parameters
+    ----------
+    xml_str: str
+        xml string
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use
+
+    Returns
+    -------
+    Element
+        root element of the document
+    """
+    if resolve_backend(backend) == 'lxml':
+        import lxml.etree  # type: ignore
+
+        # lxml rejects str inputs declaring an encoding, the declaration is meaningless for decoded text
+        return lxml.etree.fromstring(_XML_DECLARATION.sub("", xml_str, count=1), _lxml_parser())
+    return ElementTree.fromstring(xml_str)
+
+
+def parse_xml_bytes(data: bytes, backend: Backend = 'etree') -> Element:
+    """
+    Parses the content of an xml file, its encoding being read from its declaration.
+
+    Parameters
+    ----------
+    data: bytes
+        xml document
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use
+
+    Returns
+    -------
+    Element
+        root element of the document
+    """
+    if resolve_backend(backend) == 'lxml':
+        import lxml.etree  # type: ignore
+
+        return lxml.etree.fromstring(data, _lxml_parser())
+    return ElementTree.fromstring(data)
+
+
+def iterparse_xml_file(filename: str, backend: Backend = 'etree') -> Iterator[Tuple[str, Element]]:
+    """
+    Iterates over start and end events of the elements of an xml file.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use
+    """
+    if resolve_backend(backend) == 'lxml':
+        import lxml.etree  # type: ignore
+
+        return lxml.etree.iterparse(filename, events=("start", "end"), **_LXML_OPTIONS)
+    return ElementTree.iterparse(filename, events=("start", "end"))
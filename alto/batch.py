@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""Parallel parsing of many alto files."""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from functools import partial
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar, Union
+
+from alto import Alto
+
+T = TypeVar("T")
+ParseResult = Tuple[str, Union[Alto, Exception]]
+Result = Tuple[str, Union[T, Exception]]
+
+
+def _apply_chunk(function: Callable[[str], T], filenames: List[str]) -> List[Result[T]]:
+    results: List[Result[T]] = []
+    for filename in filenames:
+        try:
+            results.append((filename, function(filename)))
+        except Exception as exc:  # errors are reported to the caller with the file they relate to
+            results.append((filename, exc))
+    return results
+
+
+def _chunks(filenames: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(filenames)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_ordered(
+    executor: ProcessPoolExecutor,
+    task: Callable[[List[str]], List[Result[T]]],
+    chunks: Iterator[List[str]],
+    max_pending: int,
+) -> Iterator[Result[T]]:
+    pending: Deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(task, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _iter_unordered(
+    executor: ProcessPoolExecutor,
+    task: Callable[[List[str]], List[Result[T]]],
+    chunks: Iterator[List[str]],
+    max_pending: int,
+) -> Iterator[Result[T]]:
+    pending: Set[Future] = set()
+    for chunk in chunks:
+        pending.add(executor.submit(task, chunk))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    for future in as_completed(pending):
+        yield from future.result()
+
+
+def _map_chunks(
+    task: Callable[[List[str]], List[Result[T]]],
+    chunks: Iterator[List[str]],
+    workers: int,
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[Result[T]]:
+    if workers == 1:
+        for chunk in chunks:
+            yield from task(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            yield from _iter_ordered(executor, task, chunks, max_pending)
+        else:
+            yield from _iter_unordered(executor, task, chunks, max_pending)
+
+
+def parse_files(
+    filenames: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[ParseResult]:
+    """
+    Parses many alto xml files using a pool of processes.
+
+    Files are sent to workers by chunks of `chunksize` filenames, and at most `max_pending`
+    chunks are submitted at once, so that neither the submitted work nor the parsed results
+    waiting to be consumed grow with the number of files.
+
+    Parameters
+    ----------
+    filenames: Iterable[str]
+        filenames of the files to load, consumed lazily
+    workers: Optional[int]
+        number of worker processes, defaults to the number of CPUs. With 1 worker,
+        files are parsed in the current process.
+    chunksize: int
+        number of files sent to a worker at once
+    ordered: bool
+        if True, results are yielded in the order of `filenames`, otherwise as soon as they are ready
+    max_pending: Optional[int]
+        maximal number of chunks being parsed or waiting to be yielded, defaults to twice the number of workers
+
+    Returns
+    -------
+    Iterator[Tuple[str, Union[Alto, Exception]]]
+        for each file, its filename and either the parsed Alto or the exception raised when parsing it
+    """
+    return map_files(Alto.parse_file, filenames, workers, chunksize, ordered, max_pending)
+
+
+def map_files(
+    function: Callable[[str], T],
+    filenames: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Result[T]]:
+    """
+    Applies a function to many files using a pool of processes, see `parse_files`.
+
+    Parameters
+    ----------
+    function: Callable[[str], T]
+        function applied to each filename in worker processes, it must be picklable, such as a module level function
+    filenames: Iterable[str]
+        filenames of the files to process, consumed lazily
+    workers: Optional[int]
+        number of worker processes, defaults to the number of CPUs
+    chunksize: int
+        number of files sent to a worker at once
+    ordered: bool
+        if True, results are yielded in the order of `filenames`, otherwise as soon as they are ready
+    max_pending: Optional[int]
+        maximal number of chunks being processed or waiting to be yielded, defaults to twice the number of workers
+
+    Returns
+    -------
+    Iterator[Tuple[str, Union[T, Exception]]]
+        for each file, its filename and either the result of the function or the exception it raised
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Expecting workers to be positive, got {workers}")
+    if chunksize < 1:
+        raise ValueError(f"Expecting chunksize to be positive, got {chunksize}")
+    if max_pending is None:
+        max_pending = 2 * workers
+    if max_pending < 1:
+        raise ValueError(f"Expecting max_pending to be positive, got {max_pending}")
+    # arguments are checked when map_files is called, results are computed lazily
+    return _map_chunks(partial(_apply_chunk, function), _chunks(filenames, chunksize), workers, ordered, max_pending)
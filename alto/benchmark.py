@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of parsing and extraction on synthetic documents.
+
+Run with `python -m alto.benchmark --output results.json`, see `python -m alto.benchmark --help`.
+"""
+
+import argparse
+import functools
+import gc
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from alto import Alto, __version__, parse, parse_file
+from alto.backends import Backend
+from alto.interning import InternTable
+from alto.synthetic import DocumentShape, write_alto
+
+SIZES: Dict[str, DocumentShape] = {
+    "small": DocumentShape(nb_pages=1),
+    "medium": DocumentShape(nb_pages=10, alternatives_rate=0.05),
+    "large": DocumentShape(nb_pages=100, alternatives_rate=0.05),
+    # a single page of 50,000 words, for the extractions whose cost depends on the size of pages
+    "dense": DocumentShape(nb_pages=1, composed_blocks_per_page=50, text_blocks_per_composed_block=10),
+}
+_DEFAULT_SIZES = ("small", "medium")
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measures of a benchmark.
+
+    Parameters
+    ----------
+    name: str
+        measured operation
+    size: str
+        name of the document shape
+    backend: Optional[str]
+        xml backend, for parsing benchmarks
+    nb_words: int
+        number of String tags of the document
+    times: List[float]
+        duration of each run, in seconds
+    peak_memory: Optional[int]
+        peak of memory allocated by a run, in bytes, as traced by tracemalloc
+    retained_memory: Optional[int]
+        memory still allocated at the end of a run, while its result is alive, such as the memory held by a
+        parsed document, in bytes, as traced by tracemalloc
+    """
+
+    name: str
+    size: str
+    backend: Optional[str]
+    nb_words: int
+    times: List[float]
+    peak_memory: Optional[int]
+    retained_memory: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "best": min(self.times),
+            "median": statistics.median(self.times),
+        }
+
+
+def _measure(
+    function: Callable[[], Any], repeat: int, memory: bool, setup: Optional[Callable[[], Any]] = None
+) -> Tuple[List[float], Optional[int], Optional[int]]:
+    times: List[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        # garbage collection stays enabled, its cost grows with allocations and is part of the measure,
+        # but garbage left by previous runs is collected beforehand
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    if not memory:
+        return times, None, None
+    # tracing slows allocations down, so memory is measured in a separate run
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        result = function()
+        # the result is still alive, so that the memory it holds is measured
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return times, peak, retained
+
+
+def _extractions(alto: Alto) -> Dict[str, Callable[[], Any]]:
+    pages = alto.layout.pages
+    text_blocks = alto.extract_text_blocks()
+    extractions: Dict[str, Callable[[], Any]] = {
+        "Alto.extract_words": alto.extract_words,
+        "Alto.extract_composed_blocks": alto.extract_composed_blocks,
+        "Alto.extract_text_blocks": alto.extract_text_blocks,
+        "Alto.extract_text_lines": alto.extract_text_lines,
+        "Alto.extract_grouped_words[TextLine]": lambda: alto.extract_grouped_words('TextLine'),
+        "Alto.extract_grouped_words[TextBlock]": lambda: alto.extract_grouped_words('TextBlock'),
+        "Alto.extract_grouped_words[ComposedBlock]": lambda: alto.extract_grouped_words('ComposedBlock'),
+        "Page.extract_words": lambda: [page.extract_words() for page in pages],
+        "Page.extract_blocks": lambda: [page.extract_blocks() for page in pages],
+        "Page.extract_text_blocks": lambda: [page.extract_text_blocks() for page in pages],
+        "Page.extract_lines": lambda: [page.extract_lines() for page in pages],
+        "Page.extract_strings": lambda: [page.extract_strings() for page in pages],
+        "TextBlock.extract_string_lines": lambda: [block.extract_string_lines() for block in text_blocks],
+    }
+    if importlib.util.find_spec("numpy") is not None:
+        extractions["Page.reading_order"] = lambda: [page.reading_order() for page in pages]
+    return extractions
+
+
+def run_benchmarks(
+    shapes: Dict[str, DocumentShape],
+    backends: Sequence[Backend] = ('etree', 'expat'),
+    repeat: int = 3,
+    memory: bool = True,
+) -> List[BenchmarkResult]:
+    """
+    Measures parsing and extraction durations, and their peak and retained memory, on synthetic documents.
+
+    Extraction results are memoized, so caches are invalidated before each run: durations are those of
+    a first call.
+
+    Parameters
+    ----------
+    shapes: Dict[str, DocumentShape]
+        document shapes, by name
+    backends: Sequence[Literal['etree', 'lxml', 'expat', 'auto']]
+        xml backends of the parsing benchmarks
+    repeat: int
+        number of timed runs of each benchmark
+    memory: bool
+        if True, peak and retained memory are measured in an additional run
+    """
+    results: List[BenchmarkResult] = []
+    table = InternTable()
+    with tempfile.TemporaryDirectory() as directory:
+        for size, shape in shapes.items():
+            filename = os.path.join(directory, f"{size}.xml")
+            write_alto(filename, shape)
+            with open(filename, encoding="utf-8") as file_:
+                xml_str = file_.read()
+            for backend in backends:
+                parsers: List[Tuple[str, Callable[[], Any]]] = [
+                    ("parse_file", lambda: parse_file(filename, backend=backend)),
+                    ("parse", lambda: parse(xml_str, backend=backend)),
+                ]
+                if backend != 'expat':
+                    interned = functools.partial(parse_file, filename, backend=backend, intern_table=table)
+                    parsers.append(("parse_file[intern]", interned))
+                for name, function in parsers:
+                    # the table is emptied before each run, so that the retained memory includes the values of the
+                    # document and the table
+                    times, peak, retained = _measure(function, repeat, memory, setup=table.clear)
+                    results.append(BenchmarkResult(name, size, backend, shape.nb_words, times, peak, retained))
+            alto = parse_file(filename)
+            for name, function in _extractions(alto).items():
+                times, peak, retained = _measure(function, repeat, memory, setup=alto.invalidate_cache)
+                results.append(BenchmarkResult(name, size, None, shape.nb_words, times, peak, retained))
+    return results
+
+
+def benchmark_report(
+    sizes: Sequence[str] = _DEFAULT_SIZES,
+    backends: Sequence[Backend] = ('etree', 'expat'),
+    repeat: int = 3,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmarks on documents of predefined sizes and returns a json serializable report.
+
+    Parameters
+    ----------
+    sizes: Sequence[str]
+        names of document shapes, among the keys of `SIZES`
+    backends: Sequence[Literal['etree', 'lxml', 'expat', 'auto']]
+        xml backends of the parsing benchmarks
+    repeat: int
+        number of timed runs of each benchmark
+    memory: bool
+        if True, peak and retained memory are measured in an additional run
+    """
+    for size in sizes:
+        if size not in SIZES:
+            raise NotImplementedError(f'Not implemented for value {size}')
+    shapes = {size: SIZES[size] for size in sizes}
+    results = run_benchmarks(shapes, backends, repeat, memory)
+    return {
+        "alto_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "shapes": {size: asdict(shape) for size, shape in shapes.items()},
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m alto.benchmark", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(_DEFAULT_SIZES))
+    parser.add_argument("--backends", nargs="+", choices=['etree', 'lxml', 'expat', 'auto'], default=['etree', 'expat'])
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs of each benchmark")
+    parser.add_argument("--no-memory", action="store_true", help="skip memory measures")
+    parser.add_argument("--output", help="json file to write results to, defaults to the standard output")
+    args = parser.parse_args(argv)
+    report = benchmark_report(args.sizes, args.backends, args.repeat, not args.no_memory)
+    if args.output:
+        with open(args.output, "w") as file_:
+            json.dump(report, file_, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
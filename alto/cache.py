@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of parsed alto files."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable, Iterable, Optional, Type
+
+from typing_extensions import Literal  # for python3.7 compatibility
+
+from alto import _NODE_CLASSES, Alto, __version__
+
+_CACHE_SUFFIX = ".alto-cache"
+_READ_CHUNK_SIZE = 1 << 20
+
+CacheKey = Literal['stat', 'content']
+
+
+def _model_digest(classes: Iterable[Type]) -> str:
+    # Nodes are pickled as constructor calls with their dataclass fields, so entries written with other fields
+    # or slots than the current ones cannot be loaded.
+    layout = [(cls.__module__, cls.__qualname__, tuple(cls.__dataclass_fields__), cls.__slots__) for cls in classes]
+    return hashlib.sha256(repr(layout).encode()).hexdigest()[:16]
+
+
+# Entries written for another object model are ignored, without any version to bump by hand.
+_MODEL_DIGEST = _model_digest(_NODE_CLASSES)
+
+
+def _cache_header() -> bytes:
+    return f"alto-cache:{__version__}:{_MODEL_DIGEST}:{pickle.HIGHEST_PROTOCOL}\n".encode()
+
+
+def _content_digest(filename: str) -> str:
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file_:
+        for chunk in iter(lambda: file_.read(_READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_entry_name(filename: str, key: CacheKey = 'stat') -> str:
+    """
+    Name of the cache entry of an alto file.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the alto file
+    key: Literal['stat', 'content']
+        'stat' identifies the file by its absolute path, size and modification time, which is cheap.
+        'content' identifies it by a hash of its content, which survives moves and copies.
+    """
+    if key == 'stat':
+        stat = os.stat(filename)
+        identity = f"{os.path.abspath(filename)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha256(identity.encode()).hexdigest() + _CACHE_SUFFIX
+    if key == 'content':
+        return _content_digest(filename) + _CACHE_SUFFIX
+    raise NotImplementedError(f'Not implemented for value {key}')
+
+
+def _load(path: str) -> Optional[Alto]:
+    try:
+        with open(path, "rb") as file_:
+            if file_.readline() != _cache_header():
+                return None
+            res = pickle.load(file_)
+    except Exception:
+        # a corrupt or stale entry can fail in many ways, such as missing classes or invalid arguments, it is
+        # parsed again and overwritten
+        return None
+    return res if isinstance(res, Alto) else None
+
+
+def _dump(alto: Alto, path: str) -> None:
+    directory = os.path.dirname(path)
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file_:
+            file_.write(_cache_header())
+            pickle.dump(alto, file_, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)  # atomic, concurrent readers never see partial entries
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def parse_file_cached(
+    filename: str, cache_dir: str, key: CacheKey = 'stat', parser: Callable[[str], Alto] = Alto.parse_file
+) -> Alto:
+    """
+    Alto constructor from xml file, going through an on-disk cache.
+
+    On a cache miss, the file is parsed and a binary encoding of the result is written to `cache_dir`.
+    Entries written by another version of the library are ignored and overwritten. Entries are
+    loaded with pickle, so `cache_dir` must only be writable by trusted users.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    cache_dir: str
+        directory of cache entries, created if needed
+    key: Literal['stat', 'content']
+        how files are identified, see `cache_entry_name`
+    parser: Callable[[str], Alto]
+        function parsing the file on cache misses
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, cache_entry_name(filename, key))
+    res = _load(path)
+    if res is None:
+        res = parser(filename)
+        _dump(res, path)
+    return res
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""Columnar (struct of arrays) view of the strings of alto documents, and statistics on it, backed by numpy."""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("alto.columns requires numpy, install it with `pip install alto-xml[numpy]`") from exc
+
+from alto import Alto, ConfidenceLevel, Page, String
+
+
+@dataclass
+class StringColumns:
+    """
+    Attributes of all String elements of a document, one array per attribute.
+
+    Element i of each array relates to the i-th String in document order. Parent
+    indices count elements of the parent level in document order, starting from 0.
+
+    Parameters
+    ----------
+    id: np.ndarray
+        object array of String ids
+    hpos, vpos, width, height, confidence: np.ndarray
+        float64 arrays of String geometry and confidence
+    content: np.ndarray
+        object array of String contents
+    line_index, text_block_index, composed_block_index, page_index: np.ndarray
+        int64 arrays of the index of the TextLine, TextBlock, ComposedBlock and Page containing each String
+    """
+
+    id: np.ndarray
+    hpos: np.ndarray
+    vpos: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    confidence: np.ndarray
+    content: np.ndarray
+    line_index: np.ndarray
+    text_block_index: np.ndarray
+    composed_block_index: np.ndarray
+    page_index: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+
+def _expand(parent_index: np.ndarray, counts: List[int]) -> np.ndarray:
+    return np.repeat(parent_index, np.asarray(counts, dtype=np.int64))
+
+
+def build_string_columns(pages: Iterable[Page]) -> StringColumns:
+    """
+    Builds the columnar view of the strings of the given pages.
+
+    Parameters
+    ----------
+    pages: Iterable[Page]
+        pages to collect strings from, their index in the iterable is the page index
+
+    Returns
+    -------
+    StringColumns
+        attributes of all strings of the pages
+    """
+    strings: List[String] = []
+    strings_per_line: List[int] = []
+    lines_per_block: List[int] = []
+    blocks_per_composed_block: List[int] = []
+    composed_blocks_per_page: List[int] = []
+    for page in pages:
+        nb_composed_blocks = 0
+        for ps in page.print_spaces:
+            nb_composed_blocks += len(ps.composed_blocks)
+            for composed_block in ps.composed_blocks:
+                blocks_per_composed_block.append(len(composed_block.text_blocks))
+                for block in composed_block.text_blocks:
+                    lines_per_block.append(len(block.text_lines))
+                    for line in block.text_lines:
+                        nb_strings = len(strings)
+                        strings.extend(string for string in line.strings if isinstance(string, String))
+                        strings_per_line.append(len(strings) - nb_strings)
+        composed_blocks_per_page.append(nb_composed_blocks)
+
+    line_index = _expand(np.arange(len(strings_per_line), dtype=np.int64), strings_per_line)
+    line_to_block = _expand(np.arange(len(lines_per_block), dtype=np.int64), lines_per_block)
+    block_to_composed_block = _expand(
+        np.arange(len(blocks_per_composed_block), dtype=np.int64), blocks_per_composed_block
+    )
+    composed_block_to_page = _expand(np.arange(len(composed_blocks_per_page), dtype=np.int64), composed_blocks_per_page)
+    text_block_index = line_to_block[line_index]
+    composed_block_index = block_to_composed_block[text_block_index]
+
+    geometry = np.array(
+        [(str_.hpos, str_.vpos, str_.width, str_.height, str_.confidence) for str_ in strings], dtype=np.float64
+    ).reshape(len(strings), 5)
+    return StringColumns(
+        id=_object_array([str_.id for str_ in strings]),
+        hpos=np.ascontiguousarray(geometry[:, 0]),
+        vpos=np.ascontiguousarray(geometry[:, 1]),
+        width=np.ascontiguousarray(geometry[:, 2]),
+        height=np.ascontiguousarray(geometry[:, 3]),
+        confidence=np.ascontiguousarray(geometry[:, 4]),
+        content=_object_array([str_.content for str_ in strings]),
+        line_index=line_index,
+        text_block_index=text_block_index,
+        composed_block_index=composed_block_index,
+        page_index=composed_block_to_page[composed_block_index],
+    )
+
+
+def _object_array(values: List[str]) -> np.ndarray:
+    # np.array would build a fixed width unicode array, object arrays keep references to existing strings
+    res = np.empty(len(values), dtype=object)
+    res[:] = values
+    return res
+
+
+@dataclass
+class ConfidenceStats:
+    """
+    Statistics of the confidence of the strings of each element of a level, in document order.
+
+    Parameters
+    ----------
+    ids: List[Optional[str]]
+        ids of the elements
+    count: np.ndarray
+        int64 array of the number of strings of each element
+    mean, min, max: np.ndarray
+        float64 arrays of the mean, minimum and maximum confidence of the strings of each element, nan for
+        elements without strings
+    histogram: np.ndarray
+        int64 array of shape (number of elements, number of bins), number of strings of each element in each bin
+    bin_edges: np.ndarray
+        float64 array of the edges of the bins, which split [0, 1] evenly, confidences outside of this range
+        are counted in the first or last bin
+    """
+
+    ids: List[Optional[str]]
+    count: np.ndarray
+    mean: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    histogram: np.ndarray
+    bin_edges: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def confidence_stats(alto: Alto, level: ConfidenceLevel = 'Page', bins: int = 10) -> ConfidenceStats:
+    """
+    Computes statistics of String confidences for each element of a level, with a few array operations.
+
+    Parameters
+    ----------
+    alto: Alto
+        document whose strings are used
+    level: Literal['Page', 'ComposedBlock', 'TextBlock', 'TextLine']
+        level of the elements the strings are grouped by
+    bins: int
+        number of bins of the histograms
+
+    Returns
+    -------
+    ConfidenceStats
+        statistics of each element of the level
+    """
+    if bins < 1:
+        raise ValueError(f"Expecting bins to be positive, got {bins}")
+    elements: Sequence[Any]
+    if level == 'Page':
+        elements = alto.layout.pages
+    elif level == 'ComposedBlock':
+        elements = list(alto.iter_composed_blocks())
+    elif level == 'TextBlock':
+        elements = list(alto.iter_text_blocks())
+    elif level == 'TextLine':
+        elements = list(alto.iter_lines())
+    else:
+        raise NotImplementedError(f'Not implemented for value {level}')
+    columns = alto.to_columns()
+    index = {
+        'Page': columns.page_index,
+        'ComposedBlock': columns.composed_block_index,
+        'TextBlock': columns.text_block_index,
+        'TextLine': columns.line_index,
+    }[level]
+    confidence = columns.confidence
+    nb_elements = len(elements)
+    count = np.bincount(index, minlength=nb_elements)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(index, weights=confidence, minlength=nb_elements) / count
+    minimum = np.full(nb_elements, np.nan)
+    maximum = np.full(nb_elements, np.nan)
+    # strings are in document order, so that the strings of an element are contiguous
+    non_empty = np.flatnonzero(count)
+    if len(non_empty):
+        starts = np.searchsorted(index, non_empty)
+        minimum[non_empty] = np.minimum.reduceat(confidence, starts)
+        maximum[non_empty] = np.maximum.reduceat(confidence, starts)
+    bin_index = np.clip((confidence * bins).astype(np.int64), 0, bins - 1)
+    histogram = np.bincount(index * bins + bin_index, minlength=nb_elements * bins).reshape(nb_elements, bins)
+    return ConfidenceStats(
+        ids=[element.id for element in elements],
+        count=count,
+        mean=mean,
+        min=minimum,
+        max=maximum,
+        histogram=histogram,
+        bin_edges=np.linspace(0, 1, bins + 1),
+    )
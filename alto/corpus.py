@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+"""Incremental processing of a tree of alto files, driven by a manifest of already processed files."""
+
+import fnmatch
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from alto import Alto
+from alto.backends import Backend
+from alto.batch import map_files
+from alto.cache import _content_digest
+
+_MANIFEST_VERSION = 1
+_COMMIT_EVERY = 1000
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    outputs TEXT,
+    error TEXT,
+    run INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class ManifestEntry:
+    """
+    State of a file at the time it was last processed.
+
+    Parameters
+    ----------
+    path: str
+        filename of the file
+    size: int
+        size of the file, in bytes
+    mtime_ns: int
+        modification time of the file
+    sha256: str
+        hash of the content of the file
+    outputs: Any
+        json serializable result of the processing function, None if processing failed
+    error: Optional[str]
+        description of the exception raised when processing the file, if any
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    outputs: Any
+    error: Optional[str]
+
+
+@dataclass
+class RunSummary:
+    """
+    Changes found by a run.
+
+    Parameters
+    ----------
+    new: List[str]
+        files processed for the first time
+    modified: List[str]
+        files processed again because their content changed
+    nb_unchanged: int
+        number of files left untouched
+    deleted: List[str]
+        files removed from the manifest because they no longer exist
+    errors: List[Tuple[str, str]]
+        files whose processing failed in this run, with the error
+    """
+
+    new: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    nb_unchanged: int = 0
+    deleted: List[str] = field(default_factory=list)
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
+# size, modification time and digest of a file as processed, with the json serialized outputs or the error
+_Processed = Tuple[int, int, str, Optional[str], Optional[str]]
+# recorded for files that could not even be read, so that they do not match their stat and are tried again
+_UNREADABLE = (-1, -1, "")
+
+
+def _process_file(process: Optional[Callable[[Alto], Any]], backend: Backend, filename: str) -> _Processed:
+    # The file is stated before being hashed and parsed, so that changes made while it is processed give a stat
+    # that no longer matches the manifest. Errors of the processing are returned rather than raised, with the
+    # state of the file, so that the parent process never reads the file itself.
+    stat = os.stat(filename)
+    digest = _content_digest(filename)
+    try:
+        alto = Alto.parse_file(filename, backend=backend)
+        outputs = json.dumps(process(alto) if process is not None else None)
+    except Exception as exc:
+        return stat.st_size, stat.st_mtime_ns, digest, None, _error(exc)
+    return stat.st_size, stat.st_mtime_ns, digest, outputs, None
+
+
+def _error(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _iter_files(root: str, pattern: str) -> Iterator[Tuple[str, os.stat_result]]:
+    directories = [root]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                    yield entry.path, entry.stat()
+
+
+class CorpusRunner:
+    """
+    Applies a function to each alto file of a directory tree, skipping files processed by a previous run.
+
+    Processed files are recorded in a sqlite manifest with their size, modification time, content hash
+    and the result of the function. A run only stats files whose size and modification time did not
+    change, hashes files whose stat changed to ignore mere touches, parses new and modified files, and
+    drops entries of deleted files, so that its duration depends on the number of changes rather than on
+    the size of the corpus. Files that could not be processed are recorded with their error, and are only
+    processed again once modified, except files that could not be read, which are tried again by each run.
+    Errors never stop a run.
+
+    Parameters
+    ----------
+    root: str
+        directory containing the alto files, searched recursively
+    manifest: str
+        filename of the sqlite manifest, created if needed
+    process: Optional[Callable[[Alto], Any]]
+        function applied to each parsed document, returning a json serializable output stored in the
+        manifest. It must be picklable, such as a module level function, when using several workers.
+    pattern: str
+        glob pattern of the names of alto files
+    workers: Optional[int]
+        number of worker processes, see `alto.batch.map_files`, 1 to process files in the current process
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+
+    def __init__(
+        self,
+        root: str,
+        manifest: str,
+        process: Optional[Callable[[Alto], Any]] = None,
+        pattern: str = "*.xml",
+        workers: Optional[int] = 1,
+        backend: Backend = 'etree',
+    ) -> None:
+        self.root = root
+        self.process = process
+        self.pattern = pattern
+        self.workers = workers
+        self.backend = backend
+        self._connection = sqlite3.connect(manifest)
+        self._connection.executescript(_SCHEMA)
+        version = self._meta("version")
+        if version is None:
+            self._set_meta("version", str(_MANIFEST_VERSION))
+        elif version != str(_MANIFEST_VERSION):
+            raise ValueError(f"Expecting manifest version {_MANIFEST_VERSION}, got {version}")
+        self._connection.commit()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "CorpusRunner":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def _changed_files(self, run: int, summary: RunSummary) -> Iterator[str]:
+        # Unchanged files are marked as seen by this run, files whose content changed are yielded.
+        execute = self._connection.execute
+        for path, stat in _iter_files(self.root, self.pattern):
+            row = execute("SELECT size, mtime_ns, sha256 FROM files WHERE path = ?", (path,)).fetchone()
+            if row is None:
+                summary.new.append(path)
+                yield path
+                continue
+            if (row[0], row[1]) != (stat.st_size, stat.st_mtime_ns) and _digest_or_none(path) != row[2]:
+                summary.modified.append(path)
+                yield path
+                continue
+            execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, run = ? WHERE path = ?",
+                (stat.st_size, stat.st_mtime_ns, run, path),
+            )
+            summary.nb_unchanged += 1
+
+    def run(self) -> RunSummary:
+        """
+        Processes new and modified files and updates the manifest.
+
+        Returns:
+            RunSummary: files found new, modified, unchanged and deleted by the run
+        """
+        run = int(self._meta("run") or 0) + 1
+        summary = RunSummary()
+        function = partial(_process_file, self.process, self.backend)
+        results = map_files(function, self._changed_files(run, summary), self.workers)
+        for nb_results, (path, result) in enumerate(results, 1):
+            if isinstance(result, FileNotFoundError):
+                continue  # deleted since the scan, its entry is dropped below
+            processed: _Processed = (*_UNREADABLE, None, _error(result)) if isinstance(result, Exception) else result
+            size, mtime_ns, digest, outputs, error = processed  # an exception means the file could not be read
+            if error is not None:
+                summary.errors.append((path, error))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256, outputs, error, run) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, size, mtime_ns, digest, outputs, error, run),
+            )
+            if nb_results % _COMMIT_EVERY == 0:
+                self._connection.commit()
+        deleted = self._connection.execute("SELECT path FROM files WHERE run < ? ORDER BY path", (run,)).fetchall()
+        summary.deleted = [path for path, in deleted]
+        self._connection.execute("DELETE FROM files WHERE run < ?", (run,))
+        self._set_meta("run", str(run))
+        self._connection.commit()
+        return summary
+
+    def entry(self, path: str) -> Optional[ManifestEntry]:
+        """
+        Manifest entry of a file, None if the file was not processed.
+
+        Args:
+            path (str): filename of the file, as found under `root`
+        """
+        row = self._connection.execute(
+            "SELECT path, size, mtime_ns, sha256, outputs, error FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        return _entry(row) if row else None
+
+    def entries(self) -> Iterator[ManifestEntry]:
+        """
+        Iterates over the manifest entries, ordered by path.
+        """
+        rows = self._connection.execute("SELECT path, size, mtime_ns, sha256, outputs, error FROM files ORDER BY path")
+        for row in rows:
+            yield _entry(row)
+
+
+def _digest_or_none(path: str) -> Optional[str]:
+    # unreadable files are reported by the processing of the file, as modified files
+    try:
+        return _content_digest(path)
+    except OSError:
+        return None
+
+
+def _entry(row: Tuple) -> ManifestEntry:
+    path, size, mtime_ns, sha256, outputs, error = row
+    return ManifestEntry(path, size, mtime_ns, sha256, json.loads(outputs) if outputs is not None else None, error)
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""Construction of alto objects from expat parser events, without building an element tree."""
+
+from typing import Any, Callable, Dict, List, Optional
+from xml.etree.ElementTree import Element, TreeBuilder
+from xml.parsers import expat
+
+from alto import (
+    _CONSTRUCTORS,
+    _DECODERS,
+    _NAMESPACES,
+    _NODE_SPECS,
+    _TAG_SETS,
+    Alternative,
+    Alto,
+    Constructor,
+    Description,
+    Layout,
+    Page,
+    _alto_from_decoders,
+    _assert_str,
+    _extract_unique_child_name_to_child,
+    _get_tag,
+    _in_namespace,
+    _tags_of,
+)
+from alto.backends import parse_xml_bytes, parse_xml_file, parse_xml_string
+
+_BUFFER_SIZE = 1 << 16
+
+
+def _expat_name(tag: str) -> str:
+    # expat reports qualified names as "uri}local" when the namespace separator is "}"
+    return tag[1:] if tag.startswith("{") else tag
+
+
+def _tag(name: str) -> str:
+    return "{" + name if "}" in name else name
+
+
+def _child_constructors(namespace: str) -> Dict[str, Dict[str, Constructor]]:
+    tags = _TAG_SETS[namespace]
+    res = {_expat_name(tags.LAYOUT): {_expat_name(tags.PAGE): _CONSTRUCTORS[tags.PAGE]}}
+    for spec in _NODE_SPECS:
+        if spec.child_tags is not None:
+            child_tags = [_in_namespace(tag, namespace) for tag in spec.child_tags]
+            res[_expat_name(_in_namespace(spec.tag, namespace))] = {
+                _expat_name(tag): _CONSTRUCTORS[tag] for tag in child_tags
+            }
+    return res
+
+
+# Parents and children of each entry are in the same namespace, so that documents mixing versions fall back.
+_CHILD_CONSTRUCTORS = {
+    parent: constructors for namespace in _NAMESPACES for parent, constructors in _child_constructors(namespace).items()
+}
+_LAYOUTS = frozenset(_expat_name(tags.LAYOUT) for tags in _TAG_SETS.values())
+_STRINGS = frozenset(_expat_name(tags.String) for tags in _TAG_SETS.values())
+
+
+# Constructors of the children of String frames, which are Alternative elements whatever their name, and of
+# elements without children, such as SP and Alternative elements, whose children make the builder fall back.
+_ALTERNATIVES: Dict[str, Constructor] = {}
+_NO_CHILDREN: Dict[str, Constructor] = {}
+_FRAME_CHILDREN: Dict[str, Dict[str, Constructor]] = {
+    **_CHILD_CONSTRUCTORS,
+    **{name: _ALTERNATIVES for name in _STRINGS},
+}
+# Frames whose closing is handled, other than Page frames, which hold their page.
+_ALTERNATIVE = object()
+_LAYOUT = object()
+
+
+class _Fallback(Exception):
+    pass
+
+
+def _build(parse: Callable[[Any], None], on_page: Optional[Callable[[Page], None]] = None) -> Alto:
+    # Elements outside of Layout, such as the Description, are few and are built as an element tree so that
+    # they are read by the usual methods. Inside Layout, the handlers are swapped for lighter ones: each node
+    # is built as soon as its element opens, with an empty list of children filled as the children are built,
+    # so that no element outlives its node and closing most elements only pops their frame. Frames are
+    # [child constructors, children, closing], where closing is None, _ALTERNATIVE for Alternative frames,
+    # which collect text instead of children, _LAYOUT for the Layout frame, or the page of Page frames, which
+    # is passed to on_page once complete.
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.buffer_size = _BUFFER_SIZE
+    tree = TreeBuilder()
+    pages: List[Page] = []
+    stack: List[List[Any]] = []
+    push, pop = stack.append, stack.pop
+    frame_children = _FRAME_CHILDREN.get
+    depth = 0
+
+    def start(name: str, attributes: Dict[str, str]) -> None:
+        nonlocal depth
+        if name in _LAYOUTS and depth == 1:
+            parser.StartElementHandler = layout_start
+            parser.EndElementHandler = layout_end
+            parser.CharacterDataHandler = None
+            push([_CHILD_CONSTRUCTORS[name], pages, _LAYOUT])
+        tree.start(_tag(name), attributes)
+        depth += 1
+
+    def end(name: str) -> None:
+        nonlocal depth
+        tree.end(_tag(name))
+        depth -= 1
+
+    def layout_start(name: str, attributes: Dict[str, str]) -> None:
+        parent = stack[-1]
+        constructors = parent[0]
+        if constructors is _ALTERNATIVES:
+            texts: List[str] = []
+            parser.CharacterDataHandler = texts.append
+            push([_NO_CHILDREN, texts, _ALTERNATIVE])
+            return
+        children: List[Any] = []
+        node = constructors[name](attributes, children)
+        parent[1].append(node)
+        push([frame_children(name, _NO_CHILDREN), children, node if parent[2] is _LAYOUT else None])
+
+    def layout_end(name: str) -> None:
+        frame = pop()
+        closing = frame[2]
+        if closing is None:
+            return
+        if closing is _ALTERNATIVE:
+            parser.CharacterDataHandler = None
+            texts = frame[1]
+            stack[-1][1].append(Alternative(_assert_str("".join(texts) if texts else None)))
+        elif closing is _LAYOUT:
+            parser.StartElementHandler = start
+            parser.EndElementHandler = end
+            parser.CharacterDataHandler = tree.data
+            end(name)
+        elif on_page is not None:
+            on_page(closing)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = tree.data
+    parse(parser)
+    root: Element = tree.close()
+    tags = _tags_of(root.tag)
+    children = _extract_unique_child_name_to_child(root)
+    description = Description.from_xml(_get_tag(root.tag, children, tags.DESCRIPTION))
+    if tags.LAYOUT not in children:
+        raise _Fallback()  # no Layout, or a Layout in another namespace than the root
+    return Alto(description, Layout(pages))
+
+
+def _build_or_fallback(
+    parse: Callable[[Any], None], fallback: Callable[[], Element], on_page: Optional[Callable[[Page], None]]
+) -> Alto:
+    if on_page is None:
+        try:
+            return _build(parse)
+        except (_Fallback, KeyError, ValueError, TypeError, expat.ExpatError):
+            # The document is parsed again through an element tree, which raises the usual error, if any.
+            return Alto.from_xml(fallback())
+    report = on_page
+    nb_reported = 0
+
+    def on_built_page(page: Page) -> None:
+        nonlocal nb_reported
+        nb_reported += 1
+        report(page)
+
+    try:
+        return _build(parse, on_built_page)
+    except (_Fallback, KeyError, ValueError, TypeError, expat.ExpatError):
+        # Pages reported before the fallback are built again identically, and are not reported twice.
+        nb_skipped = nb_reported
+
+        def on_rebuilt_page(page: Page) -> None:
+            nonlocal nb_skipped
+            if nb_skipped:
+                nb_skipped -= 1
+            else:
+                report(page)
+
+        return _alto_from_decoders(fallback(), _DECODERS, on_rebuilt_page)
+
+
+def build_from_file(filename: str, on_page: Optional[Callable[[Page], None]] = None) -> Alto:
+    """
+    Alto constructor from xml file, building nodes from expat events.
+
+    Nodes are built as their tags are read, so the element tree of the document never exists in memory.
+    Invalid documents are parsed again through ElementTree, so errors are the same as with the 'etree' backend.
+
+    The peak of memory of a parse is about a third of the one of the 'etree' backend, but parse time is about
+    the same, within 20% either way depending on the machine and the document: expat calls two Python handlers
+    per element, which costs about as much as the element tree ElementTree builds in C and that the 'etree'
+    backend then walks once. Both are measured by `python -m alto.benchmark`.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    on_page: Optional[Callable[[Page], None]]
+        called with each page as soon as it is built, in document order
+    """
+
+    def parse(parser: Any) -> None:
+        with open(filename, "rb") as file_:
+            parser.ParseFile(file_)
+
+    return _build_or_fallback(parse, lambda: parse_xml_file(filename), on_page)
+
+
+def build_from_string(xml_str: str, on_page: Optional[Callable[[Page], None]] = None) -> Alto:
+    """
+    Alto constructor from xml string, building nodes from expat events, see `build_from_file`.
+
+    Parameters
+    ----------
+    xml_str: str
+        xml alto string
+    on_page: Optional[Callable[[Page], None]]
+        called with each page as soon as it is built, in document order
+    """
+    return _build_or_fallback(lambda parser: parser.Parse(xml_str, True), lambda: parse_xml_string(xml_str), on_page)
+
+
+def build_from_bytes(data: bytes, on_page: Optional[Callable[[Page], None]] = None) -> Alto:
+    """
+    Alto constructor from the content of an xml file, building nodes from expat events, see `build_from_file`.
+
+    Parameters
+    ----------
+    data: bytes
+        xml document, its encoding being read from its declaration
+    on_page: Optional[Callable[[Page], None]]
+        called with each page as soon as it is built, in document order
+    """
+    return _build_or_fallback(lambda parser: parser.Parse(data, True), lambda: parse_xml_bytes(data), on_page)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""Conversion of alto objects to json compatible dicts, as whole documents or as one record per element."""
+
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from alto import (
+    _NODE_SPECS,
+    SP,
+    Alternative,
+    Alto,
+    Description,
+    Layout,
+    SpatialLevel,
+    String,
+    TextBlock,
+    TextLine,
+)
+
+Converter = Callable[[Any], Dict[str, Any]]
+
+
+def _build_converter(cls: Type, converters: Dict[Type, Converter], children_field: Optional[str] = None) -> Converter:
+    # Generated for each class, so that a node is converted with attribute reads and a single dict
+    # display, instead of the field introspection and deep copies of dataclasses.asdict.
+    items = []
+    for name in cls.__dataclass_fields__:
+        if name == children_field:
+            items.append(f"{name!r}: [converters[child.__class__](child) for child in node.{name}]")
+        elif name in _NODE_FIELDS:
+            items.append(f"{name!r}: converters[node.{name}.__class__](node.{name})")
+        else:
+            items.append(f"{name!r}: node.{name}")
+    name = f"_{cls.__name__}_to_dict"
+    source = f"def {name}(node):\n    return {{{', '.join(items)}}}\n"
+    namespace: Dict[str, Any] = {"converters": converters}
+    exec(compile(source, f"<alto {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+# fields holding a single node rather than a value or a list of nodes
+_NODE_FIELDS = ("description", "layout")
+
+
+def _build_converters() -> Dict[Type, Converter]:
+    converters: Dict[Type, Converter] = {}
+    children_fields = {spec.cls: list(spec.cls.__dataclass_fields__)[-1] for spec in _NODE_SPECS if spec.load_child}
+    children_fields[Layout] = "pages"
+    for cls in (Description, Alternative, SP, *children_fields, Alto):
+        converters[cls] = _build_converter(cls, converters, children_fields.get(cls))
+    return converters
+
+
+_CONVERTERS = _build_converters()
+
+
+def to_dict(alto: Alto) -> Dict[str, Any]:
+    """
+    Converts a document to nested dicts and lists, with the same output as `dataclasses.asdict`, about 7 times
+    faster.
+
+    Parameters
+    ----------
+    alto: Alto
+        document to convert
+    """
+    return _CONVERTERS[Alto](alto)
+
+
+def to_json(alto: Alto, indent: Optional[int] = None) -> str:
+    """
+    Serializes a document to json, see `to_dict`. Non ascii characters are escaped, as with `json.dumps`.
+
+    This is about 3 times faster than `json.dumps(dataclasses.asdict(alto))`, not more: `json.dumps` itself takes
+    about three quarters of the time, which bounds the speedup at about 4 times. Encoders writing json text from
+    the nodes in Python do not run much faster than `json.dumps` on the dicts.
+
+    Parameters
+    ----------
+    alto: Alto
+        document to serialize
+    indent: Optional[int]
+        indentation of the output, compact if None
+    """
+    return json.dumps(_CONVERTERS[Alto](alto), indent=indent)
+
+
+def _confidence(strings: List[String]) -> Optional[float]:
+    return sum(string.confidence for string in strings) / len(strings) if strings else None
+
+
+def _line_strings(line: TextLine) -> List[String]:
+    return [string for string in line.strings if isinstance(string, String)]
+
+
+def _geometry(element: Any) -> Dict[str, Any]:
+    return {
+        "id": element.id,
+        "hpos": element.hpos,
+        "vpos": element.vpos,
+        "width": element.width,
+        "height": element.height,
+    }
+
+
+def _block_record(block: TextBlock) -> Dict[str, Any]:
+    strings = [string for line in block.text_lines for string in _line_strings(line)]
+    return {
+        **_geometry(block),
+        "content": "\n".join(" ".join(string.content for string in _line_strings(line)) for line in block.text_lines),
+        "confidence": _confidence(strings),
+    }
+
+
+def _line_record(line: TextLine) -> Dict[str, Any]:
+    strings = _line_strings(line)
+    return {
+        **_geometry(line),
+        "content": " ".join(string.content for string in strings),
+        "confidence": _confidence(strings),
+    }
+
+
+def _string_record(string: String) -> Dict[str, Any]:
+    return {
+        **_geometry(string),
+        "content": string.content,
+        "confidence": string.confidence,
+        "alternatives": [alternative.content for alternative in string.alternatives],
+    }
+
+
+def iter_records(alto: Alto, level: SpatialLevel = 'String') -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over the elements of a level as flat records, in document order.
+
+    Each record has the id, position, size, content and confidence of the element, TextLine and
+    TextBlock records having the mean confidence of their strings, and the ids of its ancestors.
+
+    Parameters
+    ----------
+    alto: Alto
+        document to export
+    level: Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]
+        level of the exported elements
+    """
+    if level not in ('String', 'TextLine', 'TextBlock'):
+        raise NotImplementedError(f'Not implemented for value {level}')
+    for page in alto.layout.pages:
+        for print_space in page.print_spaces:
+            for composed_block in print_space.composed_blocks:
+                for text_block in composed_block.text_blocks:
+                    ancestors: Dict[str, Optional[str]] = {"page_id": page.id, "composed_block_id": composed_block.id}
+                    if level == 'TextBlock':
+                        yield {**_block_record(text_block), **ancestors}
+                        continue
+                    ancestors["text_block_id"] = text_block.id
+                    for line in text_block.text_lines:
+                        if level == 'TextLine':
+                            yield {**_line_record(line), **ancestors}
+                            continue
+                        line_ancestors = {**ancestors, "text_line_id": line.id}
+                        for string in _line_strings(line):
+                            yield {**_string_record(string), **line_ancestors}
+
+
+def iter_ndjson(alto: Alto, level: SpatialLevel = 'String') -> Iterator[str]:
+    """
+    Iterates over the elements of a level as newline terminated json records, see `iter_records`.
+
+    Parameters
+    ----------
+    alto: Alto
+        document to export
+    level: Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]
+        level of the exported elements
+    """
+    for record in iter_records(alto, level):
+        yield json.dumps(record) + "\n"
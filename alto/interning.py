@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Sharing of the repeated attribute values of parsed documents, to reduce the memory held by many documents."""
+
+from typing import Any, Callable, Dict, Type
+from xml.etree.ElementTree import Element
+
+from alto import _NAMESPACES, Alto, Decoder, _alto_from_decoders, _build_decoders
+
+
+class _Values(dict):
+    # Maps raw attribute values to their converted value. Lookups of known values are plain dict lookups. Unknown
+    # values are converted and kept as candidates, and are added to the table the second time they are seen, while
+    # it has room, so that values seen once, such as most ids, do not take the room of the frequent ones. The
+    # candidates are at most max_size, and are dropped together when full.
+    def __init__(self, convert: Callable[[str], Any], max_size: int) -> None:
+        super().__init__()
+        self._convert = convert
+        self._max_size = max_size
+        self._candidates: Dict[str, Any] = {}
+
+    def __missing__(self, raw: str) -> Any:
+        if len(self) >= self._max_size:
+            return self._convert(raw)
+        value = self._candidates.pop(raw, None)
+        if value is not None:
+            self[raw] = value
+            return value
+        value = self._convert(raw)
+        if len(self._candidates) >= self._max_size:
+            self._candidates.clear()
+        self._candidates[raw] = value
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self._candidates.clear()
+
+
+class InternTable:
+    """
+    Bounded table of the attribute values shared between the nodes built by the parses using it.
+
+    Parsing with a table, see `alto.parse_file`, gives equal attribute values, such as the contents of frequent
+    words, ids, which repeat from one document to the other, and coordinates, a single object. Values are read
+    from the table with a dict lookup, which also saves the conversion of numbers already seen. Values are added the
+    second time they are seen, among the last `max_size` values seen once, so that unique values, such as most ids,
+    do not fill the table, until it holds `max_size` values of their type, str, float or int, after which unknown
+    values are converted as usual. A table can be shared by the parses of many documents, in a single thread.
+
+    Parameters
+    ----------
+    max_size: int
+        maximum number of values of each type kept in the table
+    """
+
+    def __init__(self, max_size: int = 1 << 20) -> None:
+        if max_size < 0:
+            raise ValueError(f"Expecting max_size to be non negative, got {max_size}")
+        self.max_size = max_size
+        self._values: Dict[Type, _Values] = {type_: _Values(type_, max_size) for type_ in (str, float, int)}
+        interners = {type_: values.__getitem__ for type_, values in self._values.items()}
+        self._decoders: Dict[str, Dict[Type, Decoder]] = {
+            namespace: _build_decoders(namespace, interners=interners) for namespace in _NAMESPACES
+        }
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._values.values())
+
+    def clear(self) -> None:
+        """Drops the values of the table, nodes already built keep sharing theirs."""
+        for values in self._values.values():
+            values.clear()
+
+
+def from_xml(element: Element, intern_table: InternTable) -> Alto:
+    """
+    Alto constructor from the root element of a document, sharing attribute values through a table.
+
+    Parameters
+    ----------
+    element: Element
+        root element of the document
+    intern_table: InternTable
+        table of the shared values
+    """
+    return _alto_from_decoders(element, intern_table._decoders)
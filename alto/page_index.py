@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""Random access to the pages of an alto file through a byte offset index."""
+
+import json
+import mmap
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+from alto import Description, Page
+
+_INDEX_VERSION = 1
+_INDEX_SUFFIX = ".pageidx"
+# Tags may have a namespace prefix. Tags in comments are skipped when looking for the root element
+# only, so comments and CDATA sections inside the document must not contain Page or Description tags.
+_START_TAG = re.compile(rb"<([\w.-]+(?::[\w.-]+)?)(?=[\s/>])")
+_PAGE_OR_DESCRIPTION_TAG = re.compile(rb"<(/?)(?:[\w.-]+:)?(Page|Description)(?=[\s/>])")
+_QUOTE = re.compile(rb"[\"']")
+
+Span = Tuple[int, int]
+
+
+@dataclass
+class PageIndex:
+    """
+    Byte offsets of the elements of an alto file.
+
+    Parameters
+    ----------
+    size: int
+        size of the indexed file
+    mtime_ns: int
+        modification time of the indexed file
+    prolog_end: int
+        offset of the end of the start tag of the root element
+    root_name: str
+        qualified name of the root element
+    description: Optional[Tuple[int, int]]
+        start and end offsets of the Description element
+    pages: List[Tuple[int, int]]
+        start and end offsets of each Page element
+    """
+
+    size: int
+    mtime_ns: int
+    prolog_end: int
+    root_name: str
+    description: Optional[Span]
+    pages: List[Span]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "prolog_end": self.prolog_end,
+            "root_name": self.root_name,
+            "description": list(self.description) if self.description else None,
+            "pages": [list(span) for span in self.pages],
+        }
+
+    @classmethod
+    def from_dict(cls, dict_: Dict[str, Any]) -> "PageIndex":
+        if dict_.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Expecting page index version {_INDEX_VERSION}, got {dict_.get('version')}")
+        description = dict_["description"]
+        return cls(
+            size=dict_["size"],
+            mtime_ns=dict_["mtime_ns"],
+            prolog_end=dict_["prolog_end"],
+            root_name=dict_["root_name"],
+            description=(description[0], description[1]) if description else None,
+            pages=[(start, end) for start, end in dict_["pages"]],
+        )
+
+
+def _end_of_tag(data: mmap.mmap, start: int) -> int:
+    # attribute values may contain ">", quoted values before the first ">" are skipped
+    position = start
+    while True:
+        end = data.find(b">", position)
+        if end == -1:
+            raise ValueError(f"Error when parsing XML: unterminated tag at byte {start}")
+        quote = _QUOTE.search(data, position, end)
+        if quote is None:
+            return end + 1
+        position = data.find(quote.group(), quote.end()) + 1
+        if position == 0:
+            raise ValueError(f"Error when parsing XML: unterminated tag at byte {start}")
+
+
+def _find_root(data: mmap.mmap) -> "re.Match[bytes]":
+    for match in _START_TAG.finditer(data):
+        if data.rfind(b"<!--", 0, match.start()) <= data.rfind(b"-->", 0, match.start()):
+            return match
+    raise ValueError("Error when parsing XML: no root element found")
+
+
+def _scan(data: mmap.mmap) -> Tuple[int, str, Optional[Span], List[Span]]:
+    root = _find_root(data)
+    prolog_end = _end_of_tag(data, root.start())
+    description: Optional[Span] = None
+    pages: List[Span] = []
+    starts: Dict[bytes, Optional[int]] = {b"Page": None, b"Description": None}
+    for match in _PAGE_OR_DESCRIPTION_TAG.finditer(data, prolog_end):
+        closing, name = match.group(1), match.group(2)
+        tag_end = _end_of_tag(data, match.start())
+        start = starts[name]
+        if closing:
+            if start is None:
+                raise ValueError(
+                    f"Error when parsing XML: unexpected closing tag {name.decode()} at byte {match.start()}"
+                )
+            span = (start, tag_end)
+        elif data[tag_end - 2 : tag_end] == b"/>":
+            span = (match.start(), tag_end)
+        else:
+            starts[name] = match.start()
+            continue
+        starts[name] = None
+        if name == b"Page":
+            pages.append(span)
+        elif description is None:
+            description = span
+    return prolog_end, root.group(1).decode(), description, pages
+
+
+def build_page_index(filename: str) -> PageIndex:
+    """
+    Scans an alto file once to find the byte offsets of its Description and Page elements.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to index
+    """
+    stat = os.stat(filename)
+    with open(filename, "rb") as file_:
+        if stat.st_size == 0:
+            raise ValueError(f"Error when parsing XML: empty file {filename}")
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            prolog_end, root_name, description, pages = _scan(data)
+    return PageIndex(stat.st_size, stat.st_mtime_ns, prolog_end, root_name, description, pages)
+
+
+def _load_sidecar(filename: str, index_filename: str) -> Optional[PageIndex]:
+    try:
+        with open(index_filename) as file_:
+            index = PageIndex.from_dict(json.load(file_))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    stat = os.stat(filename)
+    if (index.size, index.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        return None
+    return index
+
+
+def _dump_sidecar(index: PageIndex, index_filename: str) -> None:
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(index_filename) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w") as file_:
+            json.dump(index.to_dict(), file_)
+        os.replace(tmp_path, index_filename)  # atomic, concurrent readers never see partial indexes
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class AltoFile:
+    """
+    Alto file whose pages are parsed individually, on demand.
+
+    Only the bytes of the requested page are read and parsed, so that the cost of accessing a page
+    does not depend on the size of the document. Use `AltoFile.open` to build instances.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the alto file
+    index: PageIndex
+        byte offsets of the elements of the file
+    """
+
+    def __init__(self, filename: str, index: PageIndex) -> None:
+        self.filename = filename
+        self.index = index
+        with open(filename, "rb") as file_:
+            self._prolog = file_.read(index.prolog_end)
+        self._epilog = f"</{index.root_name}>".encode()
+
+    @classmethod
+    def open(cls, filename: str, sidecar: bool = False) -> "AltoFile":
+        """
+        Indexes an alto file.
+
+        Parameters
+        ----------
+        filename: str
+            filename of the file to load
+        sidecar: bool
+            if True, the index is read from `<filename>.pageidx` when it is up to date with the file,
+            and written there otherwise
+        """
+        index_filename = filename + _INDEX_SUFFIX
+        index = _load_sidecar(filename, index_filename) if sidecar else None
+        if index is None:
+            index = build_page_index(filename)
+            if sidecar:
+                _dump_sidecar(index, index_filename)
+        return cls(filename, index)
+
+    def __len__(self) -> int:
+        return len(self.index.pages)
+
+    def _parse_span(self, span: Span) -> Element:
+        with open(self.filename, "rb") as file_:
+            file_.seek(span[0])
+            content = file_.read(span[1] - span[0])
+        # The element is wrapped in the root start tag so that namespaces and encoding are preserved.
+        return ElementTree.fromstring(self._prolog + content + self._epilog)[0]
+
+    @property
+    def description(self) -> Description:
+        if self.index.description is None:
+            raise ValueError(f"Error when parsing XML: expecting file {self.filename} to have a Description tag")
+        return Description.from_xml(self._parse_span(self.index.description))
+
+    def page(self, number: int) -> Page:
+        """
+        Parses a single page.
+
+        Parameters
+        ----------
+        number: int
+            index of the page in the document, starting from 0
+        """
+        return Page.from_xml(self._parse_span(self.index.pages[number]))
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+"""Selective parsing of alto files, reading only the parts of the document that are needed."""
+
+import functools
+import mmap
+import os
+import re
+from typing import IO, Collection, Dict, FrozenSet, Iterator, List, Optional, Type
+from xml.etree.ElementTree import Element
+from xml.parsers import expat
+
+from alto import (
+    _NAMESPACES,
+    SP,
+    Alto,
+    ComposedBlock,
+    Decoder,
+    Level,
+    Page,
+    PrintSpace,
+    String,
+    TextBlock,
+    TextLine,
+    _alto_from_decoders,
+    _build_decoders,
+    _Projection,
+)
+
+_READ_CHUNK_SIZE = 1 << 16
+_PROLOG_SIZE = 1024
+_SCAN_REGION_SIZE = 1 << 20
+# Class of the nodes of each level, with the name of the field holding their children.
+_LEVELS = {
+    'Page': (Page, "print_spaces"),
+    'PrintSpace': (PrintSpace, "composed_blocks"),
+    'ComposedBlock': (ComposedBlock, "text_blocks"),
+    'TextBlock': (TextBlock, "text_lines"),
+    'TextLine': (TextLine, "strings"),
+    'String': (String, None),
+}
+_STRING_FIELDS = tuple(String.__dataclass_fields__)
+_SP_FIELDS = frozenset(SP.__dataclass_fields__)
+# qualified names of String elements in expat events, with "}" as namespace separator
+_STRING_NAMES = frozenset(f"{namespace[1:]}String" for namespace in _NAMESPACES)
+# Unprefixed String start tags, which are in the alto namespace of the root element when the document is
+# scannable. Regions of a file are first read with _STRING_CONTENT, which expects double quoted CONTENT
+# values, and checked against the number of _STRING_START matches. Otherwise, tags are read one by one with
+# _STRING_TAG, assuming attribute values do not contain ">", and tags whose attributes do not end with a
+# quote, where a value does, are matched again with _QUOTED_STRING_TAG.
+_STRING_START = re.compile(rb"<String(?=[\s/>])")
+_STRING_CONTENT = re.compile(rb"<String(?=[\s/>])[^>]*\sCONTENT\s*=\s*\"([^\"]*)\"")
+_STRING_TAG = re.compile(rb"<String(?=[\s/>])([^>]*)>")
+_QUOTED_STRING_TAG = re.compile(rb"<String((?:\s+[^\s=/>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*\s*/?)>")
+_ROOT_TAG = re.compile(rb"<(?![?!])[^>]*>")
+_DEFAULT_NAMESPACE = re.compile(rb"\sxmlns\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_ALTO_NAMESPACES = frozenset(namespace[1:-1].encode() for namespace in _NAMESPACES)
+# String elements which may be in another namespace than the one of the root element
+_OTHER_STRINGS = re.compile(rb"<[\w.-]+:String(?=[\s/>])|\sxmlns\s*=")
+_CONTENT_ATTR = re.compile(rb"\sCONTENT\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_ENCODING = re.compile(rb"<\?xml[^>]*?\sencoding\s*=\s*[\"']([\w.-]+)")
+_UTF8_BOM = b"\xef\xbb\xbf"
+_UTF8_ENCODINGS = (b"utf-8", b"utf8", b"us-ascii", b"ascii")
+_REFERENCE = re.compile(r"&(?:#x([0-9a-fA-F]+);|#([0-9]+);|(lt|gt|amp|quot|apos);)?")
+_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": '"', "apos": "'"}
+_WHITESPACES = str.maketrans("\t\n\r", "   ")
+
+
+def _projection(fields: Optional[FrozenSet[str]], level: Level) -> _Projection:
+    if level not in _LEVELS:
+        raise NotImplementedError(f'Not implemented for value {level}')
+    skipped_fields: Dict[Type, FrozenSet[str]] = {}
+    cls, children_field = _LEVELS[level]
+    if children_field is not None:
+        skipped_fields[cls] = frozenset((children_field,))
+    if fields is None:
+        return _Projection(skipped_fields, frozenset())
+    unknown = fields.difference(_STRING_FIELDS)
+    if unknown:
+        raise ValueError(f"Expecting fields among {list(_STRING_FIELDS)}, got {sorted(unknown)}")
+    skipped_fields[String] = frozenset(_STRING_FIELDS).difference(fields)
+    return _Projection(skipped_fields, frozenset() if _SP_FIELDS <= fields else frozenset((SP,)))
+
+
+@functools.lru_cache(maxsize=64)
+def _projected_decoders(fields: Optional[FrozenSet[str]], level: Level) -> Dict[str, Dict[Type, Decoder]]:
+    projection = _projection(fields, level)
+    return {namespace: _build_decoders(namespace, projection) for namespace in _NAMESPACES}
+
+
+def from_xml(element: Element, fields: Optional[Collection[str]] = None, level: Level = 'String') -> Alto:
+    """
+    Alto constructor from the root element of a document, skipping what is not requested.
+
+    Nodes below `level` are not built. If `fields` is given, fields of String nodes that are not
+    listed are left to None, or to an empty list for alternatives, and SP nodes are left out of
+    text lines unless all their fields, width, hpos and vpos, are requested. Other nodes are read
+    as usual.
+
+    Parameters
+    ----------
+    element: Element
+        root element of the document
+    fields: Optional[Collection[str]]
+        names of the String fields to read, such as ['content'], all of them if None
+    level: Literal['Page', 'PrintSpace', 'ComposedBlock', 'TextBlock', 'TextLine', 'String']
+        deepest level of the built nodes
+    """
+    return _alto_from_decoders(element, _projected_decoders(frozenset(fields) if fields is not None else None, level))
+
+
+def _resolve_reference(match: "re.Match[str]") -> str:
+    hexadecimal, decimal, name = match.groups()
+    if hexadecimal is not None:
+        return chr(int(hexadecimal, 16))
+    if decimal is not None:
+        return chr(int(decimal))
+    if name is not None:
+        return _ENTITIES[name]
+    raise ValueError(f"Error when parsing XML: invalid reference in attribute value {match.string!r}")
+
+
+def _has_special_characters(text: str) -> bool:
+    return "&" in text or "\t" in text or "\n" in text or "\r" in text
+
+
+def _normalize_attribute(text: str) -> str:
+    # same normalization as xml parsers: literal whitespaces become spaces, then references are resolved
+    return _REFERENCE.sub(_resolve_reference, text.replace("\r\n", " ").translate(_WHITESPACES))
+
+
+def _is_scannable(data: mmap.mmap) -> bool:
+    if data.find(b"<!") != -1:
+        return False
+    head = data[:_PROLOG_SIZE]
+    offset = len(_UTF8_BOM) if head.startswith(_UTF8_BOM) else 0
+    head = head[offset:]
+    if not head.startswith(b"<"):
+        return False
+    declaration = _ENCODING.match(head)
+    if declaration is not None and declaration.group(1).lower() not in _UTF8_ENCODINGS:
+        return False
+    # the scan reads unprefixed String tags, which must be exactly the String elements of an alto namespace
+    root = _ROOT_TAG.search(head)
+    if root is None:
+        return False
+    namespace = _DEFAULT_NAMESPACE.search(root.group())
+    if namespace is None or (namespace.group(1) or namespace.group(2) or b"") not in _ALTO_NAMESPACES:
+        return False
+    return _OTHER_STRINGS.search(data, offset + root.end()) is None
+
+
+def _scan_tags(data: mmap.mmap, position: int, end: int) -> Iterator[str]:
+    search = _STRING_TAG.search
+    while True:
+        match = search(data, position, end)
+        if match is None:
+            return
+        attributes = match.group(1)
+        if attributes.rstrip(b" \t\r\n/")[-1:] not in (b'"', b"'"):
+            # the tag ends inside an attribute value, or has no attributes
+            start = match.start()
+            match = _QUOTED_STRING_TAG.match(data, start, end)
+            if match is None:
+                raise ValueError(f"Error when parsing XML: invalid String tag at byte {start}")
+            attributes = match.group(1)
+        position = match.end()
+        content = _CONTENT_ATTR.search(attributes)
+        if content is None:
+            raise ValueError(
+                f"Error when parsing XML: expecting tag String to have attribute CONTENT at byte {match.start()}"
+            )
+        text = (content.group(1) if content.group(1) is not None else content.group(2)).decode()
+        yield _normalize_attribute(text) if _has_special_characters(text) else text
+
+
+def _decode_values(values: List[bytes]) -> List[str]:
+    if not values:
+        return []
+    text = b"\0".join(values).decode()  # NUL cannot appear in xml documents
+    words = text.split("\0")
+    if _has_special_characters(text):
+        return [_normalize_attribute(word) if _has_special_characters(word) else word for word in words]
+    return words
+
+
+def _scan_words(data: mmap.mmap) -> Iterator[str]:
+    # The file is scanned by regions ending before a "<", which cannot appear in attribute values, so that no
+    # tag spans two regions. The contents of a region are read with a single regex, unless its String tags
+    # are not all matched, for instance when a value contains ">", in which case tags are read one by one.
+    position, size = 0, len(data)
+    while position < size:
+        end = data.find(b"<", position + _SCAN_REGION_SIZE)
+        if end == -1:
+            end = size
+        contents = _STRING_CONTENT.findall(data, position, end)
+        if len(contents) == len(_STRING_START.findall(data, position, end)):
+            yield from _decode_values(contents)
+        else:
+            yield from _scan_tags(data, position, end)
+        position = end
+
+
+def _parse_words(file_: IO[bytes]) -> Iterator[str]:
+    words: List[str] = []
+    append = words.append
+
+    def start(name: str, attributes: Dict[str, str]) -> None:
+        if name in _STRING_NAMES:
+            content = attributes.get("CONTENT")
+            if content is None:
+                raise ValueError(
+                    f"Error when parsing XML: expecting tag {{{name} to have attribute CONTENT. "
+                    f"Available attributes: {list(attributes)}"
+                )
+            append(content)
+
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.StartElementHandler = start
+    for chunk in iter(lambda: file_.read(_READ_CHUNK_SIZE), b""):
+        parser.Parse(chunk, False)
+        yield from words
+        words.clear()
+    parser.Parse(b"", True)
+
+
+def iter_words(filename: str) -> Iterator[str]:
+    """
+    Iterates over the content of the String elements of an alto file, in document order.
+
+    This gives the same words as `Alto.extract_words`, several times faster, as no node is built. The
+    file is memory mapped and String start tags are found by a scan of its bytes, so that memory does
+    not grow with the size of the file. The document is not checked to be well formed. Documents with
+    comments, CDATA sections, a doctype, in another encoding than UTF-8, or where String elements may be
+    in another namespace than the alto namespace declared by default on the root element, such as prefixed
+    String elements, are read with expat instead.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to read
+    """
+    with open(filename, "rb") as file_:
+        if os.fstat(file_.fileno()).st_size == 0:
+            raise ValueError(f"Error when parsing XML: empty file {filename}")
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _is_scannable(data):
+                yield from _scan_words(data)
+                return
+        yield from _parse_words(file_)
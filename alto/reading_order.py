@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Reading order of the elements of a page, reconstructed from their geometry, backed by numpy."""
+
+from typing import Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("alto.reading_order requires numpy, install it with `pip install alto-xml[numpy]`") from exc
+
+from alto import Page, SpatialLevel, String, TextBlock, TextLine
+
+
+def _boxes(elements: Sequence[Any]) -> np.ndarray:
+    boxes = np.array([(elt.hpos, elt.vpos, elt.width, elt.height) for elt in elements], dtype=np.float64).reshape(
+        len(elements), 4
+    )
+    boxes[:, 2:] += boxes[:, :2]
+    return boxes
+
+
+def _gaps(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Sorts intervals by start and returns the gaps left uncovered before each of them but the first.
+    order = np.argsort(starts, kind="stable")
+    return order, starts[order[1:]] - np.maximum.accumulate(ends[order[:-1]])
+
+
+def _has_columns(x0: np.ndarray, x1: np.ndarray) -> bool:
+    return len(x0) > 1 and bool(_gaps(x0, x1)[1].max() > 0)
+
+
+def _merge_columns(strips: List[np.ndarray], x0: np.ndarray, x1: np.ndarray) -> List[np.ndarray]:
+    # Merges runs of consecutive strips with columns, unless the merged group could not be split again.
+    res: List[np.ndarray] = []
+    run: List[np.ndarray] = []
+    for strip in strips:
+        if _has_columns(x0[strip], x1[strip]):
+            run.append(strip)
+            continue
+        if run:
+            res.append(np.concatenate(run))
+            run = []
+        res.append(strip)
+    if run:
+        res.append(np.concatenate(run))
+    if len(res) == 1 and not _has_columns(x0[res[0]], x1[res[0]]):
+        return strips
+    return res
+
+
+def xy_cut(boxes: np.ndarray) -> np.ndarray:
+    """
+    Reading order of boxes, by recursive XY-cut.
+
+    Boxes are split into columns at the widest vertical bands that no box overlaps, read left to right. Groups
+    without columns are split into strips at all horizontal bands that no box overlaps, read top to bottom,
+    and consecutive strips that both have columns are kept together, so that columns below a full width
+    title are read one after the other even if their paragraphs are aligned. Boxes that cannot be split are
+    read by top, then left, coordinate. Each split sorts the boxes of a group, so ordering n boxes costs
+    O(n log n) operations per level of nesting of the layout.
+
+    Parameters
+    ----------
+    boxes: np.ndarray
+        float array of shape (n, 4), with the (x0, y0, x1, y1) coordinates of each box
+
+    Returns
+    -------
+    np.ndarray
+        int64 array of box indices, in reading order
+    """
+    x0, y0, x1, y1 = (np.ascontiguousarray(boxes[:, i], dtype=np.float64) for i in range(4))
+    res: List[np.ndarray] = []
+    stack = [np.arange(len(boxes), dtype=np.int64)]
+    while stack:
+        group = stack.pop()
+        if len(group) < 2:
+            res.append(group)
+            continue
+        order, gaps = _gaps(x0[group], x1[group])
+        widest = gaps.max()
+        if widest > 0:
+            parts = np.split(group[order], np.flatnonzero(gaps == widest) + 1)
+        else:
+            order, gaps = _gaps(y0[group], y1[group])
+            cuts = np.flatnonzero(gaps > 0) + 1
+            if not len(cuts):
+                res.append(group[np.lexsort((x0[group], y0[group]))])
+                continue
+            parts = _merge_columns(np.split(group[order], cuts), x0, x1)
+        # parts are pushed in reverse so that the first one is read first
+        stack.extend(reversed(parts))
+    return np.concatenate(res) if res else np.empty(0, dtype=np.int64)
+
+
+def page_reading_order(page: Page, level: SpatialLevel = 'String') -> List[Any]:
+    """
+    Elements of a page in reading order, reconstructed from their geometry rather than document order.
+
+    Text blocks are ordered with `xy_cut`, so that multi-column pages are read column by column. Lines of
+    each block are ordered the same way, so that blocks spanning several columns are read correctly, and
+    strings are sorted by horizontal position within their line.
+
+    Parameters
+    ----------
+    page: Page
+        page whose elements are ordered
+    level: Union[Literal['String'], Literal['TextLine'], Literal['TextBlock']]
+        level of the returned elements
+
+    Returns
+    -------
+    List[Union[String, TextLine, TextBlock]]
+        elements of the page of the required level, in reading order
+    """
+    if level not in ('String', 'TextLine', 'TextBlock'):
+        raise NotImplementedError(f'Not implemented for value {level}')
+    text_blocks = list(page.iter_text_blocks())
+    blocks: List[TextBlock] = [text_blocks[index] for index in xy_cut(_boxes(text_blocks))]
+    if level == 'TextBlock':
+        return blocks
+    lines: List[TextLine] = []
+    for block in blocks:
+        text_lines = block.text_lines
+        if len(text_lines) < 2:
+            lines.extend(text_lines)
+        else:
+            lines.extend(text_lines[index] for index in xy_cut(_boxes(text_lines)))
+    if level == 'TextLine':
+        return lines
+    strings: List[String] = []
+    line_ranks: List[int] = []
+    for rank, line in enumerate(lines):
+        nb_strings = len(strings)
+        strings.extend(string for string in line.strings if isinstance(string, String))
+        line_ranks.extend([rank] * (len(strings) - nb_strings))
+    hpos = np.fromiter((string.hpos for string in strings), dtype=np.float64, count=len(strings))
+    return [strings[index] for index in np.lexsort((hpos, np.asarray(line_ranks, dtype=np.int64)))]
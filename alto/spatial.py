@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""Grid based spatial index for bounding box queries over page elements."""
+
+import math
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+Box = Tuple[float, float, float, float]
+
+_ITEMS_PER_CELL = 4
+
+
+def _point_to_box_distance(x: float, y: float, box: Box) -> float:
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
+
+
+class GridIndex(Generic[T]):
+    """
+    Uniform grid over the bounding boxes of items.
+
+    Each item is registered in every cell its box overlaps. The cell size is chosen so that a cell
+    holds a few items on average and is not smaller than a typical item, so that region queries
+    only visit the cells overlapping the region.
+
+    Parameters
+    ----------
+    items: Sequence[T]
+        indexed items
+    boxes: Sequence[Tuple[float, float, float, float]]
+        bounding box (x0, y0, x1, y1) of each item
+    """
+
+    def __init__(self, items: Sequence[T], boxes: Sequence[Box]) -> None:
+        if len(items) != len(boxes):
+            raise ValueError(f"Expecting as many boxes as items, got {len(boxes)} boxes and {len(items)} items")
+        self._items = list(items)
+        self._boxes = list(boxes)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._extent: Box = (
+            min((box[0] for box in self._boxes), default=0.0),
+            min((box[1] for box in self._boxes), default=0.0),
+            max((box[2] for box in self._boxes), default=0.0),
+            max((box[3] for box in self._boxes), default=0.0),
+        )
+        self._cell_size = self._compute_cell_size()
+        for index, box in enumerate(self._boxes):
+            for cell in self._overlapping_cells(box):
+                self._cells.setdefault(cell, []).append(index)
+        self._cell_bounds = (
+            min((cell[0] for cell in self._cells), default=0),
+            min((cell[1] for cell in self._cells), default=0),
+            max((cell[0] for cell in self._cells), default=0),
+            max((cell[1] for cell in self._cells), default=0),
+        )
+
+    def _compute_cell_size(self) -> float:
+        if not self._boxes:
+            return 1.0
+        x0, y0, x1, y1 = self._extent
+        mean_size = sum(max(box[2] - box[0], box[3] - box[1]) for box in self._boxes) / len(self._boxes)
+        density_size = math.sqrt(max(x1 - x0, 1.0) * max(y1 - y0, 1.0) * _ITEMS_PER_CELL / len(self._boxes))
+        return max(mean_size, density_size, 1.0)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def _clamped_cell(self, x: float, y: float) -> Tuple[int, int]:
+        # cells outside of the extent of the boxes are empty, and infinite bounds have no cell
+        ex0, ey0, ex1, ey1 = self._extent
+        return self._cell(min(max(x, ex0), ex1), min(max(y, ey0), ey1))
+
+    def _overlapping_cells(self, box: Box) -> List[Tuple[int, int]]:
+        cx0, cy0 = self._cell(box[0], box[1])
+        cx1, cy1 = self._cell(box[2], box[3])
+        return [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def query(self, x0: float, y0: float, x1: float, y1: float, contained: bool = False) -> List[T]:
+        """
+        Items whose box intersects the region, or lies inside it if `contained` is True.
+
+        Returns:
+            List[T]: matching items, in the order they were indexed
+        """
+        if math.isnan(x0) or math.isnan(y0) or math.isnan(x1) or math.isnan(y1):
+            return []  # no box intersects nor lies inside an undefined region
+        candidates: Set[int] = set()
+        cx0, cy0 = self._clamped_cell(x0, y0)
+        cx1, cy1 = self._clamped_cell(x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            candidates.update(range(len(self._items)))
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    candidates.update(self._cells.get((cx, cy), ()))
+        res: List[T] = []
+        for index in sorted(candidates):
+            bx0, by0, bx1, by1 = self._boxes[index]
+            if contained:
+                match = x0 <= bx0 and bx1 <= x1 and y0 <= by0 and by1 <= y1
+            else:
+                match = bx0 <= x1 and x0 <= bx1 and by0 <= y1 and y0 <= by1
+            if match:
+                res.append(self._items[index])
+        return res
+
+    def nearest(self, x: float, y: float) -> Optional[T]:
+        """
+        Item whose box is the closest to the point, boxes containing the point being at distance 0.
+        Ties are broken by indexing order.
+
+        Returns:
+            Optional[T]: closest item, None if the index is empty
+        """
+        if not self._cells:
+            return None
+        cx0, cy0, cx1, cy1 = self._cell_bounds
+        best: Optional[Tuple[float, int]] = None
+        cx, cy = self._cell(x, y) if math.isfinite(x) and math.isfinite(y) else (cx1 + 1, cy1 + 1)
+        if not (cx0 <= cx <= cx1 and cy0 <= cy <= cy1):
+            # rings around a point far from the grid, or at infinity, would mostly visit empty cells
+            for index, box in enumerate(self._boxes):
+                candidate = (_point_to_box_distance(x, y, box), index)
+                if best is None or candidate < best:
+                    best = candidate
+            return self._items[best[1]] if best is not None else None
+        max_radius = max(cx - cx0, cx1 - cx, cy - cy0, cy1 - cy)
+        for radius in range(max_radius + 1):
+            for cell in self._ring(cx, cy, radius):
+                for index in self._cells.get(cell, ()):
+                    candidate = (_point_to_box_distance(x, y, self._boxes[index]), index)
+                    if best is None or candidate < best:
+                        best = candidate
+            # items in cells outside the ring are at least radius cells away from the point
+            if best is not None and best[0] < radius * self._cell_size:
+                break
+        return self._items[best[1]] if best is not None else None
+
+    @staticmethod
+    def _ring(cx: int, cy: int, radius: int) -> List[Tuple[int, int]]:
+        if radius == 0:
+            return [(cx, cy)]
+        cells = [(cx + dx, cy + dy) for dx in range(-radius, radius + 1) for dy in (-radius, radius)]
+        cells += [(cx + dx, cy + dy) for dx in (-radius, radius) for dy in range(-radius + 1, radius)]
+        return cells
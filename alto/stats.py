@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""Instrumented parsing, reporting where the time goes for each document."""
+
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from alto import SP, Alto, Page, String, _alto_from_decoders
+from alto.backends import Backend, parse_xml_bytes, parse_xml_string
+
+
+@dataclass
+class ParseStats:
+    """
+    Statistics of a parse, filled by `parse_file` and `parse` when passed as their `stats` argument.
+
+    Each parse overwrites the statistics of the previous one, use one instance per document to keep them.
+    With the 'expat' backend, tokenizing and building are interleaved and are both counted in `build_time`.
+
+    Parameters
+    ----------
+    trace_memory: bool
+        if True, the peak of memory allocated by the parse is measured with tracemalloc, which slows it down
+    on_page: Optional[Callable[[Page], None]]
+        called with each page of the document as soon as it is built, in document order, before the next pages
+        are built; the time spent in it is counted in `build_time`, and in `peak_memory` if traced
+    filename: Optional[str]
+        filename of the parsed file, None for strings
+    bytes_read: int
+        size of the parsed file, 0 for strings
+    read_time: float
+        time spent reading the file, in seconds
+    tokenize_time: float
+        time spent parsing xml into elements, in seconds
+    build_time: float
+        time spent building alto objects, in seconds
+    element_counts: Dict[str, int]
+        number of built nodes of each tag, such as 'Page', 'TextLine', 'String' or 'SP'
+    peak_memory: Optional[int]
+        peak of memory allocated during the parse, in bytes, if `trace_memory` is True
+    """
+
+    trace_memory: bool = False
+    on_page: Optional[Callable[[Page], None]] = None
+    filename: Optional[str] = None
+    bytes_read: int = 0
+    read_time: float = 0.0
+    tokenize_time: float = 0.0
+    build_time: float = 0.0
+    element_counts: Dict[str, int] = field(default_factory=dict)
+    peak_memory: Optional[int] = None
+
+    @property
+    def total_time(self) -> float:
+        return self.read_time + self.tokenize_time + self.build_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "bytes_read": self.bytes_read,
+            "read_time": self.read_time,
+            "tokenize_time": self.tokenize_time,
+            "build_time": self.build_time,
+            "total_time": self.total_time,
+            "element_counts": dict(self.element_counts),
+            "peak_memory": self.peak_memory,
+        }
+
+
+def _count_elements(alto: Alto) -> Dict[str, int]:
+    counts = {
+        "Page": 0,
+        "PrintSpace": 0,
+        "ComposedBlock": 0,
+        "TextBlock": 0,
+        "TextLine": 0,
+        "String": 0,
+        "SP": 0,
+        "ALTERNATIVE": 0,
+    }
+    for page in alto.layout.pages:
+        counts["Page"] += 1
+        counts["PrintSpace"] += len(page.print_spaces)
+        for print_space in page.print_spaces:
+            counts["ComposedBlock"] += len(print_space.composed_blocks)
+            for composed_block in print_space.composed_blocks:
+                counts["TextBlock"] += len(composed_block.text_blocks)
+                for text_block in composed_block.text_blocks:
+                    counts["TextLine"] += len(text_block.text_lines)
+                    for line in text_block.text_lines:
+                        for string in line.strings:
+                            if isinstance(string, String):
+                                counts["String"] += 1
+                                counts["ALTERNATIVE"] += len(string.alternatives)
+                            elif isinstance(string, SP):
+                                counts["SP"] += 1
+    return counts
+
+
+def _parse(data: Any, backend: Backend, stats: ParseStats) -> Alto:
+    start = time.perf_counter()
+    if backend == 'expat':
+        from alto.expat_builder import build_from_bytes, build_from_string
+
+        res = (
+            build_from_bytes(data, stats.on_page) if isinstance(data, bytes) else build_from_string(data, stats.on_page)
+        )
+        stats.tokenize_time = 0.0
+    else:
+        element = parse_xml_bytes(data, backend) if isinstance(data, bytes) else parse_xml_string(data, backend)
+        tokenized = time.perf_counter()
+        stats.tokenize_time = tokenized - start
+        start = tokenized
+        res = _alto_from_decoders(element, on_page=stats.on_page)
+        del element
+    stats.build_time = time.perf_counter() - start
+    return res
+
+
+def _parse_with_stats(load: Callable[[], Alto], stats: ParseStats) -> Alto:
+    tracing = stats.trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    elif stats.trace_memory and hasattr(tracemalloc, "reset_peak"):  # python >= 3.9
+        tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0] if stats.trace_memory else 0
+    try:
+        res = load()
+        if stats.trace_memory:
+            stats.peak_memory = tracemalloc.get_traced_memory()[1] - memory_before
+    finally:
+        if tracing:
+            tracemalloc.stop()
+    stats.element_counts = _count_elements(res)
+    return res
+
+
+def parse_file_with_stats(filename: str, stats: ParseStats, backend: Backend = 'etree') -> Alto:
+    """
+    Alto constructor from xml file, filling `stats`.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    stats: ParseStats
+        statistics to fill
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+
+    def load() -> Alto:
+        start = time.perf_counter()
+        with open(filename, "rb") as file_:
+            data = file_.read()
+        stats.read_time = time.perf_counter() - start
+        stats.bytes_read = len(data)
+        return _parse(data, backend, stats)
+
+    stats.filename = filename
+    return _parse_with_stats(load, stats)
+
+
+def parse_with_stats(xml_str: str, stats: ParseStats, backend: Backend = 'etree') -> Alto:
+    """
+    Alto constructor from xml string, filling `stats`.
+
+    Parameters
+    ----------
+    xml_str: str
+        xml alto string
+    stats: ParseStats
+        statistics to fill
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+    """
+    stats.filename = None
+    stats.bytes_read = 0
+    stats.read_time = 0.0
+    return _parse_with_stats(lambda: _parse(xml_str, backend, stats), stats)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""Streaming parsing of alto files, page by page."""
+
+from typing import Iterator, Optional, Tuple
+from xml.etree.ElementTree import Element
+
+from alto import Description, Page, _Tags, _tags_of, _TagSet
+from alto.backends import Backend, iterparse_xml_file
+
+
+def _stream_pages(events: Iterator[Tuple[str, Element]], layout: Optional[Element], tags: _TagSet) -> Iterator[Page]:
+    for event, element in events:
+        if event == "start":
+            if element.tag == tags.LAYOUT:
+                layout = element
+            continue
+        if element.tag == tags.PAGE and layout is not None:
+            page = Page.from_xml(element)
+            # Pages are direct children of Layout and are removed as soon as they are built,
+            # so Layout never holds more than one page element.
+            layout.remove(element)
+            yield page
+
+
+def iter_parse(filename: str, backend: Backend = 'etree') -> Tuple[Description, Iterator[Page]]:
+    """
+    Streaming alto constructor from xml file.
+
+    The file is read up to the end of its Description tag before returning. Pages are then
+    built one at a time as the returned iterator is consumed, and their xml elements are
+    discarded right after, so memory does not grow with the number of pages.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+
+    Returns
+    -------
+    Tuple[Description, Iterator[Page]]
+        the document description and an iterator over its pages
+    """
+    events = iterparse_xml_file(filename, backend)
+    layout: Optional[Element] = None
+    tags: Optional[_TagSet] = None
+    for event, element in events:
+        if tags is None:
+            # the first event is the start of the root element, whose namespace is the one of the document
+            tags = _tags_of(element.tag)
+        if event == "start":
+            if element.tag == tags.LAYOUT:
+                layout = element
+            continue
+        if element.tag == tags.DESCRIPTION:
+            description = Description.from_xml(element)
+            element.clear()
+            return description, _stream_pages(events, layout, tags)
+        if element.tag == tags.PAGE:
+            raise ValueError(
+                f"Error when parsing XML: expecting tag {tags.DESCRIPTION} to appear before tag {tags.PAGE}"
+            )
+    raise ValueError(f"Error when parsing XML: expecting document to have tag {(tags or _Tags).DESCRIPTION}")
+
+
+def iter_pages(filename: str, backend: Backend = 'etree') -> Iterator[Page]:
+    """
+    Iterates over the pages of an alto xml file, building one page at a time.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to load
+    backend: Literal['etree', 'lxml', 'expat', 'auto']
+        xml library to use, see `alto.backends`
+
+    Returns
+    -------
+    Iterator[Page]
+        pages of the document, in document order
+    """
+    _, pages = iter_parse(filename, backend)
+    return pages
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""Deterministic generation of synthetic alto v3 documents, for benchmarks and tests."""
+
+import random
+from dataclasses import dataclass
+from typing import Iterator, List
+from xml.sax.saxutils import escape, quoteattr
+
+_WORDS = (
+    "Liberté",
+    "Égalité",
+    "Fraternité",
+    "RÉPUBLIQUE",
+    "FRANÇAISE",
+    "préfecture",
+    "arrêté",
+    "installation",
+    "classée",
+    "article",
+    "l'exploitant",
+    "«",
+    "»",
+    "&",
+    "<",
+    "1er",
+    "2021",
+    ".",
+    ",",
+    "de",
+    "la",
+    "du",
+)
+_PAGE_WIDTH = 1654
+_PAGE_MARGIN = 50
+_LINE_HEIGHT = 21
+_LINE_SPACING = 4
+_BLOCK_SPACING = 12
+_CHAR_WIDTH = 9
+_SP_WIDTH = 9
+
+
+@dataclass
+class DocumentShape:
+    """
+    Shape of a synthetic alto document.
+
+    Parameters
+    ----------
+    nb_pages: int
+        number of pages
+    composed_blocks_per_page: int
+        number of ComposedBlock tags in the PrintSpace of each page
+    text_blocks_per_composed_block: int
+        number of TextBlock tags in each ComposedBlock
+    lines_per_text_block: int
+        number of TextLine tags in each TextBlock
+    words_per_line: int
+        number of String tags in each TextLine
+    alternatives_rate: float
+        probability for a String to have ALTERNATIVE children, between 0 and 1
+    sp_rate: float
+        probability for two consecutive String tags to be separated by an SP tag, between 0 and 1
+    """
+
+    nb_pages: int = 1
+    composed_blocks_per_page: int = 5
+    text_blocks_per_composed_block: int = 2
+    lines_per_text_block: int = 10
+    words_per_line: int = 10
+    alternatives_rate: float = 0.0
+    sp_rate: float = 1.0
+
+    @property
+    def nb_words(self) -> int:
+        return (
+            self.nb_pages
+            * self.composed_blocks_per_page
+            * self.text_blocks_per_composed_block
+            * self.lines_per_text_block
+            * self.words_per_line
+        )
+
+
+def _attrs(**attrs: object) -> str:
+    return " ".join(f"{name}={quoteattr(str(value))}" for name, value in attrs.items())
+
+
+def _line_chunks(shape: DocumentShape, rng: random.Random, page: int, line_id: str, vpos: int) -> List[str]:
+    chunks: List[str] = []
+    hpos = _PAGE_MARGIN
+    for word_index in range(shape.words_per_line):
+        if word_index and rng.random() < shape.sp_rate:
+            chunks.append(f"<SP {_attrs(WIDTH=_SP_WIDTH, VPOS=vpos, HPOS=hpos)}/>")
+            hpos += _SP_WIDTH
+        word = rng.choice(_WORDS)
+        width = _CHAR_WIDTH * len(word)
+        attrs = _attrs(
+            ID=f"string_{page}_{line_id}_{word_index}",
+            HPOS=hpos,
+            VPOS=vpos,
+            WIDTH=width,
+            HEIGHT=_LINE_HEIGHT,
+            WC=f"{rng.randint(30, 99) / 100:.2f}",
+            CONTENT=word,
+        )
+        hpos += width
+        if rng.random() < shape.alternatives_rate:
+            alternatives = "".join(f"<ALTERNATIVE>{escape(rng.choice(_WORDS))}</ALTERNATIVE>" for _ in range(2))
+            chunks.append(f"<String {attrs}>{alternatives}</String>")
+        else:
+            chunks.append(f"<String {attrs}/>")
+    line_attrs = _attrs(
+        ID=f"line_{page}_{line_id}", HPOS=_PAGE_MARGIN, VPOS=vpos, WIDTH=hpos - _PAGE_MARGIN, HEIGHT=_LINE_HEIGHT
+    )
+    return [f"<TextLine {line_attrs}>", *chunks, "</TextLine>\n"]
+
+
+def _page_chunks(shape: DocumentShape, rng: random.Random, page: int) -> Iterator[str]:
+    vpos = _PAGE_MARGIN
+    blocks: List[str] = []
+    for cb_index in range(shape.composed_blocks_per_page):
+        cb_vpos = vpos
+        text_blocks: List[str] = []
+        for tb_index in range(shape.text_blocks_per_composed_block):
+            tb_vpos = vpos
+            lines: List[str] = []
+            for line_index in range(shape.lines_per_text_block):
+                line_id = f"{cb_index}_{tb_index}_{line_index}"
+                lines.extend(_line_chunks(shape, rng, page, line_id, vpos))
+                vpos += _LINE_HEIGHT + _LINE_SPACING
+            tb_attrs = _attrs(
+                ID=f"block_{page}_{cb_index}_{tb_index}",
+                HPOS=_PAGE_MARGIN,
+                VPOS=tb_vpos,
+                WIDTH=_PAGE_WIDTH - 2 * _PAGE_MARGIN,
+                HEIGHT=vpos - tb_vpos,
+            )
+            text_blocks.append(f"<TextBlock {tb_attrs}>\n{''.join(lines)}</TextBlock>\n")
+            vpos += _BLOCK_SPACING
+        cb_attrs = _attrs(
+            ID=f"cblock_{page}_{cb_index}",
+            HPOS=_PAGE_MARGIN,
+            VPOS=cb_vpos,
+            WIDTH=_PAGE_WIDTH - 2 * _PAGE_MARGIN,
+            HEIGHT=vpos - cb_vpos,
+        )
+        blocks.append(f"<ComposedBlock {cb_attrs}>\n{''.join(text_blocks)}</ComposedBlock>\n")
+    height = vpos + _PAGE_MARGIN
+    yield f'<Page {_attrs(WIDTH=_PAGE_WIDTH, HEIGHT=height, PHYSICAL_IMG_NR=page, ID=f"page_{page}")}>\n'
+    yield f'<PrintSpace {_attrs(HPOS=0, VPOS=0, WIDTH=_PAGE_WIDTH, HEIGHT=height)}>\n'
+    yield from blocks
+    yield "</PrintSpace>\n</Page>\n"
+
+
+def iter_alto_chunks(shape: DocumentShape, seed: int = 0) -> Iterator[str]:
+    """
+    Generates a synthetic alto v3 document piece by piece, so that large documents can be written
+    without holding them in memory.
+
+    Parameters
+    ----------
+    shape: DocumentShape
+        numbers of elements of the document
+    seed: int
+        seed of the random generator choosing words, confidences, SP and alternatives, the same seed and
+        shape always give the same document
+    """
+    rng = random.Random(seed)
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#">\n'
+    yield (
+        "<Description><MeasurementUnit>pixel</MeasurementUnit>"
+        f"<sourceImageInformation><fileName>synthetic_{seed}.png</fileName></sourceImageInformation>"
+        "</Description>\n"
+    )
+    yield "<Layout>\n"
+    for page in range(shape.nb_pages):
+        yield from _page_chunks(shape, rng, page)
+    yield "</Layout>\n</alto>\n"
+
+
+def generate_alto(shape: DocumentShape, seed: int = 0) -> str:
+    """
+    Generates a synthetic alto v3 document, see `iter_alto_chunks`.
+
+    Parameters
+    ----------
+    shape: DocumentShape
+        numbers of elements of the document
+    seed: int
+        seed of the random generator
+    """
+    return "".join(iter_alto_chunks(shape, seed))
+
+
+def write_alto(filename: str, shape: DocumentShape, seed: int = 0) -> None:
+    """
+    Writes a synthetic alto v3 document to a file, see `iter_alto_chunks`.
+
+    Parameters
+    ----------
+    filename: str
+        filename of the file to write
+    shape: DocumentShape
+        numbers of elements of the document
+    seed: int
+        seed of the random generator
+    """
+    with open(filename, "w", encoding="utf-8") as file_:
+        file_.writelines(iter_alto_chunks(shape, seed))
@@ -19,6 +19,8 @@ from pathlib import Path
 
 import pytest
 
+from alto.tests.test_streaming import _multi_page_document
+
 
 @pytest.fixture
 def data_dir() -> Path:
@@ -32,3 +34,11 @@ def data_dir() -> Path:
 def real_life_example(data_dir) -> str:
     with open(data_dir / "alto_example.xml", "r") as read_in:
         return read_in.read()
+
+
+@pytest.fixture
+def multi_page_file(tmp_path: Path) -> str:
+    # 5 small pages, after an xml declaration and a comment containing a tag
+    path = tmp_path / "multi_page.xml"
+    path.write_text('<?xml version="1.0" encoding="UTF-8"?>\n<!-- <comment> -->\n' + _multi_page_document(5))
+    return str(path)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from alto import Alto, Page, aio
+from alto.aio import iter_pages_async, parse_file_async
+from alto.tests.test_streaming import _multi_page_document
+
+
+def test_parse_file_async(multi_page_file: str):
+    async def parse_all() -> List[Alto]:
+        semaphore = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(2) as executor:
+            return await asyncio.gather(
+                *[parse_file_async(multi_page_file, executor, semaphore) for _ in range(5)],
+                parse_file_async(multi_page_file, backend='expat'),
+            )
+
+    assert asyncio.run(parse_all()) == [Alto.parse_file(multi_page_file)] * 6
+
+
+def test_parse_file_async_process_executor(multi_page_file: str):
+    async def parse() -> Alto:
+        with ProcessPoolExecutor(1) as executor:
+            return await parse_file_async(multi_page_file, executor)
+
+    assert asyncio.run(parse()) == Alto.parse_file(multi_page_file)
+
+
+def test_parse_file_async_error(tmp_path: Path):
+    path = tmp_path / "invalid.xml"
+    path.write_text(_multi_page_document(1).replace('WC="0.92"', ''))
+    with pytest.raises(ValueError, match='to have attribute WC'):
+        asyncio.run(parse_file_async(str(path)))
+
+
+def test_iter_pages_async(multi_page_file: str):
+    async def collect() -> List[Page]:
+        return [page async for page in iter_pages_async(multi_page_file, semaphore=asyncio.Semaphore(1))]
+
+    assert asyncio.run(collect()) == Alto.parse_file(multi_page_file).layout.pages
+
+    async def first() -> Page:
+        async for page in iter_pages_async(multi_page_file):
+            return page
+        raise AssertionError("no page")
+
+    assert asyncio.run(first()).id == "page_0"
+
+
+def test_iter_pages_async_process_executor(multi_page_file: str):
+    async def collect() -> List[Page]:
+        with ProcessPoolExecutor(1) as executor:
+            return [page async for page in iter_pages_async(multi_page_file, executor)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_iter_pages_async_cancelled_while_building_a_page(multi_page_file: str, monkeypatch: pytest.MonkeyPatch):
+    building, closed = threading.Event(), threading.Event()
+
+    def slow_pages(filename: str, backend: str) -> Iterator[int]:
+        try:
+            yield 0
+            building.set()
+            time.sleep(0.2)
+            yield 1
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(aio, "iter_pages", slow_pages)
+
+    async def consume() -> List[Any]:
+        return [page async for page in iter_pages_async(multi_page_file)]
+
+    async def main() -> None:
+        task = asyncio.ensure_future(consume())
+        while not building.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.get_running_loop().run_in_executor(None, closed.wait, 5)
+
+    asyncio.run(main())
+    assert closed.is_set()
@@ -431,3 +431,152 @@ def test_alto_extract_grouped_words():
     ]
 
     assert res.extract_grouped_words('TextLine')[:2] == [['7'], ['EJ', '.']]
+
+
+def test_nodes_have_no_instance_dict():
+    res = Alto.parse_file(_get_test_data_file())
+    nodes = [res, res.description, res.layout, *res.extract_composed_blocks(), *res.extract_text_lines()]
+    nodes += [string for line in res.extract_text_lines() for string in line.strings]
+    assert not any(hasattr(node, '__dict__') for node in nodes)
+
+
+def test_extractions_are_memoized():
+    res = Alto.parse_file(_get_test_data_file())
+    words = res.extract_words()
+    assert res._cache["extract_words"] == tuple(words)
+    words.append("modified")
+    assert res.extract_words() == words[:-1]
+    assert res.extract_words() is not res.extract_words()
+    grouped = res.extract_grouped_words('TextLine')
+    grouped[0].append("modified")
+    assert res.extract_grouped_words('TextLine') == [line.extract_words() for line in res.extract_text_lines()]
+    assert res.extract_grouped_words('TextLine') != res.extract_grouped_words('TextBlock')
+    page = res.layout.pages[0]
+    assert page.extract_strings() == page.extract_strings()
+    line = res.extract_text_lines()[0]
+    assert line.extract_words() == line.extract_words()
+    assert hash(line) == hash(line)
+
+
+def test_extractions_are_memoized_only_by_the_asked_node():
+    res = Alto.parse_file(_get_test_data_file())
+    res.extract_words()
+    res.extract_grouped_words('TextBlock')
+    nodes = [*res.layout.pages, *res.extract_composed_blocks(), *res.extract_text_blocks(), *res.extract_text_lines()]
+    assert not any(hasattr(node, "_cache") for node in nodes)
+
+
+def test_invalidate_cache():
+    res = Alto.parse_file(_get_test_data_file())
+    line = res.extract_text_lines()[0]
+    line_hash = hash(line)
+    assert res.extract_words()[0] == '7'
+    assert res.extract_grouped_words('TextLine')[0] == ['7']
+    string = line.strings[0]
+    assert isinstance(string, String)
+    string.content = '8'
+    assert res.extract_words()[0] == '7'
+    res.invalidate_cache()
+    assert res.extract_words()[0] == '8'
+    assert res.extract_grouped_words('TextLine')[0] == ['8']
+    assert res.layout.pages[0].extract_words()[0] == '8'
+    assert line.extract_words() == ['8']
+    assert hash(line) != line_hash
+
+
+def test_text_block_invalidate_cache():
+    block = _text_block()
+    assert block.extract_string_lines() == ['abc def', 'abc def']
+    block.text_lines.pop()
+    block.invalidate_cache()
+    assert block.extract_string_lines() == ['abc def']
+    assert block.extract_words() == ['abc', 'def']
+
+
+def test_from_xml_error_messages():
+    element = _build_xml(
+        """
+        <TextBlock ID="block_1" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="53">
+            <TextLine ID="line_2" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="21">
+                <String ID="string_3" HPOS="712" VPOS="133" WIDTH="55" HEIGHT="13" CONTENT="abc"/>
+            </TextLine>
+        </TextBlock>
+        """
+    )
+    with pytest.raises(ValueError, match='to have attribute WC'):
+        TextBlock.from_xml(element)
+
+    element = _build_xml('<TextLine ID="line_2" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="21"><Foo/></TextLine>')
+    with pytest.raises(ValueError, match='SP, got {http://www.loc.gov/standards/alto/ns-v3#}Foo'):
+        TextLine.from_xml(element)
+
+    element = _build_xml(
+        '<ComposedBlock ID="c" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="21"><TextLine/></ComposedBlock>'
+    )
+    with pytest.raises(ValueError, match='Expecting tag name {http://www.loc.gov/standards/alto/ns-v3#}TextBlock'):
+        ComposedBlock.from_xml(element)
+
+    element = _build_xml('<PrintSpace HPOS="0" VPOS="0" WIDTH="1654" HEIGHT="2339" PC="a"></PrintSpace>')
+    with pytest.raises(ValueError):
+        PrintSpace.from_xml(element)
+
+
+@pytest.mark.parametrize("version", [2, 4])
+@pytest.mark.parametrize("backend", ['etree', 'lxml', 'expat'])
+def test_parse_other_alto_versions(real_life_example: str, version: int, backend: str):
+    document = real_life_example.replace("ns-v3#", f"ns-v{version}#")
+    assert Alto.parse(document, backend=backend) == Alto.parse(real_life_example)  # type: ignore
+    if backend != 'expat':
+        assert Alto.parse(document, lazy=True, backend=backend) == Alto.parse(real_life_example)  # type: ignore
+
+
+def test_other_alto_versions_error_messages():
+    element = ElementTree.fromstring(
+        '<TextLine xmlns="http://www.loc.gov/standards/alto/ns-v4#" ID="l" HPOS="1" VPOS="1" WIDTH="1" HEIGHT="1">'
+        '<Foo/></TextLine>'
+    )
+    with pytest.raises(ValueError, match='expecting tag {http://www.loc.gov/standards/alto/ns-v4#}String'):
+        TextLine.from_xml(element)
+
+
+def test_alto_filter():
+    res = Alto.parse_file(_get_test_data_file())
+    filtered = res.filter(min_confidence=0.9)
+    kept = [string for string in res.layout.pages[0].extract_strings() if string.confidence >= 0.9]
+    assert filtered.extract_words() == [string.content for string in kept]
+    assert all(a is b for a, b in zip(filtered.layout.pages[0].extract_strings(), kept))
+    for line in filtered.extract_text_lines():
+        assert line.strings and isinstance(line.strings[0], String) and isinstance(line.strings[-1], String)
+        assert all(isinstance(a, String) or isinstance(b, String) for a, b in zip(line.strings, line.strings[1:]))
+    assert all(block.text_lines for block in filtered.extract_text_blocks())
+    assert len(filtered.layout.pages) == len(res.layout.pages)
+    assert res.filter(0).layout is res.layout
+    assert res.filter(2).extract_words() == []
+    assert res.extract_words() == Alto.parse_file(_get_test_data_file()).extract_words()
+
+
+def test_iter_methods_match_extractions():
+    res = Alto.parse_file(_get_test_data_file())
+    page = res.layout.pages[0]
+    assert list(res.iter_words()) == res.extract_words()
+    assert list(res.iter_lines()) == res.extract_text_lines()
+    assert list(res.iter_text_blocks()) == res.extract_text_blocks()
+    assert list(res.iter_composed_blocks()) == res.extract_composed_blocks()
+    assert list(page.iter_strings()) == page.extract_strings()
+    assert list(page.print_spaces[0].iter_words()) == page.print_spaces[0].extract_words()
+    block = res.extract_text_blocks()[1]
+    assert list(block.iter_lines()) == block.text_lines
+    assert list(res.extract_composed_blocks()[0].iter_text_blocks()) == res.extract_composed_blocks()[0].text_blocks
+
+
+def test_iter_methods_with_ancestors():
+    res = Alto.parse_file(_get_test_data_file())
+    page = res.layout.pages[0]
+    for string, (page_, print_space, composed_block, text_block, line) in res.iter_strings(with_ancestors=True):
+        assert string in line.strings and line in text_block.text_lines and page_ is page
+        assert text_block in composed_block.text_blocks and composed_block in print_space.composed_blocks
+    assert [word for word, _ in res.iter_words(with_ancestors=True)] == res.extract_words()
+    word, ancestors = next(res.extract_text_blocks()[0].iter_words(True))
+    assert word == "7" and ancestors == (res.extract_text_lines()[0],)
+    assert next(page.iter_text_blocks(True))[1] == (page.print_spaces[0], page.print_spaces[0].composed_blocks[0])
+    assert next(res.iter_composed_blocks(True))[1] == (page, page.print_spaces[0])
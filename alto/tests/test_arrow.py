@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from alto import Alto
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from alto.arrow import SCHEMA, export_corpus  # noqa: E402
+from alto.synthetic import DocumentShape, write_alto  # noqa: E402
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> List[str]:
+    paths = []
+    for seed in range(3):
+        path = str(tmp_path / f"doc_{seed}.xml")
+        write_alto(path, DocumentShape(nb_pages=2, composed_blocks_per_page=2, sp_rate=0.5), seed=seed)
+        paths.append(path)
+    return paths
+
+
+def test_export_corpus_parquet(corpus: List[str], tmp_path: Path):
+    out = str(tmp_path / "words.parquet")
+    res = export_corpus(corpus, out, batch_rows=300)
+    table = pq.read_table(out)
+    assert table.schema == SCHEMA
+    assert res.nb_documents == 3 and res.nb_rows == table.num_rows == 3 * 800
+    assert pq.ParquetFile(out).num_row_groups == 8
+    alto = Alto.parse_file(corpus[1])
+    rows = table.filter(pa.compute.equal(table["path"], corpus[1])).to_pylist()
+    assert [row["content"] for row in rows] == alto.extract_words()
+    string = alto.layout.pages[1].extract_strings()[0]
+    row = rows[400]
+    assert row["page_id"] == "page_1" and row["string_id"] == string.id
+    assert (row["hpos"], row["vpos"], row["width"], row["height"], row["confidence"]) == (
+        string.hpos,
+        string.vpos,
+        string.width,
+        string.height,
+        string.confidence,
+    )
+    assert row["line_id"] == "line_1_0_0_0" and row["text_block_id"] == "block_1_0_0"
+
+
+def _parquet(corpus: List[str], tmp_path: Path) -> str:
+    out = str(tmp_path / "reference.parquet")
+    export_corpus(corpus, out)
+    return out
+
+
+def test_export_corpus_arrow_with_workers(corpus: List[str], tmp_path: Path):
+    out = str(tmp_path / "words.arrow")
+    export_corpus(corpus, out, workers=2, backend='expat')
+    with pa.ipc.open_file(out) as reader:
+        table = reader.read_all()
+    assert table.equals(pq.read_table(_parquet(corpus, tmp_path)))
+
+
+def test_export_corpus_errors(corpus: List[str], tmp_path: Path):
+    invalid = tmp_path / "invalid.xml"
+    invalid.write_text("<alto>")
+    out = str(tmp_path / "words.parquet")
+    with pytest.raises(ValueError, match="invalid.xml"):
+        export_corpus([corpus[0], str(invalid)], out)
+    res = export_corpus([corpus[0], str(invalid), corpus[1]], out, skip_errors=True)
+    assert res.nb_documents == 2 and [filename for filename, _ in res.errors] == [str(invalid)]
+    assert pq.read_table(out).num_rows == 1600
+
+
+def test_export_corpus_many_batches_per_document(corpus: List[str], tmp_path: Path):
+    out = str(tmp_path / "words.parquet")
+    assert export_corpus(corpus, out, batch_rows=7).nb_rows == 2400
+    assert pq.ParquetFile(out).num_row_groups == 343
+    assert pq.read_table(out).equals(pq.read_table(_parquet(corpus, tmp_path)))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+import pytest
+
+from alto import Alto, iter_pages, parse, parse_file
+from alto.backends import iterparse_xml_file, lxml_available, parse_xml_file, parse_xml_string, resolve_backend
+from alto.tests.test_streaming import _multi_page_document
+
+_BACKENDS = ['etree', 'auto', pytest.param('lxml', marks=pytest.mark.skipif(not lxml_available(), reason='no lxml'))]
+
+
+@pytest.mark.parametrize("backend", _BACKENDS)
+def test_parse_file_backends(data_dir: Path, backend):
+    filename = str(data_dir / "alto_example.xml")
+    assert parse_file(filename, backend=backend) == Alto.parse_file(filename)
+    assert parse_file(filename, lazy=True, backend=backend) == Alto.parse_file(filename)
+
+
+@pytest.mark.parametrize("backend", _BACKENDS)
+def test_parse_backends(real_life_example: str, backend):
+    assert parse(real_life_example, backend=backend) == Alto.parse(real_life_example)
+    commented = real_life_example.replace("<Layout>", "<Layout><!-- comment --><?pi instruction?>")
+    assert parse(commented, backend=backend) == Alto.parse(real_life_example)
+
+
+@pytest.mark.parametrize("backend", _BACKENDS)
+def test_iter_pages_backends(tmp_path: Path, backend):
+    path = tmp_path / "multi_page.xml"
+    path.write_text(_multi_page_document(3))
+    assert list(iter_pages(str(path), backend=backend)) == Alto.parse_file(str(path)).layout.pages
+
+
+def test_resolve_backend():
+    assert resolve_backend('etree') == 'etree'
+    assert resolve_backend('expat') == 'expat'
+    assert resolve_backend('auto') == 'etree'
+    with pytest.raises(NotImplementedError):
+        resolve_backend('sax')  # type: ignore
+
+
+@pytest.mark.skipif(not lxml_available(), reason='no lxml')
+def test_parse_xml_string_lxml_with_declaration():
+    element = parse_xml_string('<?xml version="1.0" encoding="UTF-8"?><a b="é"/>', 'lxml')
+    assert element.attrib["b"] == "é"
+
+
+@pytest.mark.skipif(not lxml_available(), reason='no lxml')
+def test_lxml_entities_are_not_resolved(tmp_path: Path):
+    path = tmp_path / "entities.xml"
+    path.write_text('<?xml version="1.0"?><!DOCTYPE a [<!ENTITY e "expanded">]><a><b>&e;</b></a>')
+    tree_element = parse_xml_file(str(path), 'lxml')[0]
+    streamed_element = next(element for event, element in iterparse_xml_file(str(path), 'lxml') if event == "end")
+    assert tree_element.text is None and streamed_element.text is None
+    assert [str(child) for child in streamed_element] == [str(child) for child in tree_element] == ["&e;"]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from alto import Alto, parse_files
+from alto.batch import map_files
+
+
+@pytest.fixture
+def filenames(data_dir: Path, tmp_path: Path) -> List[str]:
+    invalid = tmp_path / "invalid.xml"
+    invalid.write_text("<alto>")
+    example = str(data_dir / "alto_example.xml")
+    return [example, str(invalid), example, str(tmp_path / "missing.xml"), example]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_files_ordered(filenames: List[str], workers: int):
+    results = list(parse_files(filenames, workers=workers, chunksize=2, max_pending=1))
+    assert [filename for filename, _ in results] == filenames
+    expected = Alto.parse_file(filenames[0])
+    assert results[0][1] == expected
+    assert isinstance(results[1][1], Exception)
+    assert results[2][1] == expected
+    assert isinstance(results[3][1], FileNotFoundError)
+    assert results[4][1] == expected
+
+
+def test_parse_files_unordered(filenames: List[str]):
+    results = dict(parse_files(filenames, workers=2, ordered=False))
+    assert set(results) == set(filenames)
+    assert isinstance(results[filenames[0]], Alto)
+    assert isinstance(results[filenames[1]], Exception)
+
+
+@pytest.mark.parametrize("options", [{"chunksize": 0}, {"workers": -1}, {"workers": 0}, {"max_pending": 0}])
+def test_parse_files_checks_arguments(filenames: List[str], options: dict):
+    # arguments are checked when the iterator is created, before any result is requested
+    with pytest.raises(ValueError):
+        parse_files(filenames, **options)
+    with pytest.raises(ValueError):
+        map_files(os.path.getsize, filenames, **options)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import json
+from pathlib import Path
+
+import pytest
+
+from alto.benchmark import benchmark_report, main, run_benchmarks
+from alto.synthetic import DocumentShape
+
+
+def test_run_benchmarks():
+    shape = DocumentShape(composed_blocks_per_page=1, lines_per_text_block=2, words_per_line=3)
+    results = run_benchmarks({"tiny": shape}, backends=['etree', 'expat'], repeat=2)
+    names = [result.name for result in results]
+    assert names[:5] == ["parse_file", "parse", "parse_file[intern]", "parse_file", "parse"]
+    assert [result.backend for result in results[:5]] == ['etree', 'etree', 'etree', 'expat', 'expat']
+    assert "Alto.extract_words" in names and "Alto.extract_grouped_words[TextBlock]" in names
+    assert "Page.reading_order" in names
+    for result in results:
+        assert result.size == "tiny" and result.nb_words == 12
+        assert len(result.times) == 2 and result.peak_memory is not None and result.peak_memory > 0
+        assert result.retained_memory is not None and result.retained_memory <= result.peak_memory
+    assert run_benchmarks({"tiny": shape}, repeat=1, memory=False)[0].peak_memory is None
+
+
+def test_benchmark_report_unknown_size():
+    with pytest.raises(NotImplementedError):
+        benchmark_report(["huge"])
+
+
+def test_main(tmp_path: Path):
+    output = tmp_path / "results.json"
+    main(["--sizes", "small", "--repeat", "1", "--no-memory", "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert list(report["shapes"]) == ["small"]
+    assert {result["name"] for result in report["results"]} >= {"parse_file", "parse", "Page.extract_strings"}
+    assert all(result["best"] <= result["median"] for result in report["results"])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import pickle
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from alto import _NODE_CLASSES, Alto, String, parse_file
+from alto.cache import _cache_header, _model_digest, cache_entry_name, parse_file_cached
+
+
+@pytest.fixture
+def example_file(data_dir: Path, tmp_path: Path) -> str:
+    path = tmp_path / "example.xml"
+    shutil.copy(data_dir / "alto_example.xml", path)
+    return str(path)
+
+
+def _failing_parser(filename: str) -> Alto:
+    raise AssertionError(f"{filename} should have been loaded from cache")
+
+
+@pytest.mark.parametrize("key", ["stat", "content"])
+def test_parse_file_cached(example_file: str, tmp_path: Path, key):
+    cache_dir = str(tmp_path / "cache")
+    expected = Alto.parse_file(example_file)
+    assert parse_file(example_file, cache_dir=cache_dir, cache_key=key) == expected
+    assert os.listdir(cache_dir) == [cache_entry_name(example_file, key)]
+    assert parse_file_cached(example_file, cache_dir, key, parser=_failing_parser) == expected
+
+
+def test_parse_file_cached_invalidation(example_file: str, tmp_path: Path):
+    cache_dir = str(tmp_path / "cache")
+    parse_file(example_file, cache_dir=cache_dir)
+    Path(example_file).write_text(Path(example_file).read_text().replace('CONTENT="EJ"', 'CONTENT="EK"'))
+    assert parse_file(example_file, cache_dir=cache_dir).extract_words()[:3] == ["7", "EK", "."]
+
+
+def test_parse_file_cached_ignores_other_versions(example_file: str, tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / cache_entry_name(example_file)).write_bytes(b"alto-cache:0.0.0:0:0\n" + pickle.dumps("stale"))
+    assert parse_file(example_file, cache_dir=str(cache_dir)) == Alto.parse_file(example_file)
+    assert parse_file_cached(example_file, str(cache_dir), parser=_failing_parser) == Alto.parse_file(example_file)
+
+
+def test_alto_pickle_roundtrip(example_file: str):
+    alto = Alto.parse_file(example_file)
+    assert pickle.loads(pickle.dumps(alto)) == alto
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"calto\nNoSuchNode\n.",  # AttributeError
+        b"cno_such_module\nNode\n.",  # ImportError
+        b"\x80\x05\x95",  # UnpicklingError
+        pickle.dumps(String)[:-1] + b")R.",  # TypeError
+    ],
+)
+def test_parse_file_cached_ignores_corrupt_entries(example_file: str, tmp_path: Path, payload: bytes):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / cache_entry_name(example_file)).write_bytes(_cache_header() + payload)
+    assert parse_file(example_file, cache_dir=str(cache_dir)) == Alto.parse_file(example_file)
+    assert parse_file_cached(example_file, str(cache_dir), parser=_failing_parser) == Alto.parse_file(example_file)
+
+
+def test_cache_header_depends_on_the_object_model():
+    @dataclass
+    class Renamed:
+        __slots__ = ("id", "content")
+
+        id: str
+        content: str
+
+    assert _model_digest([String]) == _model_digest([String])
+    assert _model_digest([String]) != _model_digest([String, Renamed])
+    assert _model_digest(_NODE_CLASSES).encode() in _cache_header()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+import pytest
+
+from alto import SP, Alto, ComposedBlock, Layout, Page, PrintSpace, String, TextBlock, TextLine
+
+np = pytest.importorskip("numpy")
+
+
+def _string(word: str, hpos: float, confidence: float) -> String:
+    return String(
+        id=f"s_{word}", height=10, width=20, hpos=hpos, vpos=5, content=word, confidence=confidence, alternatives=[]
+    )
+
+
+def _page(id_: str, lines_words: list) -> Page:
+    lines = [TextLine("", 1, 1, 1, 1, [_string(word, 1, 0.5) for word in words]) for words in lines_words]
+    blocks = [
+        ComposedBlock("", 1, 1, 1, 1, [TextBlock("", 1, 1, 1, 1, lines[:1]), TextBlock("", 1, 1, 1, 1, lines[1:])])
+    ]
+    return Page(id_, 1, 1, 0, None, [PrintSpace(1, 1, 1, 1, None, blocks)])
+
+
+def test_page_to_columns():
+    line = TextLine("", 1, 1, 1, 1, [_string("a", 1, 0.5), SP(1, 1, 1), _string("b", 30, 0.9)])
+    page = Page(
+        "p",
+        1,
+        1,
+        0,
+        None,
+        [PrintSpace(1, 1, 1, 1, None, [ComposedBlock("", 1, 1, 1, 1, [TextBlock("", 1, 1, 1, 1, [line])])])],
+    )
+    columns = page.to_columns()
+    assert len(columns) == 2
+    assert columns.content.tolist() == ["a", "b"]
+    assert columns.id.tolist() == ["s_a", "s_b"]
+    assert columns.hpos.tolist() == [1.0, 30.0]
+    assert columns.confidence.dtype == np.float64
+    assert columns.confidence.tolist() == [0.5, 0.9]
+    assert columns.line_index.tolist() == [0, 0]
+    assert columns.page_index.tolist() == [0, 0]
+
+
+def test_alto_to_columns_parent_indices():
+    pages = [_page("p0", [["a", "b"], ["c"], []]), _page("p1", [[], ["d"]])]
+    columns = Alto(None, Layout(pages)).to_columns()  # type: ignore
+    assert columns.content.tolist() == ["a", "b", "c", "d"]
+    assert columns.line_index.tolist() == [0, 0, 1, 4]
+    assert columns.text_block_index.tolist() == [0, 0, 1, 3]
+    assert columns.composed_block_index.tolist() == [0, 0, 0, 1]
+    assert columns.page_index.tolist() == [0, 0, 0, 1]
+
+
+def test_alto_to_columns_empty():
+    columns = Alto(None, Layout([])).to_columns()  # type: ignore
+    assert len(columns) == 0
+    assert columns.hpos.shape == (0,)
+
+
+def test_alto_to_columns_real_life_example(data_dir: Path):
+    alto = Alto.parse_file(str(data_dir / "alto_example.xml"))
+    columns = alto.to_columns()
+    assert columns.content.tolist() == alto.extract_words()
+    assert len(np.unique(columns.line_index)) == len(
+        [line for line in alto.extract_text_lines() if line.extract_words()]
+    )
+
+
+def test_alto_confidence_stats():
+    lines = [
+        TextLine("l0", 1, 1, 1, 1, [_string("a", 1, 0.15), SP(1, 1, 1), _string("b", 30, 0.95)]),
+        TextLine("l1", 1, 1, 1, 1, []),
+        TextLine("l2", 1, 1, 1, 1, [_string("c", 1, 1.0)]),
+    ]
+    blocks = [TextBlock("b0", 1, 1, 1, 1, lines[:2]), TextBlock("b1", 1, 1, 1, 1, lines[2:])]
+    page = Page("p0", 1, 1, 0, None, [PrintSpace(1, 1, 1, 1, None, [ComposedBlock("c0", 1, 1, 1, 1, blocks)])])
+    alto = Alto(None, Layout([page, _page("p1", [[]])]))  # type: ignore
+    stats = alto.confidence_stats('TextLine', bins=4)
+    assert stats.ids == ["l0", "l1", "l2", ""]
+    assert stats.count.tolist() == [2, 0, 1, 0]
+    assert np.allclose(stats.mean[[0, 2]], [0.55, 1.0]) and np.isnan(stats.mean[[1, 3]]).all()
+    assert stats.min[[0, 2]].tolist() == [0.15, 1.0] and np.isnan(stats.min[1])
+    assert stats.max[[0, 2]].tolist() == [0.95, 1.0] and np.isnan(stats.max[3])
+    assert stats.histogram.tolist() == [[1, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 1], [0, 0, 0, 0]]
+    assert stats.bin_edges.tolist() == [0, 0.25, 0.5, 0.75, 1]
+    page_stats = alto.confidence_stats()
+    assert page_stats.ids == ["p0", "p1"] and page_stats.count.tolist() == [3, 0]
+    assert alto.confidence_stats('TextBlock').count.tolist() == [2, 1, 0, 0]
+    assert alto.confidence_stats('ComposedBlock').histogram.sum(axis=1).tolist() == [3, 0]
+    with pytest.raises(NotImplementedError):
+        alto.confidence_stats('String')  # type: ignore
+    with pytest.raises(ValueError):
+        alto.confidence_stats(bins=0)
+
+
+def test_confidence_stats_real_life_example(data_dir: Path):
+    alto = Alto.parse_file(str(data_dir / "alto_example.xml"))
+    stats = alto.confidence_stats('TextLine')
+    for line, count, mean in zip(alto.extract_text_lines(), stats.count, stats.mean):
+        confidences = [string.confidence for string in line.strings if isinstance(string, String)]
+        assert count == len(confidences)
+        assert np.isnan(mean) if not confidences else np.isclose(mean, sum(confidences) / len(confidences))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import alto.corpus as corpus_module
+from alto import Alto
+from alto.corpus import CorpusRunner
+
+
+def _nb_pages(alto: Alto) -> int:
+    return len(alto.layout.pages)
+
+
+@pytest.fixture
+def corpus(data_dir: Path, tmp_path: Path) -> Path:
+    root = tmp_path / "corpus"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(data_dir / "alto_example.xml", root / "a.xml")
+    shutil.copy(data_dir / "alto_example.xml", root / "sub" / "b.xml")
+    (root / "notes.txt").write_text("not alto")
+    return root
+
+
+def _runner(corpus: Path, calls: List[str]) -> CorpusRunner:
+    def process(alto: Alto) -> int:
+        calls.append(alto.description.file_name or "")
+        return _nb_pages(alto)
+
+    return CorpusRunner(str(corpus), str(corpus.parent / "manifest.sqlite"), process)
+
+
+def test_corpus_runner_processes_only_changes(corpus: Path):
+    calls: List[str] = []
+    a, b = str(corpus / "a.xml"), str(corpus / "sub" / "b.xml")
+    with _runner(corpus, calls) as runner:
+        summary = runner.run()
+        assert sorted(summary.new) == [a, b]
+        assert (summary.modified, summary.nb_unchanged, summary.deleted) == ([], 0, [])
+        assert len(calls) == 2
+        entry = runner.entry(a)
+        assert entry is not None and entry.outputs == 1 and entry.error is None
+        assert entry.size == os.path.getsize(a)
+
+    with _runner(corpus, calls) as runner:
+        summary = runner.run()
+        assert (summary.new, summary.modified, summary.nb_unchanged) == ([], [], 2)
+        assert len(calls) == 2
+
+        os.utime(a, ns=(0, 0))  # touched, same content
+        content = Path(b).read_text()
+        Path(b).write_text(content.replace("</Layout>", "</Layout>\n"))
+        (corpus / "c.xml").write_text(content)
+        summary = runner.run()
+        assert (summary.new, summary.modified, summary.nb_unchanged) == ([str(corpus / "c.xml")], [b], 1)
+        assert len(calls) == 4
+        entry = runner.entry(a)
+        assert entry is not None and entry.mtime_ns == 0
+
+        os.remove(a)
+        summary = runner.run()
+        assert (summary.new, summary.modified, summary.nb_unchanged, summary.deleted) == ([], [], 2, [a])
+        assert runner.entry(a) is None
+        assert [entry.path for entry in runner.entries()] == sorted([str(corpus / "c.xml"), b])
+
+
+def test_corpus_runner_records_errors(corpus: Path):
+    invalid = corpus / "invalid.xml"
+    invalid.write_text("<alto>")
+    with CorpusRunner(str(corpus), str(corpus.parent / "manifest.sqlite"), _nb_pages, workers=2) as runner:
+        summary = runner.run()
+        assert [path for path, _ in summary.errors] == [str(invalid)]
+        entry = runner.entry(str(invalid))
+        assert entry is not None and entry.outputs is None and entry.error
+        assert runner.run().errors == []
+
+        invalid.write_text((corpus / "a.xml").read_text())
+        summary = runner.run()
+        assert (summary.modified, summary.errors) == ([str(invalid)], [])
+        entry = runner.entry(str(invalid))
+        assert entry is not None and entry.outputs == 1 and entry.error is None
+
+
+def test_corpus_runner_unreadable_file(corpus: Path, monkeypatch: pytest.MonkeyPatch):
+    a = str(corpus / "a.xml")
+    digest = corpus_module._content_digest
+
+    def unreadable(path: str) -> str:
+        if path == a:
+            raise PermissionError(f"Permission denied: {path}")
+        return digest(path)
+
+    monkeypatch.setattr(corpus_module, "_content_digest", unreadable)
+    calls: List[str] = []
+    with _runner(corpus, calls) as runner:
+        summary = runner.run()
+        assert [path for path, _ in summary.errors] == [a] and "PermissionError" in summary.errors[0][1]
+        assert len(calls) == 1
+        entry = runner.entry(str(corpus / "sub" / "b.xml"))
+        assert entry is not None and entry.outputs == 1
+        summary = runner.run()
+        assert summary.modified == [a] and [path for path, _ in summary.errors] == [a]
+        monkeypatch.setattr(corpus_module, "_content_digest", digest)
+        summary = runner.run()
+        assert summary.modified == [a] and summary.errors == []
+        assert len(calls) == 2
+
+
+def test_corpus_runner_file_modified_while_processed(corpus: Path):
+    a = corpus / "a.xml"
+    calls: List[str] = []
+
+    def process(alto: Alto) -> int:
+        if not calls:
+            a.write_text(a.read_text() + "\n")
+        calls.append(alto.description.file_name or "")
+        return _nb_pages(alto)
+
+    with CorpusRunner(str(corpus), str(corpus.parent / "manifest.sqlite"), process) as runner:
+        runner.run()
+        entry = runner.entry(str(a))
+        assert entry is not None and entry.size != a.stat().st_size
+        assert runner.run().modified == [str(a)]
+        assert runner.run().modified == []
+
+
+def test_corpus_runner_records_serialization_errors(corpus: Path):
+    with CorpusRunner(str(corpus), str(corpus.parent / "manifest.sqlite"), lambda alto: object()) as runner:
+        summary = runner.run()
+        assert len(summary.errors) == 2 and all("TypeError" in error for _, error in summary.errors)
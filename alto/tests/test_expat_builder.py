@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from alto import Alto, parse, parse_file
+from alto.expat_builder import build_from_file, build_from_string
+from alto.tests.test_streaming import _multi_page_document
+
+
+def _error_message(parser, xml_str: str) -> str:
+    with pytest.raises(ValueError) as info:
+        parser(xml_str)
+    return str(info.value)
+
+
+def test_build_from_file(data_dir: Path, tmp_path: Path):
+    filename = str(data_dir / "alto_example.xml")
+    assert build_from_file(filename) == Alto.parse_file(filename)
+    assert parse_file(filename, backend='expat') == Alto.parse_file(filename)
+    path = tmp_path / "multi_page.xml"
+    path.write_text(_multi_page_document(3))
+    assert build_from_file(str(path)) == Alto.parse_file(str(path))
+
+
+def test_build_from_string(real_life_example: str):
+    assert build_from_string(real_life_example) == Alto.parse(real_life_example)
+    assert parse(real_life_example, backend='expat') == Alto.parse(real_life_example)
+    commented = real_life_example.replace("<Layout>", "<Layout><!-- comment --><?pi instruction?>")
+    assert build_from_string(commented) == Alto.parse(real_life_example)
+
+
+def test_build_alternatives():
+    document = _multi_page_document(1).replace(
+        'CONTENT="w0"/>', 'CONTENT="w0"><ALTERNATIVE>a &amp; b</ALTERNATIVE><ALTERNATIVE>c</ALTERNATIVE></String>', 1
+    )
+    alto = build_from_string(document)
+    assert alto == Alto.parse(document)
+    assert [alternative.content for alternative in alto.layout.pages[0].extract_strings()[0].alternatives] == [
+        'a & b',
+        'c',
+    ]
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ('WC="0.92"', ''),
+        ('WC="0.92"', 'WC="high"'),
+        ('<TextLine ', '<Foo/><TextLine '),
+        ('CONTENT="w0"/>', 'CONTENT="w0"><ALTERNATIVE/></String>'),
+        ('<fileName>doc.png</fileName>', ''),
+        ('<Layout>', '<Layout><Page/>'),
+    ],
+)
+def test_build_error_messages(old: str, new: str):
+    document = _multi_page_document(2).replace(old, new, 1)
+    assert document != _multi_page_document(2)
+    assert _error_message(build_from_string, document) == _error_message(Alto.parse, document)
+
+
+def test_build_invalid_xml():
+    with pytest.raises(ParseError):
+        build_from_string(_multi_page_document(1)[:-20])
+
+
+def test_expat_backend_is_not_lazy(real_life_example: str):
+    with pytest.raises(ValueError):
+        parse(real_life_example, lazy=True, backend='expat')
+
+
+def test_build_other_alto_versions():
+    document = _multi_page_document(2)
+    for version in (2, 4):
+        assert build_from_string(document.replace("ns-v3#", f"ns-v{version}#")) == Alto.parse(document)
+    mixed = document.replace("<Layout>", '<Layout xmlns="http://www.loc.gov/standards/alto/ns-v4#">')
+    assert _error_message(build_from_string, mixed) == _error_message(Alto.parse, mixed)
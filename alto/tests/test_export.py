@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import dataclasses
+import json
+
+import pytest
+
+from alto import Alto
+from alto.export import iter_records
+from alto.synthetic import DocumentShape, generate_alto
+
+
+@pytest.fixture
+def synthetic() -> Alto:
+    return Alto.parse(generate_alto(DocumentShape(nb_pages=2, alternatives_rate=0.5, sp_rate=0.5)))
+
+
+def test_to_dict_matches_asdict(real_life_example: str, synthetic: Alto):
+    alto = Alto.parse(real_life_example)
+    assert alto.to_dict() == dataclasses.asdict(alto)
+    assert synthetic.to_dict() == dataclasses.asdict(synthetic)
+
+
+def test_to_json(synthetic: Alto):
+    assert json.loads(synthetic.to_json()) == dataclasses.asdict(synthetic)
+    assert synthetic.to_json(indent=2).startswith('{\n  "description"')
+
+
+def test_iter_ndjson_strings(real_life_example: str):
+    alto = Alto.parse(real_life_example)
+    lines = list(alto.iter_ndjson())
+    assert all(line.endswith("\n") for line in lines)
+    records = [json.loads(line) for line in lines]
+    assert [record["content"] for record in records] == alto.extract_words()
+    assert records[0] == {
+        "id": "string_0",
+        "hpos": 863.0,
+        "vpos": 75.0,
+        "width": 7.0,
+        "height": 10.0,
+        "content": "7",
+        "confidence": 0.92,
+        "alternatives": [],
+        "page_id": "page_0",
+        "composed_block_id": "cblock_0",
+        "text_block_id": "block_0",
+        "text_line_id": "line_0",
+    }
+
+
+def test_iter_records_levels(real_life_example: str):
+    alto = Alto.parse(real_life_example)
+    lines = list(iter_records(alto, 'TextLine'))
+    assert [record["id"] for record in lines] == [line.id for line in alto.extract_text_lines()]
+    assert lines[1]["content"] == "EJ ."
+    assert lines[1]["confidence"] == pytest.approx((0.51 + 0.75) / 2)
+    assert lines[1]["text_block_id"] == "block_0" and "text_line_id" not in lines[1]
+    blocks = list(iter_records(alto, 'TextBlock'))
+    assert [record["id"] for record in blocks] == [block.id for block in alto.extract_text_blocks()]
+    assert blocks[0]["content"] == "7\nEJ ."
+    assert set(blocks[0]) >= {"page_id", "composed_block_id"} and "text_block_id" not in blocks[0]
+    with pytest.raises(NotImplementedError):
+        list(iter_records(alto, 'Page'))  # type: ignore
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from alto import Alto, String, parse, parse_file
+from alto.interning import InternTable
+
+
+def test_parse_file_with_intern_table(data_dir: Path):
+    filename = str(data_dir / "alto_example.xml")
+    table = InternTable()
+    first, second = parse_file(filename, intern_table=table), Alto.parse_file(filename, intern_table=table)
+    assert first == second == parse_file(filename)
+    first_strings, second_strings = first.layout.pages[0].extract_strings(), second.layout.pages[0].extract_strings()
+    for string, other in zip(first_strings, second_strings):
+        assert string.id is other.id and string.content is other.content
+        assert string.hpos is other.hpos and string.confidence is other.confidence
+    assert first.layout.pages[0].physical_img_nr is second.layout.pages[0].physical_img_nr
+    assert len(table) > 0
+    table.clear()
+    assert len(table) == 0
+
+
+def test_repeated_values_are_shared(real_life_example: str):
+    alto = parse(real_life_example.replace('CONTENT="7"', 'CONTENT="EJ"'), intern_table=InternTable())
+    strings = [string for string in alto.layout.pages[0].extract_strings() if string.content == "EJ"]
+    assert len(strings) == 2 and strings[0].content is strings[1].content
+    heights: Dict[float, float] = {}
+    for string in alto.layout.pages[0].extract_strings():
+        assert heights.setdefault(string.height, string.height) is string.height
+
+
+def test_intern_table_is_bounded(real_life_example: str):
+    table = InternTable(max_size=2)
+    parse(real_life_example, intern_table=table)
+    alto = parse(real_life_example, intern_table=table)
+    assert 0 < len(table) <= 5  # at most 2 strings, 2 floats and the only int
+    assert alto == parse(real_life_example)
+    assert isinstance(alto.layout.pages[0].extract_strings()[0], String)
+    with pytest.raises(ValueError):
+        InternTable(max_size=-1)
+
+
+def _document(words: List[Tuple[str, str]]) -> str:
+    strings = "".join(
+        f'<String ID="{id_}" HPOS="1" VPOS="2" WIDTH="3" HEIGHT="4" WC="0.5" CONTENT="{content}"/>'
+        for id_, content in words
+    )
+    return (
+        '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#"><Description><sourceImageInformation>'
+        '<fileName>a.png</fileName></sourceImageInformation></Description><Layout>'
+        '<Page ID="p" HEIGHT="1" WIDTH="1" PHYSICAL_IMG_NR="0"><PrintSpace HPOS="0" VPOS="0" WIDTH="1" HEIGHT="1">'
+        '<ComposedBlock ID="c" HPOS="0" VPOS="0" WIDTH="1" HEIGHT="1"><TextBlock ID="b" HPOS="0" VPOS="0" WIDTH="1" '
+        f'HEIGHT="1"><TextLine ID="l" HPOS="0" VPOS="0" WIDTH="1" HEIGHT="1">{strings}</TextLine></TextBlock>'
+        '</ComposedBlock></PrintSpace></Page></Layout></alto>'
+    )
+
+
+def test_unique_values_do_not_fill_the_table():
+    table = InternTable(max_size=50)
+    for document in range(10):
+        parse(_document([(f"s_{document}_{i}", f"w_{document}_{i}") for i in range(100)]), intern_table=table)
+    alto = parse(_document([(f"s_10_{i}", "de") for i in range(100)]), intern_table=table)
+    strings = alto.layout.pages[0].extract_strings()
+    assert all(string.content is strings[1].content for string in strings[1:])
+    assert len(table) < 20
+
+
+@pytest.mark.parametrize("options", [{"lazy": True}, {"backend": 'expat'}, {"fields": ["content"]}])
+def test_intern_table_incompatible_options(data_dir: Path, real_life_example: str, options: dict):
+    with pytest.raises(ValueError):
+        parse_file(str(data_dir / "alto_example.xml"), intern_table=InternTable(), **options)
+    with pytest.raises(ValueError):
+        parse(real_life_example, intern_table=InternTable(), **options)
+
+
+def test_intern_table_error_messages():
+    with pytest.raises(ValueError) as error:
+        parse(
+            '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#"><Description><sourceImageInformation>'
+            '<fileName>a.png</fileName></sourceImageInformation></Description><Layout>'
+            '<Page ID="p" HEIGHT="1" WIDTH="1"/></Layout></alto>',
+            intern_table=InternTable(),
+        )
+    assert "PHYSICAL_IMG_NR" in str(error.value)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import pickle
+from pathlib import Path
+
+import pytest
+
+from alto import Alto, LazyPages, parse, parse_file
+from alto.tests.test_streaming import _multi_page_document
+
+
+def test_lazy_parse_file(multi_page_file: str):
+    alto = parse_file(multi_page_file, lazy=True)
+    pages = alto.layout.pages
+    assert isinstance(pages, LazyPages)
+    assert len(pages) == 5
+    assert pages.nb_loaded == 0
+    assert pages[2].id == "page_2"
+    assert pages[-1].id == "page_4"
+    assert pages.nb_loaded == 2
+    assert pages[2] is pages[2]
+    assert [page.id for page in pages[:2]] == ["page_0", "page_1"]
+    assert pages.nb_loaded == 4
+    with pytest.raises(IndexError):
+        pages[5]
+
+
+def test_lazy_parse_matches_eager_parse(multi_page_file: str):
+    eager = Alto.parse_file(multi_page_file)
+    lazy = Alto.parse_file(multi_page_file, lazy=True)
+    assert lazy.extract_words() == eager.extract_words()
+    assert lazy == eager
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+    assert parse(Path(multi_page_file).read_text(), lazy=True) == eager
+
+
+def test_lazy_parse_defers_page_errors():
+    alto = parse(_multi_page_document(2).replace('ID="page_1"', ''), lazy=True)
+    assert alto.layout.pages[0].id == "page_0"
+    with pytest.raises(ValueError):
+        alto.layout.pages[1]
+
+
+def test_lazy_invalidate_cache_does_not_load_pages(multi_page_file: str):
+    alto = parse_file(multi_page_file, lazy=True)
+    alto.layout.pages[0].extract_words()
+    alto.invalidate_cache()
+    assert isinstance(alto.layout.pages, LazyPages)
+    assert alto.layout.pages.nb_loaded == 1
+
+
+def test_lazy_parse_with_cache_dir(multi_page_file: str, tmp_path: Path):
+    with pytest.raises(ValueError):
+        parse_file(multi_page_file, cache_dir=str(tmp_path), lazy=True)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+from pathlib import Path
+
+import pytest
+
+from alto import Alto, AltoFile, Page, page_index
+from alto.page_index import build_page_index
+from alto.tests.test_streaming import _multi_page_document
+
+
+def test_alto_file_page(multi_page_file: str):
+    alto = Alto.parse_file(multi_page_file)
+    alto_file = AltoFile.open(multi_page_file)
+    assert len(alto_file) == 5
+    assert alto_file.description == alto.description
+    assert alto_file.page(3) == alto.layout.pages[3]
+    assert [alto_file.page(i) for i in range(len(alto_file))] == alto.layout.pages
+    with pytest.raises(IndexError):
+        alto_file.page(5)
+
+
+def test_alto_file_quoted_greater_than(tmp_path: Path):
+    path = tmp_path / "quoted.xml"
+    document = _multi_page_document(3).replace('ID="page_1"', 'ID="a>b/>"').replace('<Page ', "<Page X='>' ", 1)
+    path.write_text(document)
+    alto_file = AltoFile.open(str(path))
+    assert [alto_file.page(i) for i in range(len(alto_file))] == Alto.parse_file(str(path)).layout.pages
+    path.write_text(document.replace('ID="a>b/>"', 'ID="a>b'))
+    with pytest.raises(ValueError):
+        AltoFile.open(str(path))
+
+
+def test_alto_file_real_life_example(data_dir: Path):
+    filename = str(data_dir / "alto_example.xml")
+    assert AltoFile.open(filename).page(0) == Alto.parse_file(filename).layout.pages[0]
+
+
+def test_alto_file_prefixed_namespace_and_empty_page(tmp_path: Path):
+    path = tmp_path / "prefixed.xml"
+    path.write_text(
+        '<a:alto xmlns:a="http://www.loc.gov/standards/alto/ns-v3#"><a:Layout>'
+        '<a:Page WIDTH="1" HEIGHT="2" PHYSICAL_IMG_NR="0" ID="p0"/>'
+        '<a:Page WIDTH="1" HEIGHT="2" PHYSICAL_IMG_NR="1" ID="p1"></a:Page>'
+        '</a:Layout></a:alto>'
+    )
+    alto_file = AltoFile.open(str(path))
+    assert alto_file.page(0) == Page("p0", 2, 1, 0, None, [])
+    assert alto_file.page(1) == Page("p1", 2, 1, 1, None, [])
+    with pytest.raises(ValueError):
+        alto_file.description
+
+
+def test_alto_file_sidecar(multi_page_file: str):
+    index_filename = multi_page_file + ".pageidx"
+    AltoFile.open(multi_page_file, sidecar=True)
+    assert os.path.exists(index_filename)
+    assert AltoFile.open(multi_page_file, sidecar=True).index == build_page_index(multi_page_file)
+
+    assert [name for name in os.listdir(os.path.dirname(multi_page_file)) if name.endswith(".tmp")] == []
+
+    Path(multi_page_file).write_text(_multi_page_document(2))
+    alto_file = AltoFile.open(multi_page_file, sidecar=True)
+    assert len(alto_file) == 2
+    assert alto_file.page(1).id == "page_1"
+
+
+def test_alto_file_sidecar_is_written_atomically(multi_page_file: str, monkeypatch):
+    index_filename = multi_page_file + ".pageidx"
+    AltoFile.open(multi_page_file, sidecar=True)
+    content = Path(index_filename).read_text()
+
+    def failing_dump(obj, file_):
+        file_.write("{")
+        raise KeyboardInterrupt()
+
+    Path(multi_page_file).write_text(_multi_page_document(2))
+    monkeypatch.setattr(page_index.json, "dump", failing_dump)
+    with pytest.raises(KeyboardInterrupt):
+        AltoFile.open(multi_page_file, sidecar=True)
+    assert Path(index_filename).read_text() == content
+    assert [name for name in os.listdir(os.path.dirname(multi_page_file)) if name.endswith(".tmp")] == []
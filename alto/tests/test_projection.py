@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import mmap
+from pathlib import Path
+
+import pytest
+
+from alto import SP, Alto, String, iter_words, parse
+from alto.projection import _is_scannable, _parse_words, _scan_tags
+from alto.tests.test_streaming import _multi_page_document
+
+
+def test_parse_with_fields(real_life_example: str):
+    alto = Alto.parse(real_life_example)
+    projected = parse(real_life_example, fields=['content'])
+    assert projected.extract_words() == alto.extract_words()
+    assert projected.description == alto.description
+    assert [page.id for page in projected.layout.pages] == [page.id for page in alto.layout.pages]
+    children = [string for line in projected.extract_text_lines() for string in line.strings]
+    strings = [string for string in children if isinstance(string, String)]
+    assert strings and len(strings) == len(children)
+    assert {(string.hpos, string.confidence, string.id) for string in strings} == {(None, None, None)}
+
+    projected = parse(real_life_example, fields=['content', 'width', 'hpos', 'vpos'])
+    assert any(isinstance(string, SP) for line in projected.extract_text_lines() for string in line.strings)
+    assert [string.hpos for page in projected.layout.pages for string in page.extract_strings()] == [
+        string.hpos for page in alto.layout.pages for string in page.extract_strings()
+    ]
+
+
+@pytest.mark.parametrize("backend", ['etree', 'lxml'])
+def test_parse_with_level(data_dir: Path, backend: str):
+    filename = str(data_dir / "alto_example.xml")
+    alto = Alto.parse_file(filename)
+    projected = Alto.parse_file(filename, level='TextBlock', backend=backend)  # type: ignore
+    assert [block.id for block in projected.extract_text_blocks()] == [block.id for block in alto.extract_text_blocks()]
+    assert projected.extract_text_lines() == []
+    assert Alto.parse_file(filename, level='String', backend=backend) == alto  # type: ignore
+
+
+def test_projection_other_alto_versions(real_life_example: str):
+    document = real_life_example.replace("ns-v3#", "ns-v4#")
+    assert parse(document, fields=['content']) == parse(real_life_example, fields=['content'])
+
+
+def test_projection_checks_arguments(real_life_example: str, data_dir: Path):
+    with pytest.raises(ValueError, match="Expecting fields among"):
+        parse(real_life_example, fields=['text'])
+    with pytest.raises(NotImplementedError):
+        parse(real_life_example, level='Word')  # type: ignore
+    with pytest.raises(ValueError):
+        parse(real_life_example, fields=['content'], lazy=True)
+    with pytest.raises(ValueError):
+        Alto.parse_file(str(data_dir / "alto_example.xml"), level='TextLine', backend='expat')
+    document = _multi_page_document(1).replace('CONTENT="w0"', '')
+    with pytest.raises(ValueError, match='to have attribute CONTENT'):
+        parse(document, fields=['content'])
+    assert parse(document.replace('WC="0.92"', 'CONTENT="w0"'), fields=['content']).extract_words() == ['w0']
+
+
+def _write(tmp_path: Path, document: str, encoding: str = 'utf-8') -> str:
+    path = tmp_path / "document.xml"
+    path.write_bytes(document.encode(encoding))
+    return str(path)
+
+
+def test_iter_words(data_dir: Path, tmp_path: Path):
+    filename = str(data_dir / "alto_example.xml")
+    assert list(iter_words(filename)) == Alto.parse_file(filename).extract_words()
+    document = _multi_page_document(3)
+    assert list(iter_words(_write(tmp_path, document))) == ['w0', 'w1', 'w2']
+    prefixed = document.replace('<alto xmlns=', '<a:alto xmlns:a=').replace('<', '<a:').replace('<a:/', '</a:')
+    prefixed = prefixed.replace('<a:a:alto', '<a:alto')
+    assert list(iter_words(_write(tmp_path, prefixed))) == ['w0', 'w1', 'w2']
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ('<TextLine ', '<x:String xmlns:x="other" CONTENT="no"/><TextLine '),
+        ('<TextLine ', '<String xmlns="other" CONTENT="no"/><TextLine '),
+        ('<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#">', '<alto>'),
+    ],
+)
+def test_iter_words_other_namespaces(tmp_path: Path, old: str, new: str):
+    document = _multi_page_document(3).replace(old, new, 1)
+    assert document != _multi_page_document(3)
+    filename = _write(tmp_path, document)
+    with open(filename, "rb") as file_:
+        assert list(iter_words(filename)) == list(_parse_words(file_))
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            assert not _is_scannable(data)
+    with open(_write(tmp_path, _multi_page_document(3)), "rb") as file_:
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            assert _is_scannable(data)
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ('CONTENT="w1"', 'CONTENT="a &amp; b&#10;c\td&#x41;"'),
+        ('CONTENT="w1"', "CONTENT='l\"eau'"),
+        ('CONTENT="w1"', 'CONTENT="a>b"'),
+        ('ID="string_1"', 'ID="a>b"'),
+        ('<Layout>', '<Layout><!-- <String CONTENT="no"/> -->'),
+        ('WC="0.92" CONTENT="w1"', 'CONTENT="é" WC="0.92"'),
+    ],
+)
+def test_iter_words_matches_parse(tmp_path: Path, old: str, new: str):
+    document = _multi_page_document(3).replace(old, new)
+    assert document != _multi_page_document(3)
+    filename = _write(tmp_path, document)
+    words = list(iter_words(filename))
+    assert words == Alto.parse_file(filename).extract_words()
+    with open(filename, "rb") as file_:
+        data = file_.read()
+    if b"<!--" not in data:
+        assert list(_scan_tags(data, 0, len(data))) == words  # type: ignore
+
+
+def test_iter_words_other_encodings(tmp_path: Path):
+    document = '<?xml version="1.0" encoding="ISO-8859-1"?>' + _multi_page_document(2).replace('"w1"', '"é"')
+    assert list(iter_words(_write(tmp_path, document, 'latin-1'))) == ['w0', 'é']
+
+
+def test_iter_words_errors(tmp_path: Path):
+    with pytest.raises(ValueError, match='to have attribute CONTENT'):
+        list(iter_words(_write(tmp_path, _multi_page_document(2).replace('CONTENT="w1"', ''))))
+    with pytest.raises(ValueError, match='invalid reference'):
+        list(iter_words(_write(tmp_path, _multi_page_document(2).replace('"w1"', '"a & b"'))))
+    with pytest.raises(ValueError):
+        list(iter_words(_write(tmp_path, '')))
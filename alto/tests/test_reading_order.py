@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import random
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from alto import SP, Alto, ComposedBlock, Description, Layout, Page, PrintSpace, String, TextBlock, TextLine
+from alto.reading_order import page_reading_order, xy_cut
+
+_Box = Tuple[float, float, float, float]
+
+
+def _block(block_id: str, box: _Box, nb_lines: int, words_per_line: int) -> TextBlock:
+    hpos, vpos, width, height = box
+    line_height = height / nb_lines
+    word_width = width / words_per_line
+    lines = []
+    for i in range(nb_lines):
+        line_vpos = vpos + i * line_height
+        strings: List = []
+        for j in range(words_per_line):
+            word_id, word_hpos = f"{block_id}_{i}_{j}", hpos + j * word_width
+            strings.append(String(word_id, line_height * 0.8, word_width * 0.8, word_hpos, line_vpos, word_id, 1, []))
+            strings.append(SP(word_width * 0.2, word_hpos + word_width * 0.8, line_vpos))
+        lines.append(TextLine(f"{block_id}_{i}", line_height * 0.8, width, hpos, line_vpos, strings[:-1]))
+    return TextBlock(block_id, height, width, hpos, vpos, lines)
+
+
+def _page(blocks: List[TextBlock]) -> Page:
+    print_space = PrintSpace(3000, 2000, 0, 0, None, [ComposedBlock("cblock_0", 3000, 2000, 0, 0, blocks)])
+    return Page("page_0", 3000, 2000, 0, None, [print_space])
+
+
+def _two_column_page() -> Page:
+    blocks = [
+        _block("left_bottom", (100, 1600, 800, 1000), 10, 5),
+        _block("right_top", (1100, 400, 800, 1000), 10, 5),
+        _block("title", (100, 100, 1800, 200), 1, 3),
+        _block("right_bottom", (1100, 1600, 800, 1000), 10, 5),
+        _block("left_top", (100, 400, 800, 1000), 10, 5),
+    ]
+    for block in blocks:
+        random.Random(0).shuffle(block.text_lines)
+    return _page(blocks)
+
+
+def test_xy_cut_reads_columns_one_after_the_other():
+    boxes = np.array([[0, 0, 10, 1], [20, 0, 30, 1], [0, 2, 10, 3], [20, 2, 30, 3]], dtype=float)
+    assert xy_cut(boxes).tolist() == [0, 2, 1, 3]
+    assert xy_cut(np.empty((0, 4))).tolist() == []
+
+
+def test_xy_cut_regular_lines():
+    boxes = np.array([[0, y, 100, y + 8] for y in range(0, 10000, 10)], dtype=float)[::-1]
+    assert xy_cut(boxes).tolist() == list(range(999, -1, -1))
+
+
+def test_xy_cut_overlapping_boxes_are_read_top_to_bottom():
+    boxes = np.array([[0, 0, 10, 10], [5, 5, 15, 15], [-5, 2, 8, 12]], dtype=float)
+    assert xy_cut(boxes).tolist() == [0, 2, 1]
+
+
+def test_page_reading_order_two_columns():
+    page = _two_column_page()
+    expected_blocks = ["title", "left_top", "left_bottom", "right_top", "right_bottom"]
+    assert [block.id for block in page_reading_order(page, 'TextBlock')] == expected_blocks
+    lines = page_reading_order(page, 'TextLine')
+    assert [line.id for line in lines[:3]] == ["title_0", "left_top_0", "left_top_1"]
+    words = [string.content for string in page_reading_order(page)]
+    assert words[:5] == ["title_0_0", "title_0_1", "title_0_2", "left_top_0_0", "left_top_0_1"]
+    assert words == [word for line in lines for word in sorted(line.extract_words())]
+    with pytest.raises(NotImplementedError):
+        page_reading_order(page, 'Page')  # type: ignore
+
+
+def test_extract_words_geometric_order():
+    page = _two_column_page()
+    alto = Alto(Description(None), Layout([page, _page([_block("other", (0, 0, 100, 100), 1, 1)])]))
+    assert page.extract_words(order='geometric') == [string.content for string in page.reading_order()]
+    assert sorted(page.extract_words(order='geometric')) == sorted(page.extract_words())
+    assert page.reading_order() == page.reading_order() and page.reading_order() is not page.reading_order()
+    assert alto.extract_words('geometric') == page.extract_words('geometric') + ["other_0_0"]
+    with pytest.raises(NotImplementedError):
+        alto.extract_words('random')  # type: ignore
+
+
+def test_reading_order_of_large_pages():
+    # 2 columns of 50 blocks of 10 lines of 50 words
+    blocks = [
+        _block(f"block_{column}_{i}", (100 + 1000 * column, 100 + 110 * i, 900, 100), 10, 50)
+        for i in range(50)
+        for column in range(2)
+    ]
+    strings = _page(blocks).reading_order()
+    assert len(strings) == 50_000
+    assert strings[0].id == "block_0_0_0_0" and strings[25_000].id == "block_1_0_0_0"
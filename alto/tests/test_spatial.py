@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from alto import Alto, Page, PrintSpace
+from alto.spatial import GridIndex, _point_to_box_distance
+
+
+def _random_boxes(nb_boxes: int):
+    generator = random.Random(0)
+    boxes = []
+    for _ in range(nb_boxes):
+        x, y = generator.uniform(0, 1000), generator.uniform(0, 1500)
+        boxes.append((x, y, x + generator.uniform(0, 80), y + generator.uniform(0, 20)))
+    return boxes
+
+
+def test_grid_index_query_matches_linear_scan():
+    boxes = _random_boxes(500)
+    index = GridIndex(list(range(len(boxes))), boxes)
+    generator = random.Random(1)
+    for _ in range(50):
+        x0, y0 = generator.uniform(-100, 1000), generator.uniform(-100, 1500)
+        x1, y1 = x0 + generator.uniform(0, 400), y0 + generator.uniform(0, 400)
+        intersecting = [i for i, b in enumerate(boxes) if b[0] <= x1 and x0 <= b[2] and b[1] <= y1 and y0 <= b[3]]
+        contained = [i for i, b in enumerate(boxes) if x0 <= b[0] and b[2] <= x1 and y0 <= b[1] and b[3] <= y1]
+        assert index.query(x0, y0, x1, y1) == intersecting
+        assert index.query(x0, y0, x1, y1, contained=True) == contained
+
+
+def test_grid_index_nearest_matches_linear_scan():
+    boxes = _random_boxes(300)
+    index = GridIndex(list(range(len(boxes))), boxes)
+    generator = random.Random(2)
+    for _ in range(100):
+        x, y = generator.uniform(-500, 1500), generator.uniform(-500, 2000)
+        expected = min(range(len(boxes)), key=lambda i: (_point_to_box_distance(x, y, boxes[i]), i))
+        assert index.nearest(x, y) == expected
+
+
+def test_grid_index_unbounded_queries():
+    boxes = _random_boxes(100)
+    index = GridIndex(list(range(len(boxes))), boxes)
+    assert index.query(-math.inf, -math.inf, math.inf, math.inf) == list(range(len(boxes)))
+    assert index.query(0, 0, math.inf, math.inf, contained=True) == list(range(len(boxes)))
+    assert index.query(-math.inf, -math.inf, -1, -1) == []
+    assert index.query(math.nan, 0, 10, 10) == []
+    assert index.nearest(math.inf, 0) == 0  # all boxes are at an infinite distance
+    assert GridIndex([], []).query(-math.inf, -math.inf, math.inf, math.inf) == []
+
+
+def test_grid_index_empty():
+    index: GridIndex[int] = GridIndex([], [])
+    assert index.query(0, 0, 10, 10) == []
+    assert index.nearest(0, 0) is None
+    with pytest.raises(ValueError):
+        GridIndex([1], [])
+
+
+def test_page_query_region(data_dir: Path):
+    page = Alto.parse_file(str(data_dir / "alto_example.xml")).layout.pages[0]
+    strings = page.query_region(700, 40, 900, 90)
+    assert [string.content for string in strings] == ["7", "EJ", "."]
+    assert [string.content for string in page.query_region(700, 40, 900, 90, contained=True)] == ["7"]
+    assert [line.id for line in page.query_region(860, 70, 870, 80, level='TextLine')] == ["line_0", "line_1"]
+    assert [block.id for block in page.query_region(860, 70, 870, 80, level='TextBlock')] == ["block_0"]
+    assert page.query_region(-10, -10, -1, -1) == []
+
+
+def test_page_nearest(data_dir: Path):
+    page = Alto.parse_file(str(data_dir / "alto_example.xml")).layout.pages[0]
+    nearest = page.nearest(866, 80)
+    assert nearest is not None and nearest.content == "7"
+    assert page.nearest(0, 0, level='TextBlock') is not None
+    assert Page("page_0", 1, 1, 0, None, [PrintSpace(1, 1, 1, 1, None, [])]).nearest(0, 0) is None
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from alto import Alto, Page, parse, parse_file
+from alto.stats import ParseStats
+from alto.synthetic import DocumentShape, generate_alto
+
+_SHAPE = DocumentShape(
+    nb_pages=3,
+    composed_blocks_per_page=2,
+    text_blocks_per_composed_block=2,
+    lines_per_text_block=3,
+    words_per_line=4,
+    alternatives_rate=1.0,
+    sp_rate=1.0,
+)
+_COUNTS = {
+    "Page": 3,
+    "PrintSpace": 3,
+    "ComposedBlock": 6,
+    "TextBlock": 12,
+    "TextLine": 36,
+    "String": 144,
+    "SP": 108,
+    "ALTERNATIVE": 288,
+}
+
+
+@pytest.mark.parametrize("backend", ['etree', 'expat'])
+def test_parse_file_stats(tmp_path: Path, backend):
+    path = tmp_path / "synthetic.xml"
+    path.write_text(generate_alto(_SHAPE), encoding="utf-8")
+    pages: List[Page] = []
+    stats = ParseStats(trace_memory=True, on_page=pages.append)
+    alto = parse_file(str(path), backend=backend, stats=stats)
+    assert alto == Alto.parse_file(str(path))
+    assert pages == alto.layout.pages
+    assert stats.filename == str(path)
+    assert stats.bytes_read == path.stat().st_size
+    assert stats.element_counts == _COUNTS
+    assert stats.build_time > 0 and stats.total_time >= stats.build_time
+    assert (stats.tokenize_time > 0) == (backend == 'etree')
+    assert stats.peak_memory is not None and stats.peak_memory > 0
+    assert stats.to_dict()["element_counts"] == _COUNTS
+
+
+def test_parse_stats():
+    stats = ParseStats()
+    xml_str = generate_alto(_SHAPE)
+    assert parse(xml_str, stats=stats) == Alto.parse(xml_str)
+    assert stats.filename is None and stats.bytes_read == 0
+    assert stats.element_counts == _COUNTS
+    assert stats.peak_memory is None
+
+
+def test_on_page_order(data_dir: Path):
+    ids = []
+
+    def on_page(page: Page) -> None:
+        ids.append(page.id)
+
+    Alto.parse_file(str(data_dir / "alto_example.xml"), stats=ParseStats(on_page=on_page))
+    assert ids == ["page_0"]
+
+
+class _Stop(Exception):
+    pass
+
+
+@pytest.mark.parametrize("backend", ['etree', 'lxml', 'expat'])
+def test_on_page_is_called_while_parsing(backend):
+    ids = []
+
+    def on_page(page: Page) -> None:
+        ids.append(page.id)
+        if len(ids) == 2:
+            raise _Stop()
+
+    with pytest.raises(_Stop):
+        parse(generate_alto(_SHAPE), backend=backend, stats=ParseStats(on_page=on_page))
+    assert ids == ["page_0", "page_1"]
+
+
+def test_on_page_after_expat_fallback():
+    # the Alternative element with a child makes the expat builder fall back to an element tree after 2 pages
+    xml_str = generate_alto(_SHAPE)
+    index = xml_str.index("<ALTERNATIVE>", xml_str.index('ID="page_2"'))
+    xml_str = xml_str[:index] + "<ALTERNATIVE>x<Foo/>" + xml_str[index + len("<ALTERNATIVE>") :]
+    pages: List[Page] = []
+    alto = parse(xml_str, backend='expat', stats=ParseStats(on_page=pages.append))
+    assert pages == alto.layout.pages and len(pages) == 3
+
+
+def test_stats_are_not_lazy(data_dir: Path, tmp_path: Path):
+    filename = str(data_dir / "alto_example.xml")
+    with pytest.raises(ValueError):
+        parse_file(filename, lazy=True, stats=ParseStats())
+    with pytest.raises(ValueError):
+        parse_file(filename, cache_dir=str(tmp_path), stats=ParseStats())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+import pytest
+
+from alto import Alto, Description, iter_pages, iter_parse
+
+_PAGE = """
+<Page WIDTH="1654" HEIGHT="2339" PHYSICAL_IMG_NR="{nr}" ID="page_{nr}">
+    <PrintSpace HPOS="0" VPOS="0" WIDTH="1654" HEIGHT="2339">
+        <ComposedBlock ID="cblock_{nr}" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="53">
+            <TextBlock ID="block_{nr}" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="53">
+                <TextLine ID="line_{nr}" HPOS="712" VPOS="129" WIDTH="235" HEIGHT="21">
+                    <String ID="string_{nr}" HPOS="712" VPOS="133" WIDTH="55" HEIGHT="13" WC="0.92" CONTENT="w{nr}"/>
+                </TextLine>
+            </TextBlock>
+        </ComposedBlock>
+    </PrintSpace>
+</Page>
+"""
+
+
+def _multi_page_document(nb_pages: int) -> str:
+    pages = "".join(_PAGE.format(nr=nr) for nr in range(nb_pages))
+    return (
+        '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#">'
+        '<Description><sourceImageInformation><fileName>doc.png</fileName></sourceImageInformation></Description>'
+        f'<Layout>{pages}</Layout></alto>'
+    )
+
+
+def test_iter_pages_matches_parse_file(data_dir: Path):
+    filename = str(data_dir / "alto_example.xml")
+    assert list(iter_pages(filename)) == Alto.parse_file(filename).layout.pages
+
+
+def test_iter_parse(multi_page_file: str):
+    description, pages = iter_parse(multi_page_file)
+    assert description == Description("doc.png")
+    first_page = next(pages)
+    assert first_page.id == "page_0"
+    assert first_page.extract_words() == ["w0"]
+    assert [page.id for page in pages] == ["page_1", "page_2", "page_3", "page_4"]
+
+
+def test_iter_parse_matches_parse_file(multi_page_file: str):
+    alto = Alto.parse_file(multi_page_file)
+    description, pages = Alto.iter_parse(multi_page_file)
+    assert description == alto.description
+    assert list(pages) == alto.layout.pages
+
+
+def test_iter_parse_requires_description(tmp_path: Path):
+    path = tmp_path / "no_description.xml"
+    path.write_text('<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#"><Layout></Layout></alto>')
+    with pytest.raises(ValueError):
+        iter_parse(str(path))
+
+
+@pytest.mark.parametrize("backend", ['etree', 'lxml'])
+def test_iter_parse_other_alto_versions(tmp_path: Path, backend: str):
+    path = tmp_path / "v4.xml"
+    path.write_text(_multi_page_document(3).replace("ns-v3#", "ns-v4#"))
+    description, pages = iter_parse(str(path), backend)  # type: ignore
+    assert description == Description("doc.png")
+    assert [page.id for page in pages] == ["page_0", "page_1", "page_2"]
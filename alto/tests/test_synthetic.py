@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+from alto import SP, Alto, String
+from alto.synthetic import DocumentShape, generate_alto, write_alto
+
+
+def test_generate_alto_is_deterministic():
+    shape = DocumentShape(nb_pages=2, alternatives_rate=0.5, sp_rate=0.5)
+    assert generate_alto(shape, seed=1) == generate_alto(shape, seed=1)
+    assert generate_alto(shape, seed=1) != generate_alto(shape, seed=2)
+
+
+def test_generate_alto_shape():
+    shape = DocumentShape(
+        nb_pages=2,
+        composed_blocks_per_page=3,
+        text_blocks_per_composed_block=2,
+        lines_per_text_block=4,
+        words_per_line=5,
+        alternatives_rate=1.0,
+        sp_rate=0.0,
+    )
+    alto = Alto.parse(generate_alto(shape))
+    assert len(alto.layout.pages) == 2
+    assert len(alto.extract_composed_blocks()) == 6
+    assert len(alto.extract_text_blocks()) == 12
+    assert len(alto.extract_text_lines()) == 48
+    assert len(alto.extract_words()) == shape.nb_words == 240
+    strings = [string for line in alto.extract_text_lines() for string in line.strings]
+    assert all(isinstance(string, String) and len(string.alternatives) == 2 for string in strings)
+
+
+def test_generate_alto_sp_rate():
+    alto = Alto.parse(generate_alto(DocumentShape(words_per_line=4, sp_rate=1.0)))
+    for line in alto.extract_text_lines():
+        assert [type(string) for string in line.strings] == [String, SP, String, SP, String, SP, String]
+
+
+def test_write_alto(tmp_path: Path):
+    shape = DocumentShape(nb_pages=3)
+    path = tmp_path / "synthetic.xml"
+    write_alto(str(path), shape, seed=4)
+    assert path.read_text(encoding="utf-8") == generate_alto(shape, seed=4)
+    assert Alto.parse_file(str(path)).description.file_name == "synthetic_4.png"
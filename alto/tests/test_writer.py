@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import io
+from pathlib import Path
+from xml.etree import ElementTree
+
+from alto import SP, Alternative, Alto, Page, String
+from alto.synthetic import DocumentShape, generate_alto
+
+
+def _round_trip(alto: Alto) -> Alto:
+    file_ = io.StringIO()
+    alto.write(file_)
+    return Alto.parse(file_.getvalue())
+
+
+def test_write_round_trip(data_dir: Path, tmp_path: Path):
+    alto = Alto.parse_file(str(data_dir / "alto_example.xml"))
+    path = tmp_path / "written.xml"
+    alto.write(path)
+    assert Alto.parse_file(str(path)) == alto
+    assert _round_trip(alto) == alto
+
+
+def test_write_synthetic_round_trip():
+    alto = Alto.parse(generate_alto(DocumentShape(nb_pages=3, alternatives_rate=0.5, sp_rate=0.5)))
+    assert _round_trip(alto) == alto
+
+
+def test_write_special_values(real_life_example: str):
+    alto = Alto.parse(real_life_example)
+    alto.description.file_name = "scan <1> & 2.png"
+    page = alto.layout.pages[0]
+    page.printed_img_nr = 3
+    page.print_spaces[0].pc = 0.5
+    line = page.extract_lines()[0]
+    line.hpos = 12.25
+    line.strings = [
+        String("s1", 10.0, 20.0, 1.5, 2.0, 'a "quoted"\tword\n', 0.92, [Alternative("x < y\r")]),
+        SP(9.0, 11.5, 2.0),
+    ]
+    assert _round_trip(alto) == alto
+
+
+def test_write_omits_none_attributes(real_life_example: str):
+    file_ = io.StringIO()
+    Alto.parse(real_life_example).write(file_)
+    xml_str = file_.getvalue()
+    assert ' PC=' not in xml_str and ' PRINTED_IMG_NR=' not in xml_str
+    assert '<TextLine ID="line_0" HEIGHT="10" WIDTH="7" HPOS="863" VPOS="75">' in xml_str
+
+
+def test_page_write_xml(real_life_example: str):
+    page = Alto.parse(real_life_example).layout.pages[0]
+    file_ = io.StringIO()
+    page.write_xml(file_)
+    assert Page.from_xml(ElementTree.fromstring(file_.getvalue())) == page
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""Serialization of alto objects to alto v3 xml, written to a file as the tree is traversed."""
+
+import os
+from typing import IO, Any, Dict, List, Tuple, Type, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from alto import _NODE_SPECS, Alto, Description, Page, String, TextLine, _Namespace
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[str]]
+
+_NAMESPACE = _Namespace[1:-1]
+# Carriage returns in text are normalized to line feeds by xml parsers, unless escaped.
+_TEXT_ENTITIES = {"\r": "&#13;"}
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}", 1)[1]
+
+
+def _node_formats() -> Dict[Type, Tuple[str, Tuple[Tuple[str, str], ...]]]:
+    return {
+        spec.cls: (_local_name(spec.tag), tuple((field.name, field.attr) for field in spec.fields))
+        for spec in _NODE_SPECS
+    }
+
+
+_FORMATS = _node_formats()
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, str):
+        return quoteattr(value)  # also escapes tabs and line feeds, which attribute normalization would replace
+    if isinstance(value, float) and value.is_integer():
+        return f'"{int(value)}"'
+    return f'"{value!r}"'
+
+
+def _start_tag(node: Any, extra: str = "") -> str:
+    name, fields = _FORMATS[type(node)]
+    attributes = "".join(
+        f" {attr}={_format_value(value)}"
+        for field, attr in fields
+        for value in (getattr(node, field),)
+        if value is not None
+    )
+    return f"<{name}{extra}{attributes}"
+
+
+def _line_xml(line: TextLine) -> str:
+    parts: List[str] = [_start_tag(line), ">"]
+    for string in line.strings:
+        parts.append(_start_tag(string))
+        if isinstance(string, String) and string.alternatives:
+            parts.append(">")
+            for alternative in string.alternatives:
+                parts.append(f"<ALTERNATIVE>{escape(alternative.content, _TEXT_ENTITIES)}</ALTERNATIVE>")
+            parts.append("</String>")
+        else:
+            parts.append("/>")
+    parts.append("</TextLine>\n")
+    return "".join(parts)
+
+
+def write_page(page: Page, file_: IO[str], standalone: bool = True) -> None:
+    """
+    Writes a Page element, one text line at a time.
+
+    Parameters
+    ----------
+    page: Page
+        page to write
+    file_: IO[str]
+        text file to write to
+    standalone: bool
+        if True, the alto namespace is declared on the Page element, so that it can be parsed on its own
+    """
+    file_.write(_start_tag(page, f' xmlns="{_NAMESPACE}"' if standalone else "") + ">\n")
+    for print_space in page.print_spaces:
+        file_.write(_start_tag(print_space) + ">\n")
+        for composed_block in print_space.composed_blocks:
+            file_.write(_start_tag(composed_block) + ">\n")
+            for text_block in composed_block.text_blocks:
+                file_.write(_start_tag(text_block) + ">\n")
+                for line in text_block.text_lines:
+                    file_.write(_line_xml(line))
+                file_.write("</TextBlock>\n")
+            file_.write("</ComposedBlock>\n")
+        file_.write("</PrintSpace>\n")
+    file_.write("</Page>\n")
+
+
+def _description_xml(description: Description) -> str:
+    file_name = escape(description.file_name, _TEXT_ENTITIES) if description.file_name is not None else ""
+    return (
+        "<Description><sourceImageInformation>"
+        f"<fileName>{file_name}</fileName>"
+        "</sourceImageInformation></Description>\n"
+    )
+
+
+def _write_alto(alto: Alto, file_: IO[str]) -> None:
+    file_.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file_.write(f'<alto xmlns="{_NAMESPACE}">\n')
+    file_.write(_description_xml(alto.description))
+    file_.write("<Layout>\n")
+    for page in alto.layout.pages:
+        write_page(page, file_, standalone=False)
+    file_.write("</Layout>\n</alto>\n")
+
+
+def write_alto(alto: Alto, path_or_file: PathOrFile) -> None:
+    """
+    Writes an alto document as alto v3 xml.
+
+    Elements are written as the tree is traversed, so that no xml representation of the document is
+    built in memory. Parsing the output gives back an equal document, except for an empty file name in
+    the description, which is read as None. Attributes that are None are omitted, and floats with integer
+    values are written as integers.
+
+    Parameters
+    ----------
+    alto: Alto
+        document to write
+    path_or_file: Union[str, os.PathLike, IO[str]]
+        filename of the file to write, or text file to write to
+    """
+    if isinstance(path_or_file, (str, os.PathLike)):
+        with open(path_or_file, "w", encoding="utf-8") as file_:
+            _write_alto(alto, file_)
+    else:
+        _write_alto(alto, path_or_file)
@@ -23,6 +23,9 @@ test_requirements = [
     "pytest-mypy>=0.8.0",
     "isort>=5.7.0",
     "mypy>=0.800",
+    "numpy>=1.17",
+    "lxml>=4.6",
+    "pyarrow>=1.0",
 ]
 
 dev_requirements = [
@@ -42,12 +45,22 @@ dev_requirements = [
 
 requirements = ['typing-extensions>=3.10.0.0']
 
+numpy_requirements = ["numpy>=1.17"]
+lxml_requirements = ["lxml>=4.6"]
+arrow_requirements = ["pyarrow>=1.0"]
+
 extra_requirements = {
+    "numpy": numpy_requirements,
+    "lxml": lxml_requirements,
+    "arrow": arrow_requirements,
     "setup": setup_requirements,
     "test": test_requirements,
     "dev": dev_requirements,
     "all": [
         *requirements,
+        *numpy_requirements,
+        *lxml_requirements,
+        *arrow_requirements,
         *dev_requirements,
     ],
 }